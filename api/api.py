@@ -1,14 +1,20 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 import logging
 import os
 import json
+import threading
+import time
 from datetime import datetime
 
-from ..modules.skills_analyzer import SkillsAnalyzer
-from ..modules.market_trends import MarketTrends
-from ..modules.career_path import CareerPathGenerator
-from ..modules.career_simulator import CareerSimulator
+# Moduły analityczne (spaCy, scikit-learn, networkx, pandas) są importowane w load_components(),
+# dzięki czemu import aplikacji (np. przez serwer przed rozwidleniem) nie ładuje ich z góry
+from ..modules.chart_renderer import ChartRenderer
+from ..modules.response_cache import ResponseCache
+from ..modules.job_queue import JobQueue
+from ..modules.metrics import REGISTRY as metrics, stage_timer
+from ..modules.micro_batcher import MicroBatcher
 from ..config.config import API_CONFIG, DATABASE_CONFIG
+from .serialization import FastJSONProvider, negotiate_stream, stream_records
 
 # Konfiguracja logowania
 logging.basicConfig(
@@ -21,48 +27,345 @@ logger = logging.getLogger(__name__)
 # Inicjalizacja aplikacji Flask
 app = Flask(__name__)
 app.config['SECRET_KEY'] = API_CONFIG['secret_key']
+# Koder JSON obsługujący typy numpy/pandas (orjson, jeśli jest zainstalowany)
+app.json = FastJSONProvider(app)
 
-# Inicjalizacja komponentów
-skills_analyzer = SkillsAnalyzer(skills_database_path='data/skills_database.csv')
-market_trends = MarketTrends(data_path='data/job_market_data.csv')
-career_path_generator = CareerPathGenerator(
-    skills_database_path='data/skills_database.csv',
-    roles_database_path='data/roles_database.csv'
-)
-career_simulator = CareerSimulator(
-    skills_analyzer=skills_analyzer,
-    market_trends=market_trends,
-    career_path_generator=career_path_generator
+# Komponenty ładowane raz na proces przez load_components() (w trybie produkcyjnym
+# w procesie nadrzędnym serwera, przed rozwidleniem procesów roboczych)
+skills_analyzer = None
+market_trends = None
+career_path_generator = None
+career_simulator = None
+chart_renderer = ChartRenderer()
+
+# Pamięć podręczna odpowiedzi idempotentnych punktów końcowych (market-trends, career-path, recommend-skills)
+response_cache = ResponseCache(
+    max_entries=API_CONFIG['cache_entries'],
+    ttl=API_CONFIG['cache_ttl'],
+    shared_dir=API_CONFIG['cache_dir'] or None
 )
 
-@app.route('/api/analyze-cv', methods=['POST'])
-def analyze_cv():
+# Pliki danych wczytywane przez komponenty (ich sygnatura wchodzi do wersji danych)
+DATA_FILES = ('data/skills_database.csv', 'data/roles_database.csv', 'data/job_market_data.csv')
+_data_signature = None
+
+# Ścieżki (/api/...) dostępne przed zakończeniem rozgrzewania
+HEALTH_PATHS = ('/api/health', '/api/health/ready', '/api/metrics')
+
+_started = time.time()
+
+_ready = threading.Event()
+_load_lock = threading.Lock()
+
+# Kolejka zadań w tle - tworzona przy pierwszym użyciu w każdym procesie (wątki nie przetrwają rozwidlenia)
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+# Partie żądań analizy CV - tworzone przy pierwszym użyciu w każdym procesie (jak kolejka zadań)
+_cv_batcher = None
+_cv_batcher_lock = threading.Lock()
+
+# Metryki żądań (wspólne dla aplikacji Flask i asynchronicznej)
+metrics.describe('api_requests_total', 'counter', 'Liczba obsłużonych żądań')
+metrics.describe('api_request_duration_seconds', 'histogram', 'Czas obsługi żądań (s)')
+metrics.describe('api_requests_in_flight', 'gauge', 'Liczba żądań w trakcie obsługi')
+
+def _cache_metrics():
+    """Trafienia pamięci podręcznych odpowiedzi i wykresów (odczytywane przy eksporcie metryk)"""
+    for name, cache in (('response', response_cache), ('chart', chart_renderer)):
+        total = cache.hits + cache.misses
+        labels = {'cache': name}
+        yield 'api_cache_hits_total', 'counter', 'Trafienia pamięci podręcznej', labels, cache.hits
+        yield 'api_cache_misses_total', 'counter', 'Chybienia pamięci podręcznej', labels, cache.misses
+        yield 'api_cache_hit_ratio', 'gauge', 'Odsetek trafień pamięci podręcznej', labels, cache.hits / total if total else 0.0
+
+metrics.register_collector(_cache_metrics)
+
+def load_components(warm_up=True):
+    """
+    Ładuje katalogi umiejętności i ról, graf kariery, dane rynkowe i model NLP
+    
+    Wywołanie jest idempotentne - kolejne wywołania (również z innych wątków)
+    nie ładują komponentów ponownie. Po zakończeniu API zaczyna przyjmować żądania.
+    
+    Args:
+        warm_up: Czy wykonać zapytania rozgrzewające (pierwsze przejście potoku NLP,
+            rankingi trendów rynkowych w pamięci podręcznej)
+    """
+    global skills_analyzer, market_trends, career_path_generator, career_simulator, _data_signature
+    
+    with _load_lock:
+        if _ready.is_set():
+            return
+        
+        logger.info("Ładowanie komponentów API...")
+        with stage_timer('load_components'):
+            from ..modules.skills_analyzer import SkillsAnalyzer
+            from ..modules.market_trends import MarketTrends
+            from ..modules.career_path import CareerPathGenerator
+            from ..modules.career_simulator import CareerSimulator
+            
+            _data_signature = [
+                (path, os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in DATA_FILES if os.path.exists(path)
+            ]
+            skills_analyzer = SkillsAnalyzer(skills_database_path='data/skills_database.csv')
+            market_trends = MarketTrends(data_path='data/job_market_data.csv')
+            career_path_generator = CareerPathGenerator(
+                skills_database_path='data/skills_database.csv',
+                roles_database_path='data/roles_database.csv'
+            )
+            career_simulator = CareerSimulator(
+                skills_analyzer=skills_analyzer,
+                market_trends=market_trends,
+                career_path_generator=career_path_generator
+            )
+            
+            if warm_up:
+                try:
+                    skills_analyzer.extract_skills_from_cv("Python SQL")
+                    market_trends.get_top_emerging_skills(10)
+                    market_trends.get_high_paying_skills(10)
+                except Exception as e:
+                    logger.warning(f"Błąd podczas rozgrzewania komponentów API: {e}")
+        
+        _ready.set()
+        logger.info("Komponenty API gotowe")
+
+def create_app(preload=True):
+    """
+    Fabryka aplikacji WSGI
+    
+    Args:
+        preload: Czy załadować komponenty przed zwróceniem aplikacji. Przy False
+            komponenty ładuje wątek w tle, a do tego czasu punkty końcowe /api/*
+            (poza /api/health*) zwracają 503.
+            
+    Returns:
+        Aplikacja Flask
+    """
+    if preload:
+        load_components()
+    elif not _ready.is_set():
+        threading.Thread(target=load_components, name='api-warm-up', daemon=True).start()
+    return app
+
+def data_version():
+    """
+    Zwraca wersję danych, z których liczone są odpowiedzi
+    
+    Wersja jest taka sama we wszystkich procesach roboczych z tymi samymi plikami
+    danych i zmienia się po dopisaniu danych rynkowych.
+    """
+    return [_data_signature, None if market_trends is None else market_trends._data_version]
+
+def cached_entry_response(response_class, entry, if_none_match):
+    """
+    Buduje odpowiedź z zbuforowanego wpisu (304, gdy klient ma aktualną wersję)
+    
+    Args:
+        response_class: Klasa odpowiedzi (Flask lub Quart)
+        entry: CachedResponse
+        if_none_match: Nagłówek If-None-Match żądania (ETags)
+        
+    Returns:
+        Odpowiedź z nagłówkami ETag i Cache-Control
+    """
+    max_age = max(0, int(response_cache.ttl - (time.time() - entry.created)))
+    headers = {'ETag': f'"{entry.etag}"', 'Cache-Control': f'private, max-age={max_age}'}
+    if if_none_match and if_none_match.contains_weak(entry.etag):
+        return response_class(b'', status=304, headers=headers)
+    return response_class(entry.body, status=200, headers=headers, mimetype='application/json')
+
+def cached_json_response(endpoint, body, compute):
+    """
+    Zwraca odpowiedź JSON z pamięci podręcznej lub oblicza ją i zapisuje
+    
+    Zapisywane są tylko odpowiedzi z kodem 200.
+    
+    Args:
+        endpoint: Nazwa punktu końcowego
+        body: Treść żądania (część klucza)
+        compute: Funkcja bez argumentów zwracająca (odpowiedź, kod HTTP)
+    """
+    key = response_cache.key(endpoint, body, data_version())
+    entry = response_cache.get(key)
+    if entry is None:
+        payload, status = compute()
+        if status != 200:
+            return jsonify(payload), status
+        entry = response_cache.put(key, app.json.dumps(payload).encode('utf-8'))
+    return cached_entry_response(Response, entry, request.if_none_match)
+
+def stream_body(records, mimetype):
+    """
+    Serializuje rekordy do strumienia NDJSON / JSON-seq
+    
+    Błąd w trakcie generowania rekordów (nagłówki i kod 200 są już wysłane) jest
+    zapisywany jako ostatni rekord {"error": ...}.
+    
+    Args:
+        records: Iterowalny zbiór rekordów
+        mimetype: Typ MIME strumienia
+        
+    Returns:
+        Generator bajtów odpowiedzi
+    """
+    def guarded():
+        try:
+            yield from records
+        except Exception as e:
+            logger.error(f"Błąd podczas generowania odpowiedzi strumieniowej: {e}")
+            yield {'error': str(e)}
+    
+    return stream_records(guarded(), mimetype)
+
+def streamed_json_response(mimetype, records_func, body):
+    """
+    Zwraca odpowiedź strumieniową (rekordy wysyłane w miarę ich obliczania, bez pamięci podręcznej)
+    
+    Args:
+        mimetype: Typ MIME strumienia (application/x-ndjson lub application/json-seq)
+        records_func: Funkcja treści żądania -> (generator rekordów lub słownik z błędem, kod HTTP)
+        body: Treść żądania
+    """
+    records, status = records_func(body)
+    if status != 200:
+        return jsonify(records), status
+    return Response(stream_with_context(stream_body(records, mimetype)), mimetype=mimetype)
+
+def collect_records(records_func, body):
+    """
+    Zbiera rekordy w listę (wariant asynchroniczny - wynik wraca z puli procesów)
+    
+    Returns:
+        Krotka (lista rekordów lub słownik z błędem, kod HTTP)
+    """
+    records, status = records_func(body)
+    if status != 200:
+        return records, status
+    try:
+        return list(records), 200
+    except Exception as e:
+        logger.error(f"Błąd podczas generowania rekordów: {e}")
+        return {'error': str(e)}, 500
+
+def request_started(route):
+    """
+    Rejestruje rozpoczęcie obsługi żądania
+    
+    Args:
+        route: Wzorzec ścieżki (np. /api/jobs/<job_id>) - ogranicza liczbę serii metryk
+        
+    Returns:
+        Czas rozpoczęcia (perf_counter)
+    """
+    metrics.inc('api_requests_in_flight', 1, {'route': route})
+    return time.perf_counter()
+
+def request_finished(route, method, status, started):
+    """Rejestruje zakończenie obsługi żądania (licznik, czas, żądania w toku)"""
+    metrics.inc('api_requests_in_flight', -1, {'route': route})
+    metrics.inc('api_requests_total', 1, {'route': route, 'method': method, 'status': status})
+    metrics.observe('api_request_duration_seconds', time.perf_counter() - started, {'route': route, 'method': method})
+
+def metrics_response():
+    """Zwraca metryki procesu w formacie tekstowym Prometheus"""
+    return metrics.render({'pid': os.getpid()})
+
+# Pomiar żądań rejestrowany przed bramką gotowości, aby obejmował również odpowiedzi 503
+@app.before_request
+def start_request_metrics():
+    """Zapamiętuje początek obsługi żądania"""
+    g.metrics_route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+    g.metrics_started = request_started(g.metrics_route)
+
+@app.after_request
+def record_request_metrics(response):
+    """Zapisuje metryki obsłużonego żądania (odpowiedzi strumieniowe - do wysłania nagłówków)"""
+    started = g.pop('metrics_started', None)
+    if started is not None:
+        request_finished(g.metrics_route, request.method, response.status_code, started)
+    return response
+
+@app.before_request
+def readiness_gate():
+    """Odrzuca żądania przed zakończeniem ładowania komponentów"""
+    if not _ready.is_set() and request.path not in HEALTH_PATHS:
+        response = jsonify({'error': 'Service is warming up'})
+        response.status_code = 503
+        response.headers['Retry-After'] = '5'
+        return response
+
+# Logika punktów końcowych jako funkcje treści żądania -> (odpowiedź, kod HTTP), wspólne dla
+# aplikacji Flask i asynchronicznej (api/async_api.py, gdzie działają w puli procesów)
+
+def analyze_cv_response(body):
     """Analizuje CV i zwraca zidentyfikowane umiejętności i poziomy"""
-    if not request.json or 'cv_text' not in request.json or not isinstance(request.json['cv_text'], str):
-        return jsonify({'error': 'Missing or invalid parameter: cv_text (string required)'}), 400
+    return analyze_cv_batch_response([body])[0]
+
+def analyze_cv_batch_response(bodies):
+    """
+    Analizuje partię CV (jedno przejście potoku NLP i wyszukiwania umiejętności dla całej partii)
+    
+    Args:
+        bodies: Lista treści żądań /api/analyze-cv
+        
+    Returns:
+        Lista krotek (odpowiedź, kod HTTP) w kolejności bodies
+    """
+    responses = [None] * len(bodies)
+    valid = []
+    for i, body in enumerate(bodies):
+        if not body or 'cv_text' not in body or not isinstance(body['cv_text'], str):
+            responses[i] = {'error': 'Missing or invalid parameter: cv_text (string required)'}, 400
+        else:
+            valid.append(i)
+    
+    if not valid:
+        return responses
     
-    cv_text = request.json['cv_text']
+    cv_texts = [bodies[i]['cv_text'] for i in valid]
     
     try:
         # Ekstrakcja umiejętności
-        skills = skills_analyzer.extract_skills_from_cv(cv_text)
+        batch_skills = skills_analyzer.extract_skills_batch(cv_texts)
         
-        # Analiza poziomów umiejętności
-        skill_levels = {}
-        for skill in skills:
-            level = skills_analyzer.analyze_skill_level(cv_text, skill)
-            skill_levels[skill] = level
-        
-        return jsonify({
-            'status': 'success',
-            'skills': [{'name': skill, 'level': level} for skill, level in skill_levels.items()]
-        })
+        for i, cv_text, skills in zip(valid, cv_texts, batch_skills):
+            # Analiza poziomów umiejętności
+            skill_levels = {}
+            for skill in skills:
+                level = skills_analyzer.analyze_skill_level(cv_text, skill)
+                skill_levels[skill] = level
+            
+            responses[i] = {
+                'status': 'success',
+                'skills': [{'name': skill, 'level': level} for skill, level in skill_levels.items()]
+            }, 200
     except Exception as e:
         logger.error(f"Błąd podczas analizy CV: {e}")
-        return jsonify({'error': str(e)}), 500
+        for i in valid:
+            responses[i] = {'error': str(e)}, 500
+    
+    return responses
 
-@app.route('/api/market-trends', methods=['GET'])
-def get_market_trends():
+def get_cv_batcher():
+    """Zwraca obiekt łączący żądania analizy CV w partie (None, gdy łączenie jest wyłączone)"""
+    global _cv_batcher
+    
+    if API_CONFIG['batch_max_size'] <= 1:
+        return None
+    
+    with _cv_batcher_lock:
+        if _cv_batcher is None or _cv_batcher.pid != os.getpid():
+            _cv_batcher = MicroBatcher(
+                analyze_cv_batch_response,
+                max_batch_size=API_CONFIG['batch_max_size'],
+                max_wait=API_CONFIG['batch_max_wait_ms'] / 1000,
+                name='analyze-cv'
+            )
+        return _cv_batcher
+
+def market_trends_response():
     """Zwraca aktualne trendy rynkowe"""
     try:
         # Pobierz najważniejsze trendy
@@ -73,31 +376,31 @@ def get_market_trends():
         else:
             top_skills_list = [dict(zip(['skill', 'growth', 'demand', 'trend'], row)) for row in top_skills]
         
-        return jsonify({
+        return {
             'status': 'success',
             'top_emerging_skills': top_skills_list,
+            'high_paying_skills': market_trends.get_high_paying_skills(10),
             'timestamp': datetime.now().isoformat()
-        })
+        }, 200
     except Exception as e:
         logger.error(f"Błąd podczas pobierania trendów rynkowych: {e}")
-        return jsonify({'error': str(e)}), 500
+        return {'error': str(e)}, 500
 
-@app.route('/api/career-path', methods=['POST'])
-def generate_career_path():
+def career_path_response(body):
     """Generuje ścieżkę kariery na podstawie aktualnej i docelowej roli"""
-    if not request.json or 'current_role_id' not in request.json or not isinstance(request.json['current_role_id'], (str, int)):
-        return jsonify({'error': 'Missing or invalid parameter: current_role_id (string or int required)'}), 400
+    if not body or 'current_role_id' not in body or not isinstance(body['current_role_id'], (str, int)):
+        return {'error': 'Missing or invalid parameter: current_role_id (string or int required)'}, 400
     
-    current_role_id = request.json['current_role_id']
-    target_role_id = request.json.get('target_role_id', None)
-    max_steps = request.json.get('max_steps', 5)
+    current_role_id = body['current_role_id']
+    target_role_id = body.get('target_role_id', None)
+    max_steps = body.get('max_steps', 5)
     
     try:
         career_path = career_path_generator.generate_career_path(
             current_role_id, target_role_id, max_steps=max_steps
         )
         
-        return jsonify({
+        return {
             'status': 'success',
             'career_path': [
                 {
@@ -109,20 +412,19 @@ def generate_career_path():
                 }
                 for role in career_path
             ]
-        })
+        }, 200
     except Exception as e:
         logger.error(f"Błąd podczas generowania ścieżki kariery: {e}")
-        return jsonify({'error': str(e)}), 500
+        return {'error': str(e)}, 500
 
-@app.route('/api/career-simulation', methods=['POST'])
-def simulate_career():
+def career_simulation_response(body):
     """Symuluje przyszłą karierę na podstawie profilu użytkownika"""
-    if not request.json or 'user_profile' not in request.json or not isinstance(request.json['user_profile'], dict):
-        return jsonify({'error': 'Missing or invalid parameter: user_profile (dict required)'}), 400
+    if not body or 'user_profile' not in body or not isinstance(body['user_profile'], dict):
+        return {'error': 'Missing or invalid parameter: user_profile (dict required)'}, 400
     
-    user_profile = request.json['user_profile']
-    target_role = request.json.get('target_role', None)
-    years = request.json.get('years', 5)
+    user_profile = body['user_profile']
+    target_role = body.get('target_role', None)
+    years = body.get('years', 5)
     
     try:
         simulation = career_simulator.simulate_career_progression(
@@ -132,7 +434,7 @@ def simulate_career():
         # Wybierz punkty co roku dla czytelności
         key_points = simulation[simulation['date'].dt.month % 12 == 0]
         
-        return jsonify({
+        return {
             'status': 'success',
             'simulation': {
                 'salary_projection': key_points[['date', 'salary']].to_dict('records'),
@@ -140,59 +442,344 @@ def simulate_career():
                 'promotion_chances': key_points[['date', 'promotion_chance']].to_dict('records'),
                 'promotions': simulation[simulation.get('event', '') == 'Awans zawodowy'][['date', 'role']].to_dict('records')
             }
-        })
+        }, 200
     except Exception as e:
         logger.error(f"Błąd podczas symulacji kariery: {e}")
-        return jsonify({'error': str(e)}), 500
+        return {'error': str(e)}, 500
 
-@app.route('/api/recommend-skills', methods=['POST'])
-def recommend_skills():
+def career_simulation_records(body):
+    """
+    Symuluje karierę punkt po punkcie (wszystkie kwartały, do odpowiedzi strumieniowej)
+    
+    Returns:
+        Krotka (generator punktów symulacji lub słownik z błędem, kod HTTP)
+    """
+    if not body or 'user_profile' not in body or not isinstance(body['user_profile'], dict):
+        return {'error': 'Missing or invalid parameter: user_profile (dict required)'}, 400
+    
+    return career_simulator.iter_career_progression(
+        body['user_profile'], body.get('target_role', None), years=body.get('years', 5)
+    ), 200
+
+def career_simulation_chart_response(body):
+    """
+    Zwraca wykres symulacji kariery (PNG/SVG) z pamięci podręcznej wykresów
+    
+    Returns:
+        Krotka (obraz w bajtach lub słownik z błędem, kod HTTP, nagłówki)
+    """
+    if not body or 'user_profile' not in body or not isinstance(body['user_profile'], dict):
+        return {'error': 'Missing or invalid parameter: user_profile (dict required)'}, 400, {}
+    
+    user_profile = body['user_profile']
+    target_role = body.get('target_role', None)
+    years = body.get('years', 5)
+    fmt = body.get('format', 'png')
+    
+    if fmt not in ChartRenderer.MIME_TYPES:
+        return {'error': 'Invalid parameter: format (png or svg required)'}, 400, {}
+    
+    try:
+        # Klucz z danych wejściowych, wersji danych i dnia startu symulacji (daty na osi);
+        # symulacja jest losowana z ziarna z klucza, więc wykres jest funkcją tego, co zahaszowano
+        key = ChartRenderer.data_key([user_profile, target_role, years, data_version(),
+                                      datetime.now().strftime("%Y-%m-%d")])
+        seed = int(key[:8], 16)
+        image = chart_renderer.render(
+            lambda: career_simulator.visualize_career_simulation(
+                career_simulator.simulate_career_progression(user_profile, target_role, years=years, seed=seed)
+            ),
+            f"simulation-request:{key}",
+            fmt
+        )
+        
+        if image is None:
+            return {'error': 'No simulation data to render'}, 500, {}
+        
+        return image, 200, {'Content-Type': ChartRenderer.MIME_TYPES[fmt], 'ETag': f'"{key}"'}
+    except Exception as e:
+        logger.error(f"Błąd podczas generowania wykresu symulacji: {e}")
+        return {'error': str(e)}, 500, {}
+
+def recommend_skills_response(body):
     """Rekomenduje umiejętności do zdobycia dla osiągnięcia docelowej roli"""
-    if not request.json or 'current_skills' not in request.json or 'target_role_id' not in request.json or not isinstance(request.json['current_skills'], list):
-        return jsonify({'error': 'Missing or invalid parameters: current_skills (list) and target_role_id required'}), 400
+    if not body or 'current_skills' not in body or 'target_role_id' not in body or not isinstance(body['current_skills'], list):
+        return {'error': 'Missing or invalid parameters: current_skills (list) and target_role_id required'}, 400
     
-    current_skills = request.json['current_skills']
-    target_role_id = request.json['target_role_id']
+    current_skills = body['current_skills']
+    target_role_id = body['target_role_id']
     
     try:
         skill_recommendations = career_path_generator.recommend_skills_for_path(
             current_skills, target_role_id
         )
         
-        return jsonify({
+        return {
             'status': 'success',
             'recommendations': [
-                {
-                    'skill_id': skill_id,
-                    'name': data.get('skill_name', ''),
-                    'category': data.get('category', ''),
-                    'priority': data.get('priority', 5),
-                    'difficulty': data.get('difficulty', 3),
-                    'estimated_time': data.get('estimated_time', 3)
-                }
-                for skill_id, data in skill_recommendations.items()
+                _recommendation_record(skill_id, data) for skill_id, data in skill_recommendations.items()
             ]
-        })
+        }, 200
     except Exception as e:
         logger.error(f"Błąd podczas rekomendacji umiejętności: {e}")
-        return jsonify({'error': str(e)}), 500
+        return {'error': str(e)}, 500
 
-@app.route('/api/health', methods=['GET'])
-def health_check():
+def recommend_skills_records(body):
+    """
+    Rekomenduje umiejętności kolejno (do odpowiedzi strumieniowej)
+    
+    Returns:
+        Krotka (generator rekomendacji lub słownik z błędem, kod HTTP)
+    """
+    if not body or 'current_skills' not in body or 'target_role_id' not in body or not isinstance(body['current_skills'], list):
+        return {'error': 'Missing or invalid parameters: current_skills (list) and target_role_id required'}, 400
+    
+    return (
+        _recommendation_record(skill_id, data)
+        for skill_id, data in career_path_generator.iter_skill_recommendations(
+            body['current_skills'], body['target_role_id']
+        )
+    ), 200
+
+def _recommendation_record(skill_id, data):
+    """Rekord rekomendacji umiejętności w odpowiedzi API"""
+    return {
+        'skill_id': skill_id,
+        'name': data.get('skill_name', ''),
+        'category': data.get('category', ''),
+        'priority': data.get('priority', 5),
+        'difficulty': data.get('difficulty', 3),
+        'estimated_time': data.get('estimated_time', 3)
+    }
+
+def _career_simulation_job(params, job):
+    """Zadanie: pełna symulacja kariery (wszystkie kwartały)"""
+    job.report(0.0, 'Symulacja kariery')
+    simulation = career_simulator.simulate_career_progression(
+        params['user_profile'], params.get('target_role'), years=params.get('years', 5)
+    )
+    job.report(0.9, 'Zapisywanie wyników')
+    return {'simulation': simulation.to_dict('records')}
+
+def _career_timelines_job(params, job):
+    """Zadanie: symulacja Monte Carlo osi czasu kariery (podsumowanie rozkładów)"""
+    import numpy as np
+    import pandas as pd
+    
+    n_runs = int(params.get('n_runs', 1000))
+    chunk = max(1, min(500, n_runs // 20))
+    seed = params.get('seed')
+    
+    summaries = []
+    for start in range(0, n_runs, chunk):
+        summaries.extend(career_simulator.simulate_career_timelines(
+            params['current_role'], params['target_role'],
+            time_frame=params.get('time_frame', 5),
+            learning_intensity=params.get('learning_intensity', 5),
+            job_change_strategy=params.get('job_change_strategy', ''),
+            current_skills=params.get('current_skills'),
+            n_runs=min(chunk, n_runs - start),
+            include_timeline=False,
+            seed=None if seed is None else seed + start
+        ))
+        job.report(len(summaries) / n_runs, f"{len(summaries)}/{n_runs} przebiegów")
+    
+    runs = pd.DataFrame(summaries)
+    percentiles = (5, 25, 50, 75, 95)
+    return {
+        'n_runs': len(runs),
+        'percentiles': {
+            column: dict(zip(map(str, percentiles), np.percentile(runs[column], percentiles).round(2).tolist()))
+            for column in ('final_salary', 'salary_growth', 'skills_acquired', 'job_changes')
+        },
+        'final_roles': runs['final_role'].value_counts(normalize=True).round(4).to_dict()
+    }
+
+def _career_timelines_params_error(params):
+    """Sprawdza parametry zadania career-timelines (zwraca opis błędu lub None)"""
+    n_runs = params.get('n_runs', 1000)
+    if isinstance(n_runs, bool) or not isinstance(n_runs, int) or n_runs <= 0:
+        return "Invalid job parameter: n_runs (positive integer) required"
+    seed = params.get('seed')
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+        return "Invalid job parameter: seed (integer) required"
+    return None
+
+# Rodzaje zadań: nazwa -> (funkcja obsługi, wymagane parametry, walidacja parametrów lub None)
+JOB_TYPES = {
+    'career-simulation': (_career_simulation_job, ('user_profile',), None),
+    'career-timelines': (_career_timelines_job, ('current_role', 'target_role'), _career_timelines_params_error)
+}
+
+def get_job_queue():
+    """Zwraca kolejkę zadań bieżącego procesu (tworzoną i uruchamianą przy pierwszym użyciu)"""
+    global _job_queue
+    
+    with _job_queue_lock:
+        if _job_queue is None or _job_queue.pid != os.getpid():
+            queue = JobQueue(
+                API_CONFIG['jobs_db'],
+                max_workers=API_CONFIG['jobs_workers'],
+                result_ttl=API_CONFIG['jobs_result_ttl']
+            )
+            for kind, (handler, _, _) in JOB_TYPES.items():
+                queue.register(kind, handler)
+            queue.start()
+            _job_queue = queue
+        return _job_queue
+
+def submit_job_response(body):
+    """Dodaje zadanie w tle (type, params) i zwraca jego identyfikator"""
+    if not body or body.get('type') not in JOB_TYPES or not isinstance(body.get('params', {}), dict):
+        return {'error': f"Missing or invalid parameters: type (one of {sorted(JOB_TYPES)}) and params (dict) required"}, 400
+    
+    params = body.get('params', {})
+    _, required, validate = JOB_TYPES[body['type']]
+    missing = [name for name in required if name not in params]
+    if missing:
+        return {'error': f"Missing job parameters: {', '.join(missing)}"}, 400
+    error = validate(params) if validate else None
+    if error:
+        return {'error': error}, 400
+    
+    try:
+        job_id = get_job_queue().submit(body['type'], params)
+        return {'status': 'accepted', 'job_id': job_id, 'status_url': f"/api/jobs/{job_id}"}, 202
+    except Exception as e:
+        logger.error(f"Błąd podczas dodawania zadania: {e}")
+        return {'error': str(e)}, 500
+
+def job_status_response(job_id):
+    """Zwraca stan, postęp i (po zakończeniu) wynik zadania"""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return {'error': 'Job not found or expired'}, 404
+    return {'status': 'success', 'job': job}, 200
+
+def cancel_job_response(job_id):
+    """Anuluje zadanie oczekujące lub wykonywane"""
+    queue = get_job_queue()
+    if queue.cancel(job_id):
+        return {'status': 'success', 'job': queue.get(job_id)}, 202
+    if queue.get(job_id) is None:
+        return {'error': 'Job not found or expired'}, 404
+    return {'error': 'Job already finished'}, 409
+
+def health_response():
     """Sprawdza stan systemu"""
-    return jsonify({
+    return {
         'status': 'healthy',
+        'ready': _ready.is_set(),
         'timestamp': datetime.now().isoformat(),
+        'uptime_seconds': round(time.time() - _started, 1),
         'components': {
             'skills_analyzer': skills_analyzer is not None,
             'market_trends': market_trends is not None,
             'career_path_generator': career_path_generator is not None,
             'career_simulator': career_simulator is not None
         }
-    })
+    }, 200
+
+def readiness_response():
+    """Sprawdza gotowość do obsługi żądań (200 po załadowaniu komponentów, wcześniej 503)"""
+    if not _ready.is_set():
+        return {'status': 'warming_up'}, 503
+    return {'status': 'ready', 'pid': os.getpid()}, 200
+
+@app.route('/api/analyze-cv', methods=['POST'])
+def analyze_cv():
+    """Analizuje CV i zwraca zidentyfikowane umiejętności i poziomy (współbieżne żądania - w partiach)"""
+    batcher = get_cv_batcher()
+    if batcher is None:
+        payload, status = analyze_cv_response(request.json)
+    else:
+        payload, status = batcher.submit(request.json).result()
+    return jsonify(payload), status
+
+@app.route('/api/market-trends', methods=['GET'])
+def get_market_trends():
+    """Zwraca aktualne trendy rynkowe"""
+    return cached_json_response('market-trends', None, market_trends_response)
+
+@app.route('/api/career-path', methods=['POST'])
+def generate_career_path():
+    """Generuje ścieżkę kariery na podstawie aktualnej i docelowej roli"""
+    body = request.json
+    return cached_json_response('career-path', body, lambda: career_path_response(body))
+
+@app.route('/api/career-simulation', methods=['POST'])
+def simulate_career():
+    """
+    Symuluje przyszłą karierę na podstawie profilu użytkownika
+    
+    Przy nagłówku Accept: application/x-ndjson lub application/json-seq (albo parametrze
+    ?stream=ndjson|json-seq) zwraca strumieniowo wszystkie punkty symulacji.
+    """
+    mimetype = negotiate_stream(request.accept_mimetypes, request.args.get('stream'))
+    if mimetype:
+        return streamed_json_response(mimetype, career_simulation_records, request.json)
+    payload, status = career_simulation_response(request.json)
+    return jsonify(payload), status
+
+@app.route('/api/career-simulation/chart', methods=['POST'])
+def simulate_career_chart():
+    """Zwraca wykres symulacji kariery (PNG/SVG) z pamięci podręcznej wykresów"""
+    payload, status, headers = career_simulation_chart_response(request.json)
+    if isinstance(payload, bytes):
+        return Response(payload, status=status, headers=headers)
+    return jsonify(payload), status
+
+@app.route('/api/recommend-skills', methods=['POST'])
+def recommend_skills():
+    """Rekomenduje umiejętności do zdobycia dla osiągnięcia docelowej roli (opcjonalnie strumieniowo)"""
+    body = request.json
+    mimetype = negotiate_stream(request.accept_mimetypes, request.args.get('stream'))
+    if mimetype:
+        return streamed_json_response(mimetype, recommend_skills_records, body)
+    return cached_json_response('recommend-skills', body, lambda: recommend_skills_response(body))
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """Dodaje długotrwałe zadanie (symulacja, Monte Carlo) do kolejki w tle"""
+    payload, status = submit_job_response(request.json)
+    return jsonify(payload), status
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Zwraca stan i wynik zadania w tle"""
+    payload, status = job_status_response(job_id)
+    return jsonify(payload), status
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    """Anuluje zadanie w tle"""
+    payload, status = cancel_job_response(job_id)
+    return jsonify(payload), status
+
+@app.route('/api/health', methods=['GET'])
+def health_check():
+    """Sprawdza stan systemu"""
+    payload, status = health_response()
+    return jsonify(payload), status
+
+@app.route('/api/health/ready', methods=['GET'])
+def readiness_check():
+    """Sprawdza gotowość do obsługi żądań (200 po załadowaniu komponentów, wcześniej 503)"""
+    payload, status = readiness_response()
+    return jsonify(payload), status
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics_export():
+    """Eksportuje metryki (liczniki żądań, czasy, pamięci podręczne, etapy) dla Prometheus"""
+    return Response(metrics_response(), mimetype='text/plain; version=0.0.4')
 
 def start_api_server():
-    """Uruchamia serwer API"""
+    """
+    Uruchamia serwer deweloperski API (jeden proces)
+    
+    W produkcji należy użyć serwera wieloprocesowego z konfiguracją api/gunicorn.conf.py.
+    """
+    create_app(preload=True)
     app.run(
         host=API_CONFIG['host'],
         port=API_CONFIG['port'],
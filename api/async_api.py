@@ -0,0 +1,378 @@
+"""
+Asynchroniczny wariant API (ASGI) z tymi samymi punktami końcowymi co api/api.py
+
+Tanie odczyty (/api/health*, /api/market-trends - rankingi w pamięci podręcznej) są
+obsługiwane bezpośrednio w pętli zdarzeń. Kosztowne obliczenia (analiza CV, ścieżki
+kariery, symulacje, wykresy) trafiają do ograniczonej puli procesów, z limitem
+współbieżności dla każdego punktu końcowego i limitem oczekujących zadań - po jego
+przekroczeniu API odpowiada 503 z nagłówkiem Retry-After zamiast kolejkować bez końca.
+
+Użycie (z katalogu nadrzędnego repozytorium):
+    python -m <katalog_repozytorium>.api.async_api
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Quart jest opcjonalny - asynchroniczny wariant API wymaga go tylko przy uruchomieniu
+try:
+    from quart import Quart, Response, g, jsonify, request
+except ImportError:
+    Quart = None
+
+from . import api
+from .serialization import FastJSONProvider, negotiate_stream
+from ..config.config import API_CONFIG
+from ..modules.metrics import REGISTRY as metrics
+from ..modules.micro_batcher import MicroBatcher
+
+logger = logging.getLogger(__name__)
+
+# Limity współbieżności punktów końcowych jako ułamek liczby procesów puli
+ENDPOINT_LIMITS = {
+    'analyze-cv': 1.0,
+    'career-path': 1.0,
+    'recommend-skills': 1.0,
+    'career-simulation': 0.5,
+    'career-simulation-chart': 0.5
+}
+
+class Overloaded(Exception):
+    """Przekroczono limit oczekujących zadań puli procesów"""
+
+def _run_measured(func, *args):
+    """Wykonuje funkcję w procesie puli i zwraca (wynik, pomiary etapów) do procesu głównego"""
+    with metrics.capture() as samples:
+        result = func(*args)
+    return result, samples
+
+class CpuOffloader:
+    """
+    Pula procesów dla kosztownych obliczeń punktów końcowych
+
+    Procesy robocze są tworzone przez rozwidlenie (gdy platforma na to pozwala) po
+    załadowaniu komponentów, więc współdzielą je z procesem głównym w trybie kopiowania
+    przy zapisie; w pozostałych przypadkach ładują komponenty same (initializer).
+    """
+
+    def __init__(self, max_workers=None, max_pending=64, endpoint_limits=None):
+        """
+        Inicjalizacja puli
+
+        Args:
+            max_workers: Liczba procesów roboczych (None lub 0 - liczba rdzeni)
+            max_pending: Maksymalna liczba zadań oczekujących i wykonywanych łącznie
+            endpoint_limits: Słownik punkt końcowy -> ułamek puli (domyślnie ENDPOINT_LIMITS)
+        """
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.max_pending = max_pending
+        self.endpoint_limits = dict(ENDPOINT_LIMITS if endpoint_limits is None else endpoint_limits)
+        self.pending = 0
+        self.executor = None
+        self.semaphores = {}
+
+    async def start(self):
+        """Tworzy procesy robocze (wywoływane w pętli zdarzeń, po załadowaniu komponentów)"""
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=api.load_components,
+            initargs=(False,)
+        )
+        self.semaphores = {endpoint: asyncio.Semaphore(self.limit(endpoint)) for endpoint in self.endpoint_limits}
+        # Pierwsze zadanie uruchamia procesy robocze, zanim pojawi się ruch (bez blokowania pętli zdarzeń)
+        await asyncio.wrap_future(self.executor.submit(os.getpid))
+
+    def limit(self, endpoint):
+        """Limit współbieżności punktu końcowego (liczba procesów)"""
+        return max(1, int(self.max_workers * self.endpoint_limits.get(endpoint, 1.0)))
+
+    async def run(self, endpoint, func, *args):
+        """
+        Wykonuje funkcję w puli procesów z limitem współbieżności punktu końcowego
+
+        Args:
+            endpoint: Nazwa punktu końcowego (klucz limitu)
+            func: Funkcja modułu api (musi dać się zserializować)
+            *args: Argumenty funkcji
+
+        Returns:
+            Wynik funkcji
+
+        Raises:
+            Overloaded: Gdy liczba oczekujących zadań osiągnęła max_pending
+        """
+        if self.pending >= self.max_pending:
+            raise Overloaded(endpoint)
+
+        self.pending += 1
+        try:
+            async with self.semaphores[endpoint]:
+                loop = asyncio.get_running_loop()
+                result, samples = await loop.run_in_executor(self.executor, _run_measured, func, *args)
+                metrics.replay(samples)
+                return result
+        finally:
+            self.pending -= 1
+
+    def call(self, func, *args):
+        """Wykonuje funkcję w puli procesów synchronicznie (z wątku spoza pętli zdarzeń)"""
+        result, samples = self.executor.submit(_run_measured, func, *args).result()
+        metrics.replay(samples)
+        return result
+
+    async def run_batched(self, endpoint, batcher, item):
+        """
+        Przekazuje element do partii wykonywanej w puli procesów (z limitem oczekujących zadań)
+
+        Args:
+            endpoint: Nazwa punktu końcowego
+            batcher: MicroBatcher, którego funkcja korzysta z call
+            item: Element partii
+
+        Returns:
+            Wynik dla elementu
+
+        Raises:
+            Overloaded: Gdy liczba oczekujących zadań osiągnęła max_pending
+        """
+        if self.pending >= self.max_pending:
+            raise Overloaded(endpoint)
+
+        self.pending += 1
+        try:
+            return await asyncio.wrap_future(batcher.submit(item))
+        finally:
+            self.pending -= 1
+
+    def shutdown(self):
+        """Zamyka pulę procesów"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+def create_async_app(max_workers=None, max_pending=None, endpoint_limits=None):
+    """
+    Fabryka aplikacji ASGI
+
+    Komponenty są ładowane, a pula procesów tworzona przy starcie serwera (przed
+    przyjęciem pierwszego połączenia).
+
+    Args:
+        max_workers: Liczba procesów puli (domyślnie API_CONFIG['process_workers'])
+        max_pending: Limit oczekujących zadań (domyślnie API_CONFIG['max_pending'])
+        endpoint_limits: Limity współbieżności punktów końcowych (ułamki puli)
+
+    Returns:
+        Aplikacja Quart
+    """
+    if Quart is None:
+        raise ImportError("Asynchroniczne API wymaga pakietu quart (pip install quart uvicorn)")
+
+    app = Quart(__name__)
+    app.config['SECRET_KEY'] = API_CONFIG['secret_key']
+    app.json = FastJSONProvider(app)
+    offloader = CpuOffloader(
+        max_workers or API_CONFIG['process_workers'],
+        max_pending or API_CONFIG['max_pending'],
+        endpoint_limits
+    )
+    app.offloader = offloader
+    # Partie żądań analizy CV (tworzone po uruchomieniu puli; None - łączenie wyłączone)
+    app.cv_batcher = None
+    metrics.register_collector(lambda: [(
+        'api_process_pool_pending', 'gauge', 'Zadania oczekujące i wykonywane w puli procesów', None, offloader.pending
+    )])
+
+    @app.before_serving
+    async def start_components():
+        await asyncio.get_running_loop().run_in_executor(None, api.load_components)
+        await offloader.start()
+        if API_CONFIG['batch_max_size'] > 1:
+            app.cv_batcher = MicroBatcher(
+                lambda bodies: offloader.call(api.analyze_cv_batch_response, bodies),
+                max_batch_size=API_CONFIG['batch_max_size'],
+                max_wait=API_CONFIG['batch_max_wait_ms'] / 1000,
+                max_concurrency=offloader.limit('analyze-cv'),
+                name='analyze-cv'
+            )
+        logger.info(f"Asynchroniczne API gotowe ({offloader.max_workers} procesów roboczych)")
+
+    @app.after_serving
+    async def stop_components():
+        if app.cv_batcher is not None:
+            await asyncio.get_running_loop().run_in_executor(None, app.cv_batcher.stop)
+        offloader.shutdown()
+
+    @app.before_request
+    async def start_request_metrics():
+        g.metrics_route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        g.metrics_started = api.request_started(g.metrics_route)
+
+    @app.after_request
+    async def record_request_metrics(response):
+        started = g.pop('metrics_started', None)
+        if started is not None:
+            api.request_finished(g.metrics_route, request.method, response.status_code, started)
+        return response
+
+    @app.before_request
+    async def readiness_gate():
+        if not api._ready.is_set() and request.path not in api.HEALTH_PATHS:
+            return jsonify({'error': 'Service is warming up'}), 503, {'Retry-After': '5'}
+
+    def overloaded(endpoint):
+        """Odpowiedź 503 przy przeciążeniu puli procesów"""
+        logger.warning(f"Przeciążenie puli procesów - odrzucono żądanie {endpoint}")
+        return jsonify({'error': 'Server is busy, retry later'}), 503, {'Retry-After': '1'}
+
+    async def offload(endpoint, func, *args):
+        """Wykonuje logikę punktu końcowego w puli procesów i buduje odpowiedź"""
+        try:
+            result = await offloader.run(endpoint, func, *args)
+        except Overloaded:
+            return overloaded(endpoint)
+
+        payload, status = result[:2]
+        if isinstance(payload, bytes):
+            return Response(payload, status=status, headers=result[2])
+        return jsonify(payload), status
+
+    async def offload_cached(endpoint, func, body):
+        """Jak offload, ale z pamięcią podręczną odpowiedzi (sprawdzaną przed użyciem puli)"""
+        key = api.response_cache.key(endpoint, body, api.data_version())
+        entry = api.response_cache.get(key)
+        if entry is None:
+            try:
+                payload, status = await offloader.run(endpoint, func, body)
+            except Overloaded:
+                return overloaded(endpoint)
+            if status != 200:
+                return jsonify(payload), status
+            entry = api.response_cache.put(key, app.json.dumps(payload).encode('utf-8'))
+        return api.cached_entry_response(Response, entry, request.if_none_match)
+
+    async def offload_stream(endpoint, records_func, body, mimetype):
+        """Oblicza rekordy w puli procesów i serializuje je strumieniowo w pętli zdarzeń"""
+        try:
+            records, status = await offloader.run(endpoint, api.collect_records, records_func, body)
+        except Overloaded:
+            return overloaded(endpoint)
+        if status != 200:
+            return jsonify(records), status
+
+        async def chunks():
+            for chunk in api.stream_body(records, mimetype):
+                yield chunk
+                # Oddaj sterowanie pętli zdarzeń między blokami
+                await asyncio.sleep(0)
+
+        return Response(chunks(), status=200, mimetype=mimetype)
+
+    def stream_mimetype():
+        """Format strumieniowy wybrany przez klienta (Accept lub ?stream=) albo None"""
+        return negotiate_stream(request.accept_mimetypes, request.args.get('stream'))
+
+    @app.route('/api/analyze-cv', methods=['POST'])
+    async def analyze_cv():
+        """Analizuje CV i zwraca zidentyfikowane umiejętności i poziomy (współbieżne żądania - w partiach)"""
+        body = await request.get_json(silent=True)
+        if app.cv_batcher is None:
+            return await offload('analyze-cv', api.analyze_cv_response, body)
+        try:
+            payload, status = await offloader.run_batched('analyze-cv', app.cv_batcher, body)
+        except Overloaded:
+            return overloaded('analyze-cv')
+        return jsonify(payload), status
+
+    @app.route('/api/market-trends', methods=['GET'])
+    async def get_market_trends():
+        """Zwraca aktualne trendy rynkowe (rankingi z pamięci podręcznej - w pętli zdarzeń)"""
+        key = api.response_cache.key('market-trends', None, api.data_version())
+        entry = api.response_cache.get(key)
+        if entry is None:
+            payload, status = api.market_trends_response()
+            if status != 200:
+                return jsonify(payload), status
+            entry = api.response_cache.put(key, app.json.dumps(payload).encode('utf-8'))
+        return api.cached_entry_response(Response, entry, request.if_none_match)
+
+    @app.route('/api/career-path', methods=['POST'])
+    async def generate_career_path():
+        """Generuje ścieżkę kariery na podstawie aktualnej i docelowej roli"""
+        return await offload_cached('career-path', api.career_path_response, await request.get_json(silent=True))
+
+    @app.route('/api/career-simulation', methods=['POST'])
+    async def simulate_career():
+        """Symuluje przyszłą karierę na podstawie profilu użytkownika (opcjonalnie strumieniowo)"""
+        body = await request.get_json(silent=True)
+        mimetype = stream_mimetype()
+        if mimetype:
+            return await offload_stream('career-simulation', api.career_simulation_records, body, mimetype)
+        return await offload('career-simulation', api.career_simulation_response, body)
+
+    @app.route('/api/career-simulation/chart', methods=['POST'])
+    async def simulate_career_chart():
+        """Zwraca wykres symulacji kariery (PNG/SVG)"""
+        return await offload('career-simulation-chart', api.career_simulation_chart_response,
+                             await request.get_json(silent=True))
+
+    @app.route('/api/recommend-skills', methods=['POST'])
+    async def recommend_skills():
+        """Rekomenduje umiejętności do zdobycia dla osiągnięcia docelowej roli (opcjonalnie strumieniowo)"""
+        body = await request.get_json(silent=True)
+        mimetype = stream_mimetype()
+        if mimetype:
+            return await offload_stream('recommend-skills', api.recommend_skills_records, body, mimetype)
+        return await offload_cached('recommend-skills', api.recommend_skills_response, body)
+
+    @app.route('/api/jobs', methods=['POST'])
+    async def submit_job():
+        """Dodaje długotrwałe zadanie do kolejki w tle"""
+        payload, status = api.submit_job_response(await request.get_json(silent=True))
+        return jsonify(payload), status
+
+    @app.route('/api/jobs/<job_id>', methods=['GET'])
+    async def get_job(job_id):
+        """Zwraca stan i wynik zadania w tle"""
+        payload, status = api.job_status_response(job_id)
+        return jsonify(payload), status
+
+    @app.route('/api/jobs/<job_id>', methods=['DELETE'])
+    async def cancel_job(job_id):
+        """Anuluje zadanie w tle"""
+        payload, status = api.cancel_job_response(job_id)
+        return jsonify(payload), status
+
+    @app.route('/api/health', methods=['GET'])
+    async def health_check():
+        """Sprawdza stan systemu"""
+        payload, status = api.health_response()
+        payload['pending_jobs'] = offloader.pending
+        return jsonify(payload), status
+
+    @app.route('/api/health/ready', methods=['GET'])
+    async def readiness_check():
+        """Sprawdza gotowość do obsługi żądań"""
+        payload, status = api.readiness_response()
+        return jsonify(payload), status
+
+    @app.route('/api/metrics', methods=['GET'])
+    async def metrics_export():
+        """Eksportuje metryki dla Prometheus (z pomiarami etapów wykonanych w puli procesów)"""
+        return Response(api.metrics_response(), mimetype='text/plain; version=0.0.4')
+
+    return app
+
+def start_async_api_server():
+    """Uruchamia asynchroniczny serwer API (uvicorn, jedna pętla zdarzeń + pula procesów)"""
+    import uvicorn
+
+    uvicorn.run(create_async_app(), host=API_CONFIG['host'], port=API_CONFIG['port'])
+
+if __name__ == "__main__":
+    start_async_api_server()
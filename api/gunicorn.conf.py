@@ -0,0 +1,43 @@
+"""
+Konfiguracja produkcyjnego serwera API (gunicorn, wiele procesów roboczych)
+
+Aplikacja jest tworzona raz w procesie nadrzędnym (preload_app): katalogi umiejętności
+i ról, graf kariery, dane rynkowe i model NLP są ładowane przed rozwidleniem, a procesy
+robocze współdzielą te strony pamięci w trybie kopiowania przy zapisie. Obiekty
+załadowane w procesie nadrzędnym są zamrażane (gc.freeze), aby odśmiecacz w procesach
+roboczych nie dotykał ich nagłówków i nie wymuszał kopiowania stron.
+
+Użycie (z katalogu repozytorium):
+    gunicorn -c api/gunicorn.conf.py
+
+Zmienne środowiskowe: API_HOST, API_PORT, API_WORKERS (0 - liczba rdzeni),
+API_THREADS, API_TIMEOUT.
+"""
+import gc
+import multiprocessing
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# api/api.py używa importów względnych (..modules), więc jest importowany jako część
+# pakietu repozytorium; ścieżki danych (data/...) są względne wobec katalogu repozytorium
+sys.path.insert(0, os.path.dirname(ROOT_DIR))
+from importlib import import_module  # noqa: E402
+
+API_CONFIG = import_module(f"{os.path.basename(ROOT_DIR)}.config.config").API_CONFIG
+
+chdir = ROOT_DIR
+wsgi_app = f"{os.path.basename(ROOT_DIR)}.api.api:create_app()"
+
+bind = f"{API_CONFIG['host']}:{API_CONFIG['port']}"
+workers = API_CONFIG['workers'] or multiprocessing.cpu_count()
+worker_class = 'gthread'
+threads = API_CONFIG['threads']
+timeout = API_CONFIG['timeout']
+preload_app = True
+
+def when_ready(server):
+    """Zamraża obiekty załadowane w procesie nadrzędnym przed utworzeniem procesów roboczych"""
+    gc.freeze()
+    server.log.info(f"Zamrożono {gc.get_freeze_count()} obiektów przed rozwidleniem procesów roboczych")
@@ -0,0 +1,152 @@
+"""
+Serializacja odpowiedzi API
+
+- dumps: szybki koder JSON (orjson, jeśli jest zainstalowany) z obsługą typów numpy/pandas,
+- FastJSONProvider: dostawca JSON dla Flask korzystający z dumps (format dat bez zmian),
+- stream_records: strumień rekordów jako NDJSON lub JSON text sequences (RFC 7464),
+  zapisywany w miarę generowania rekordów zamiast budowania całej odpowiedzi w pamięci.
+"""
+import datetime
+import json
+import sys
+import time
+
+from flask.json.provider import DefaultJSONProvider
+
+from ..modules.metrics import REGISTRY, stage_timer
+
+# orjson jest opcjonalny - bez niego używany jest moduł json z biblioteki standardowej
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Formaty strumieniowe: typ MIME -> prefiks rekordu (RFC 7464 poprzedza rekordy znakiem RS)
+STREAM_FORMATS = {
+    'application/x-ndjson': b'',
+    'application/json-seq': b'\x1e'
+}
+
+def to_builtin(value, http_dates=False):
+    """
+    Zamienia typy numpy/pandas i daty na typy obsługiwane przez JSON
+
+    Args:
+        value: Wartość nieobsługiwana przez koder
+        http_dates: Czy daty zapisywać w formacie HTTP (jak domyślny koder Flask) zamiast ISO 8601
+
+    Returns:
+        Wartość typu wbudowanego
+    """
+    # Typy numpy/pandas mogą wystąpić tylko, gdy biblioteki są już załadowane (bez importu przy starcie)
+    np = sys.modules.get('numpy')
+    pd = sys.modules.get('pandas')
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        if pd is not None and value is pd.NaT:
+            return None
+        return DefaultJSONProvider.default(value) if http_dates else value.isoformat()
+    if np is None:
+        return list(value) if isinstance(value, (set, frozenset)) else DefaultJSONProvider.default(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if pd is not None and isinstance(value, (pd.Series, pd.Index)):
+        return value.tolist()
+    if pd is not None and isinstance(value, pd.DataFrame):
+        return value.to_dict('records')
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return DefaultJSONProvider.default(value)
+
+def dumps(obj, http_dates=False, sort_keys=False):
+    """
+    Serializuje obiekt do bajtów JSON (UTF-8)
+
+    Args:
+        obj: Obiekt do serializacji
+        http_dates: Format dat (True - HTTP, jak domyślny koder Flask; False - ISO 8601)
+        sort_keys: Czy sortować klucze słowników
+
+    Returns:
+        Bajty JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if http_dates:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=lambda value: to_builtin(value, http_dates), option=option)
+
+    return json.dumps(
+        obj, default=lambda value: to_builtin(value, http_dates), ensure_ascii=False,
+        separators=(',', ':'), sort_keys=sort_keys
+    ).encode('utf-8')
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Dostawca JSON dla Flask oparty na dumps (typy numpy/pandas, orjson, jeśli dostępny)"""
+
+    @stage_timer('serialization')
+    def dumps(self, obj, **kwargs):
+        if kwargs.get('indent'):
+            # Odpowiedzi sformatowane (tryb debug) - koder standardowy
+            kwargs.setdefault('default', lambda value: to_builtin(value, http_dates=True))
+            return super().dumps(obj, **kwargs)
+        return dumps(obj, http_dates=True, sort_keys=kwargs.get('sort_keys', self.sort_keys)).decode('utf-8')
+
+def negotiate_stream(accept_mimetypes, stream=None):
+    """
+    Wybiera format strumieniowy odpowiedzi
+
+    Args:
+        accept_mimetypes: Nagłówek Accept żądania (MIMEAccept z werkzeug)
+        stream: Wartość parametru ?stream= ('ndjson', 'json-seq')
+
+    Returns:
+        Typ MIME formatu strumieniowego lub None (zwykła odpowiedź JSON)
+    """
+    if stream:
+        return {'ndjson': 'application/x-ndjson', 'json-seq': 'application/json-seq'}.get(stream)
+    best = accept_mimetypes.best_match(['application/json', *STREAM_FORMATS])
+    return best if best in STREAM_FORMATS else None
+
+def stream_records(records, mimetype='application/x-ndjson', buffer_size=65536):
+    """
+    Serializuje rekordy do strumienia NDJSON / JSON text sequences
+
+    Pierwszy rekord jest wysyłany od razu (krótki czas do pierwszego bajtu), kolejne
+    w blokach o rozmiarze ok. buffer_size.
+
+    Args:
+        records: Iterowalny zbiór rekordów
+        mimetype: Typ MIME formatu (klucz STREAM_FORMATS)
+        buffer_size: Rozmiar bloku wysyłanych danych
+
+    Yields:
+        Bajty kolejnych bloków odpowiedzi
+    """
+    prefix = STREAM_FORMATS[mimetype]
+    buffer = bytearray()
+    first = True
+    # Czas serializacji (bez czasu generowania rekordów) - jedna obserwacja na strumień
+    elapsed = 0.0
+    try:
+        for record in records:
+            start = time.perf_counter()
+            buffer += prefix
+            buffer += dumps(record)
+            buffer += b'\n'
+            elapsed += time.perf_counter() - start
+            if first or len(buffer) >= buffer_size:
+                yield bytes(buffer)
+                buffer.clear()
+                first = False
+        if buffer:
+            yield bytes(buffer)
+    finally:
+        REGISTRY.observe('stage_duration_seconds', elapsed, {'stage': 'serialization'})
@@ -0,0 +1,129 @@
+"""
+Benchmark łączenia współbieżnych żądań analizy CV w partie (MicroBatcher)
+
+Wątki klientów wywołują logikę /api/analyze-cv (bez warstwy HTTP) jednocześnie:
+- bez łączenia (każde żądanie osobno, jak przy API_BATCH_MAX_SIZE=1),
+- przez MicroBatcher dla kilku wartości max_wait.
+Raportuje przepustowość, opóźnienia p50/p99 i średni rozmiar partii.
+
+Użycie:
+    python benchmarks/bench_cv_batching.py [--clients 32] [--requests 50] [--output wyniki.json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from importlib import import_module
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# api/api.py używa importów względnych, więc jest importowany jako część pakietu repozytorium
+sys.path.insert(0, os.path.dirname(ROOT_DIR))
+os.chdir(ROOT_DIR)
+api = import_module(f"{os.path.basename(ROOT_DIR)}.api.api")
+MicroBatcher = import_module(f"{os.path.basename(ROOT_DIR)}.modules.micro_batcher").MicroBatcher
+
+FILLER = (
+    "Odpowiedzialny za projektowanie i rozwój systemów, współpracę z zespołem oraz klientami. "
+    "Prowadzenie przeglądów kodu, dokumentacja i wdrożenia. "
+)
+LEVELS = ['ekspert', 'dobra znajomość', 'podstawy', '']
+
+def sample_cvs(count, seed=42):
+    """Generuje teksty CV z losowymi umiejętnościami z bazy i tekstem wypełniającym"""
+    rng = random.Random(seed)
+    skills = list(api.skills_analyzer.skills_db['skill_name'])
+    cvs = []
+    for _ in range(count):
+        parts = [f"{rng.choice(LEVELS)} {skill}" for skill in rng.sample(skills, rng.randint(2, min(8, len(skills))))]
+        cvs.append(FILLER * rng.randint(2, 10) + ', '.join(parts) + '. ' + FILLER)
+    return cvs
+
+def run_clients(call, cvs, clients, requests_per_client):
+    """Uruchamia wątki klientów i zwraca (czas całkowity, lista opóźnień w ms)"""
+    latencies = []
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(clients + 1)
+
+    def client(index):
+        local = []
+        start_barrier.wait()
+        for i in range(requests_per_client):
+            body = {'cv_text': cvs[(index * requests_per_client + i) % len(cvs)]}
+            start = time.perf_counter()
+            payload, status = call(body)
+            if status != 200:
+                raise RuntimeError(payload)
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark łączenia żądań analizy CV w partie')
+    parser.add_argument('--clients', type=int, default=32, help='Liczba jednoczesnych klientów')
+    parser.add_argument('--requests', type=int, default=50, help='Liczba żądań na klienta')
+    parser.add_argument('--batch-size', type=int, default=32, help='Maksymalny rozmiar partii')
+    parser.add_argument('--output', help='Ścieżka do pliku JSON z wynikami')
+    args = parser.parse_args()
+
+    api.load_components()
+    cvs = sample_cvs(500)
+
+    # Liczba wykonanych partii dla każdego wariantu
+    batch_counts = {}
+
+    def counted(name):
+        def analyze(bodies):
+            batch_counts[name] = batch_counts.get(name, 0) + 1
+            return api.analyze_cv_batch_response(bodies)
+        return analyze
+
+    variants = {'bez łączenia': (None, api.analyze_cv_response)}
+    for max_wait_ms in (1, 5, 10):
+        name = f'bench-{max_wait_ms}'
+        batcher = MicroBatcher(counted(name), max_batch_size=args.batch_size, max_wait=max_wait_ms / 1000, name=name)
+        variants[f'partie, max_wait={max_wait_ms} ms'] = (batcher, lambda body, b=batcher: b.submit(body).result())
+
+    results = []
+    for label, (batcher, call) in variants.items():
+        elapsed, latencies = run_clients(call, cvs, args.clients, args.requests)
+        result = {
+            'variant': label,
+            'requests': len(latencies),
+            'throughput_rps': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(float(np.percentile(latencies, 50)), 2),
+            'p99_ms': round(float(np.percentile(latencies, 99)), 2)
+        }
+        if batcher is not None:
+            result['avg_batch_size'] = round(len(latencies) / batch_counts[batcher.name], 1)
+            batcher.stop()
+        results.append(result)
+
+    baseline = results[0]['throughput_rps']
+    print(f"{'Wariant':<28}{'żądania/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'partia':>9}{'zmiana':>9}")
+    for r in results:
+        r['speedup'] = round(r['throughput_rps'] / baseline, 2)
+        batch = '-' if r.get('avg_batch_size') is None else f"{r['avg_batch_size']:.1f}"
+        print(f"{r['variant']:<28}{r['throughput_rps']:>12.1f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+              f"{batch:>9}{r['speedup']:>8.2f}x")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
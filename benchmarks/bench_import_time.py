@@ -0,0 +1,155 @@
+"""
+Benchmark czasu importu punktów wejścia (CLI, API Flask, API asynchroniczne) i MarketTrends
+
+Każdy import jest wykonywany w osobnym procesie interpretera z opcją -X importtime.
+Raportuje medianę czasu importu, moduły o największym czasie własnym oraz ciężkie
+biblioteki (spaCy, scikit-learn, matplotlib, ...) załadowane już przy imporcie -
+po odroczeniu importów nie powinny się tam pojawiać. Biblioteki ładowane dopiero
+przez inną ciężką bibliotekę (np. pyarrow przez pandas 3) są raportowane osobno.
+
+Użycie:
+    python benchmarks/bench_import_time.py [--repeat 5] [--top 10] [--output wyniki.json] [--compare poprzednie.json]
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(ROOT_DIR)
+
+# Punkt wejścia -> (moduł, katalog dodawany do PYTHONPATH)
+TARGETS = {
+    'cli': ('main', ROOT_DIR),
+    'api': (f'{PACKAGE}.api.api', os.path.dirname(ROOT_DIR)),
+    'async_api': (f'{PACKAGE}.api.async_api', os.path.dirname(ROOT_DIR)),
+    # Potrzebny każdemu uruchomieniu CLI z --profile
+    'market_trends': ('modules.market_trends', ROOT_DIR)
+}
+
+# Biblioteki, których import zajmuje najwięcej czasu
+HEAVY_PACKAGES = ('spacy', 'sklearn', 'matplotlib', 'networkx', 'scipy', 'pandas', 'numpy', 'requests', 'bs4', 'pyarrow')
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+def measure_import(module, path):
+    """
+    Importuje moduł w nowym procesie i zwraca wyniki -X importtime
+
+    Returns:
+        Krotka (czas całkowity w ms, słownik moduł -> czas własny w ms,
+        lista (głębokość, moduł) w kolejności zakończenia importu)
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [path, os.environ.get('PYTHONPATH')])))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import {module} nie powiódł się:\n{result.stderr[-2000:]}")
+
+    total = 0.0
+    self_times = {}
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        self_times[name] = int(self_us) / 1000
+        entries.append((len(indent), name))
+        # Moduły najwyższego poziomu (bez wcięcia) składają się na całkowity czas importu
+        if len(indent) == 1:
+            total += int(cumulative_us) / 1000
+    return total, self_times, entries
+
+def heavy_dependencies(entries):
+    """
+    Przypisuje ciężkie biblioteki do miejsca importu
+
+    -X importtime wypisuje moduł po zakończeniu jego importu (dzieci przed rodzicem),
+    więc odwrócona lista daje rodziców przed dziećmi.
+
+    Returns:
+        Krotka (zbiór bibliotek importowanych bezpośrednio przez punkt wejścia,
+        słownik biblioteka -> ciężka biblioteka, która ją zaimportowała)
+    """
+    direct = set()
+    dependencies = {}
+    stack = []  # (głębokość, najbliższa ciężka biblioteka na ścieżce importu)
+    for depth, name in reversed(entries):
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        ancestor = stack[-1][1] if stack else None
+        package = name.split('.')[0]
+        heavy = package if package in HEAVY_PACKAGES else None
+        if heavy and ancestor is None:
+            direct.add(heavy)
+        elif heavy and ancestor != heavy:
+            dependencies.setdefault(heavy, ancestor)
+        stack.append((depth, heavy or ancestor))
+    return direct, {package: parent for package, parent in dependencies.items() if package not in direct}
+
+def run_target(name, module, path, repeat, top):
+    """Mierzy import punktu wejścia repeat razy i zwraca podsumowanie"""
+    totals = []
+    self_times = {}
+    entries = []
+    for _ in range(repeat):
+        total, self_times, entries = measure_import(module, path)
+        totals.append(total)
+
+    direct, dependencies = heavy_dependencies(entries)
+    slowest = sorted(self_times.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        'target': name,
+        'module': module,
+        'median_ms': round(statistics.median(totals), 1),
+        'min_ms': round(min(totals), 1),
+        'modules_loaded': len(self_times),
+        'heavy_packages': [package for package in HEAVY_PACKAGES if package in direct],
+        'heavy_dependencies': {package: dependencies[package] for package in HEAVY_PACKAGES if package in dependencies},
+        'slowest_modules': [{'module': imported, 'self_ms': round(ms, 1)} for imported, ms in slowest]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark czasu importu punktów wejścia')
+    parser.add_argument('--repeat', type=int, default=5, help='Liczba pomiarów dla każdego punktu wejścia')
+    parser.add_argument('--top', type=int, default=10, help='Liczba raportowanych najwolniejszych modułów')
+    parser.add_argument('--targets', default=','.join(TARGETS), help='Punkty wejścia oddzielone przecinkami')
+    parser.add_argument('--output', help='Ścieżka do pliku JSON z wynikami')
+    parser.add_argument('--compare', help='Plik JSON z poprzednimi wynikami (--output) do porównania')
+    args = parser.parse_args()
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = {r['target']: r for r in json.load(f)}
+
+    results = []
+    for name in (target.strip() for target in args.targets.split(',')):
+        module, path = TARGETS[name]
+        result = run_target(name, module, path, args.repeat, args.top)
+        results.append(result)
+
+        print(f"\n{result['target']} (import {module}): mediana {result['median_ms']:.1f} ms, "
+              f"min {result['min_ms']:.1f} ms, modułów: {result['modules_loaded']}")
+        if name in previous:
+            before = previous[name]['median_ms']
+            print(f"  poprzednio: {before:.1f} ms ({before / max(result['median_ms'], 0.1):.1f}x)")
+        print(f"  ciężkie biblioteki: {', '.join(result['heavy_packages']) or 'brak'}")
+        if result['heavy_dependencies']:
+            print("  ładowane przez inne biblioteki: "
+                  + ', '.join(f"{package} ({parent})" for package, parent in result['heavy_dependencies'].items()))
+        for entry in result['slowest_modules']:
+            print(f"  {entry['self_ms']:>9.1f} ms  {entry['module']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark parsowania wynagrodzeń (parse_salaries) - silnik RE2 (pyarrow) i pandas str.extract
+
+Przed pomiarem sprawdza wyniki dla znanych tekstów z portali (widełki, waluty, stawki
+godzinowe, netto, oznaczenia umów typu "B2B", separatory tysięcy "10.000"/"10,000")
+w obu silnikach wyrażeń regularnych.
+
+Użycie:
+    python benchmarks/bench_salary_parsing.py [--rows 1000000] [--output wyniki.json]
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import modules.market_trends as market_trends
+from modules.market_trends import parse_salaries
+
+# Tekst -> oczekiwane (salary_min, salary_max, waluta, okres, netto)
+CASES = {
+    '10 500 – 14 000 zł brutto / mies.': (10500, 14000, 'PLN', 'month', False),
+    '103–137 zł netto / godz.': (103, 137, 'PLN', 'hour', True),
+    '12k EUR': (12000, 12000, 'EUR', 'month', False),
+    '8000 - 9000 PLN': (8000, 9000, 'PLN', 'month', False),
+    '(8000-9000 zł)': (8000, 9000, 'PLN', 'month', False),
+    'B2B 20k-25k PLN': (20000, 25000, 'PLN', 'month', False),
+    'Umowa B2B: 18000 PLN': (18000, 18000, 'PLN', 'month', False),
+    '120 000 USD rocznie': (120000, 120000, 'USD', 'year', False),
+    '10.000 - 12.000 zł': (10000, 12000, 'PLN', 'month', False),
+    'PLN 10,000 - 15,000': (10000, 15000, 'PLN', 'month', False),
+    '€5,000/month': (5000, 5000, 'EUR', 'month', False),
+    '12.500,50 zł': (12500.5, 12500.5, 'PLN', 'month', False),
+    '$1,234.56': (1234.56, 1234.56, 'USD', 'month', False),
+    '45,50 zł netto / godz.': (45.5, 45.5, 'PLN', 'hour', True),
+    '2.5k EUR': (2500, 2500, 'EUR', 'month', False),
+    '15000': (15000, 15000, 'PLN', 'month', False),
+    'Nie podano': (math.nan, math.nan, 'PLN', 'month', False)
+}
+
+def engines():
+    """Dostępne silniki: nazwa -> moduł pyarrow.compute (None - pandas str.extract)"""
+    available = {'pandas': None}
+    arrow_compute = market_trends._load_pyarrow()
+    if arrow_compute is not None:
+        available['pyarrow (RE2)'] = arrow_compute
+    return available
+
+def check_cases(available):
+    """Sprawdza wyniki parse_salaries dla CASES w każdym silniku (AssertionError przy różnicy)"""
+    texts = pd.Series(list(CASES))
+    for name, engine in available.items():
+        market_trends.pc = engine
+        parsed = parse_salaries(texts)
+        for i, (text, expected) in enumerate(CASES.items()):
+            row = parsed.iloc[i]
+            actual = (row['salary_min'], row['salary_max'], row['currency'], row['period'], row['is_net'])
+            for got, want in zip(actual, expected):
+                assert got == want or (pd.isna(got) and pd.isna(want)), f"{name}: {text!r} -> {actual}, oczekiwano {expected}"
+    market_trends.pc = available.get('pyarrow (RE2)')
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parsowania wynagrodzeń')
+    parser.add_argument('--rows', type=int, default=1000000, help='Liczba wierszy kolumny wynagrodzeń')
+    parser.add_argument('--output', help='Ścieżka do pliku JSON z wynikami')
+    args = parser.parse_args()
+
+    available = engines()
+    check_cases(available)
+    print(f"Poprawność: {len(CASES)} przypadków zgodnych w silnikach: {', '.join(available)}")
+
+    # Kolumna jak z portali - powtarzające się widełki i kilka wartości unikalnych
+    texts = list(CASES) + [f"{5000 + i} - {8000 + i} PLN" for i in range(500)]
+    column = pd.Series([texts[i % len(texts)] for i in range(args.rows)], dtype=object)
+
+    results = []
+    for name, engine in available.items():
+        market_trends.pc = engine
+        start = time.perf_counter()
+        parse_salaries(column)
+        elapsed = time.perf_counter() - start
+        results.append({'engine': name, 'rows': args.rows, 'seconds': round(elapsed, 3)})
+        print(f"{name:<16}{args.rows:>10} wierszy{elapsed:>10.3f} s")
+    market_trends.pc = available.get('pyarrow (RE2)')
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
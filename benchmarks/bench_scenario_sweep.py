@@ -0,0 +1,104 @@
+"""
+Benchmark analizy wrażliwości (CareerSimulator.sweep_scenarios): obliczenia w procesie vs pula procesów
+
+Przed pomiarem sprawdza, że wyniki puli procesów są identyczne z obliczeniami
+w bieżącym procesie - również dla symulatora z niestandardową konfiguracją
+(wagi czynników progresu, poziomy edukacji, intensywność nauki, scenariusz rynkowy).
+
+Użycie:
+    python benchmarks/bench_scenario_sweep.py [--runs 20] [--workers 4] [--output wyniki.json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.career_path import CareerPathGenerator
+from modules.career_simulator import CareerSimulator
+from modules.market_trends import MarketTrends
+
+PROFILE = {
+    'current_role': {'name': 'Junior Python Developer', 'salary': 7000},
+    'skills': [{'name': 'Python', 'level': 3}, {'name': 'SQL', 'level': 2}],
+    'experience': 1,
+    'education': 'Licencjat'
+}
+TARGET_ROLE = {
+    'name': 'Senior Python Developer',
+    'salary': 20000,
+    'required_skills': [{'name': 'Python'}, {'name': 'Docker'}, {'name': 'Git'}, {'name': 'Django'}]
+}
+PARAM_GRID = {
+    'years': [3, 5],
+    'learning_intensity': [0.5, 1.5],
+    'market_scenario': ['baseline', 'recession']
+}
+
+def make_simulator(path_generator, market_trends, custom):
+    """Tworzy symulator (custom - konfiguracja odbiegająca od domyślnej)"""
+    if not custom:
+        return CareerSimulator(market_trends=market_trends, career_path_generator=path_generator)
+    simulator = CareerSimulator(
+        market_trends=market_trends,
+        career_path_generator=path_generator,
+        progression_factors={name: 0.0 for name in ('skill_match', 'experience', 'market_demand', 'education')},
+        education_levels={'Licencjat': 4}
+    )
+    simulator.learning_intensity = 1
+    simulator.market_scenario = 'boom'
+    return simulator
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark analizy wrażliwości scenariuszy kariery')
+    parser.add_argument('--runs', type=int, default=20, help='Liczba przebiegów Monte Carlo na scenariusz')
+    parser.add_argument('--workers', type=int, default=4, help='Liczba procesów roboczych')
+    parser.add_argument('--output', help='Ścieżka do pliku JSON z wynikami')
+    args = parser.parse_args()
+
+    path_generator = CareerPathGenerator(
+        skills_database_path='data/skills_database.csv',
+        roles_database_path='data/roles_database.csv'
+    )
+    market_trends = MarketTrends(data_path='data/job_market_data.csv')
+
+    results = []
+    for custom in (False, True):
+        timings = {}
+        frames = {}
+        for workers in (1, args.workers):
+            # Nowy symulator dla każdego wariantu - bez wyników z pamięci podręcznej
+            simulator = make_simulator(path_generator, market_trends, custom)
+            start = time.perf_counter()
+            frames[workers] = simulator.sweep_scenarios(
+                PROFILE, TARGET_ROLE, PARAM_GRID, n_runs=args.runs, max_workers=workers
+            )
+            timings[workers] = time.perf_counter() - start
+
+        # Pula procesów musi dawać te same wyniki co obliczenia w bieżącym procesie
+        pd.testing.assert_frame_equal(frames[1], frames[args.workers])
+
+        label = 'niestandardowa' if custom else 'domyślna'
+        result = {
+            'configuration': label,
+            'scenarios': len(frames[1]),
+            'serial_s': round(timings[1], 3),
+            'pool_s': round(timings[args.workers], 3),
+            'speedup': round(timings[1] / timings[args.workers], 2)
+        }
+        results.append(result)
+        print(f"Konfiguracja {label}: {result['scenarios']} scenariuszy, wyniki zgodne; "
+              f"w procesie {result['serial_s']:.2f} s, pula ({args.workers}) {result['pool_s']:.2f} s "
+              f"({result['speedup']:.2f}x)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark parsowania stron z ofertami pracy na zapisanych stronach (benchmarks/fixtures)
+
+Porównuje czas parsowania w przeliczeniu na 1000 ofert dla:
+- dotychczasowej metody (html.parser, cała strona, select_one dla każdego pola),
+- adapterów z parserem html.parser / lxml, z i bez ograniczenia do elementów ofert (SoupStrainer).
+
+Użycie:
+    python benchmarks/bench_scraper_parsing.py [--repeat 20] [--output wyniki.json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from modules.scraper_adapters import NoFluffJobsAdapter, PracujPlAdapter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+FIXTURES = {
+    'pracuj.pl': ('pracuj_pl.html', PracujPlAdapter),
+    'nofluffjobs.com': ('nofluffjobs.html', NoFluffJobsAdapter)
+}
+
+def legacy_parse(source, html, limit):
+    """Parsowanie w dotychczasowy sposób (pełne drzewo html.parser + select_one)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    listings = []
+    if source == 'pracuj.pl':
+        for item in soup.select('.results__list-container-item')[:limit]:
+            salary_elem = item.select_one('.offer-labels__item--salary')
+            listings.append({
+                'title': item.select_one('.offer-details__title-link').text.strip(),
+                'company': item.select_one('.offer-company__name').text.strip(),
+                'location': item.select_one('.offer-labels__item--location').text.strip(),
+                'salary': salary_elem.text.strip() if salary_elem else "Nie podano"
+            })
+    else:
+        for item in soup.select('.posting-list-item')[:limit]:
+            salary_elem = item.select_one('.salary-range')
+            listings.append({
+                'title': item.select_one('.posting-title__position').text.strip(),
+                'company': item.select_one('.posting-title__company').text.strip(),
+                'location': item.select_one('.posting-info__location').text.strip(),
+                'salary': salary_elem.text.strip() if salary_elem else "Nie podano",
+                'skills': [s.text.strip() for s in item.select('.posting-info__tags .btn-main')]
+            })
+    return listings
+
+def time_per_1000(parse, html, repeat):
+    """Zwraca (czas w ms na 1000 ofert, liczba ofert na stronie)"""
+    count = len(parse(html))
+    if count == 0:
+        raise RuntimeError("Parser nie znalazł żadnych ofert na stronie")
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse(html)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * count) * 1000 * 1000, count
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark parsowania ofert pracy')
+    parser.add_argument('--repeat', type=int, default=20, help='Liczba powtórzeń parsowania strony')
+    parser.add_argument('--output', help='Ścieżka do pliku JSON z wynikami')
+    args = parser.parse_args()
+
+    try:
+        import lxml  # noqa: F401
+        parsers = ['html.parser', 'lxml']
+    except ImportError:
+        parsers = ['html.parser']
+        print("lxml nie jest zainstalowany - pomijam warianty lxml")
+
+    results = []
+    for source, (filename, adapter_cls) in FIXTURES.items():
+        with open(os.path.join(FIXTURES_DIR, filename), encoding='utf-8') as f:
+            html = f.read()
+
+        variants = {'legacy html.parser (select_one)': lambda h, s=source: legacy_parse(s, h, 10 ** 6)}
+        for name in parsers:
+            for restrict in (False, True):
+                adapter = adapter_cls(parser=name, restrict_to_items=restrict)
+                label = f"adapter {name}{' + SoupStrainer' if restrict else ''}"
+                variants[label] = lambda h, a=adapter: a.parse(h, 10 ** 6)
+
+        for label, parse in variants.items():
+            ms, count = time_per_1000(parse, html, args.repeat)
+            results.append({'source': source, 'variant': label, 'listings': count, 'ms_per_1000_listings': round(ms, 2)})
+
+    baseline = {r['source']: r['ms_per_1000_listings'] for r in results if r['variant'].startswith('legacy')}
+    print(f"{'Źródło':<18}{'Wariant':<38}{'ms / 1000 ofert':>16}{'przyspieszenie':>16}")
+    for r in results:
+        speedup = baseline[r['source']] / r['ms_per_1000_listings']
+        r['speedup'] = round(speedup, 2)
+        print(f"{r['source']:<18}{r['variant']:<38}{r['ms_per_1000_listings']:>16.1f}{speedup:>15.2f}x")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+Test obciążeniowy HTTP API (api/api.py, api/async_api.py)
+
+Uruchamia lokalny serwer (lub korzysta z podanego adresu), a następnie przez zadany czas
+wysyła z kilku wątków mieszankę realistycznych żądań:
+- analyze-cv: CV z losowymi umiejętnościami z data/skills_database.csv,
+- career-path: losowe pary ról z data/roles_database.csv,
+- career-simulation: profile z losową rolą, umiejętnościami i horyzontem,
+- market-trends: odczyt rankingów (pamięć podręczna).
+
+Raportuje dla każdego punktu końcowego przepustowość, odsetek błędów i opóźnienia
+p50/p95/p99, a wyniki (z identyfikatorem commita) zapisuje jako JSON, aby porównywać
+je między wersjami (--compare).
+
+Użycie:
+    python benchmarks/load_test.py [--server flask|gunicorn|async] [--url http://host:port]
+        [--concurrency 16] [--duration 30] [--warmup 5] [--mix analyze-cv=4,career-path=3,...]
+        [--output wyniki.json] [--compare poprzednie.json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import requests
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.basename(ROOT_DIR)
+
+# Polecenia uruchamiające serwer (katalog roboczy - repozytorium, pakiet importowany z katalogu nadrzędnego)
+SERVERS = {
+    'flask': [sys.executable, '-m', f'{PACKAGE}.api.api'],
+    'gunicorn': [sys.executable, '-m', 'gunicorn', '-c', 'api/gunicorn.conf.py'],
+    'async': [sys.executable, '-m', f'{PACKAGE}.api.async_api']
+}
+
+# Domyślne udziały punktów końcowych w ruchu
+DEFAULT_MIX = {
+    'analyze-cv': 4,
+    'career-path': 3,
+    'career-simulation': 2,
+    'market-trends': 1
+}
+
+FILLER = (
+    "Odpowiedzialny za projektowanie i rozwój systemów, współpracę z zespołem oraz klientami. "
+    "Prowadzenie przeglądów kodu, dokumentacja i wdrożenia. "
+)
+LEVELS = ['ekspert', 'dobra znajomość', 'podstawy', '']
+
+class RequestFactory:
+    """Generuje treści żądań na podstawie katalogów umiejętności i ról z data/"""
+
+    def __init__(self, seed=42):
+        self.skills = pd.read_csv(os.path.join(ROOT_DIR, 'data', 'skills_database.csv'))
+        self.roles = pd.read_csv(os.path.join(ROOT_DIR, 'data', 'roles_database.csv'))
+        self.seed = seed
+
+    def rng(self, worker):
+        """Generator liczb losowych wątku (powtarzalny dla danego ziarna)"""
+        return random.Random(self.seed * 1000 + worker)
+
+    def build(self, endpoint, rng):
+        """
+        Tworzy żądanie
+
+        Returns:
+            Krotka (metoda HTTP, ścieżka, treść JSON lub None)
+        """
+        if endpoint == 'analyze-cv':
+            names = rng.sample(list(self.skills['skill_name']), rng.randint(2, min(8, len(self.skills))))
+            cv_text = FILLER * rng.randint(2, 10) + ', '.join(f"{rng.choice(LEVELS)} {name}" for name in names)
+            return 'POST', '/api/analyze-cv', {'cv_text': cv_text}
+
+        if endpoint == 'career-path':
+            current, target = rng.sample(list(self.roles['role_id']), 2)
+            return 'POST', '/api/career-path', {
+                'current_role_id': int(current), 'target_role_id': int(target), 'max_steps': rng.randint(2, 5)
+            }
+
+        if endpoint == 'career-simulation':
+            current, target = (self.roles.iloc[i] for i in rng.sample(range(len(self.roles)), 2))
+            skills = rng.sample(list(self.skills['skill_name']), rng.randint(1, 5))
+            return 'POST', '/api/career-simulation', {
+                'user_profile': {
+                    'current_role': {'name': current['role_name'], 'salary': int(current['avg_salary'])},
+                    'skills': [{'name': name} for name in skills],
+                    'experience': rng.randint(0, 10)
+                },
+                'target_role': {
+                    'name': target['role_name'],
+                    'required_skills': [
+                        {'name': name} for name in self.skills.loc[
+                            self.skills['skill_id'].isin(map(int, str(target['required_skills']).split(';'))), 'skill_name'
+                        ]
+                    ]
+                },
+                'years': rng.randint(1, 10)
+            }
+
+        if endpoint == 'market-trends':
+            return 'GET', '/api/market-trends', None
+
+        if endpoint == 'recommend-skills':
+            target = self.roles.iloc[rng.randrange(len(self.roles))]
+            return 'POST', '/api/recommend-skills', {
+                'current_skills': [int(skill) for skill in rng.sample(list(self.skills['skill_id']), 2)],
+                'target_role_id': int(target['role_id'])
+            }
+
+        raise ValueError(f"Nieznany punkt końcowy: {endpoint}")
+
+def parse_mix(text):
+    """Parsuje udziały punktów końcowych (np. 'analyze-cv=4,career-path=1')"""
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+def free_port():
+    """Zwraca wolny port TCP"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(kind, port, timeout):
+    """
+    Uruchamia serwer API i czeka na gotowość (/api/health/ready)
+
+    Returns:
+        Krotka (proces, adres bazowy)
+    """
+    env = dict(os.environ, API_HOST='127.0.0.1', API_PORT=str(port))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.dirname(ROOT_DIR), env.get('PYTHONPATH')]))
+    process = subprocess.Popen(SERVERS[kind], cwd=ROOT_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Serwer {kind} zakończył działanie (kod {process.returncode})")
+        try:
+            if requests.get(f"{url}/api/health/ready", timeout=1).status_code == 200:
+                return process, url
+        except requests.RequestException:
+            pass
+        time.sleep(0.25)
+
+    process.terminate()
+    raise RuntimeError(f"Serwer {kind} nie był gotowy w ciągu {timeout} s")
+
+def run_load(url, factory, mix, concurrency, duration, warmup, timeout):
+    """
+    Wysyła żądania z wątków przez warmup + duration sekund (pętla zamknięta)
+
+    Returns:
+        Lista próbek (punkt końcowy, kod HTTP lub None przy błędzie połączenia, opóźnienie w ms)
+        z okresu pomiaru (bez rozgrzewania)
+    """
+    endpoints = list(mix)
+    weights = [mix[name] for name in endpoints]
+    samples = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+    measure_from = start + warmup
+    stop_at = measure_from + duration
+
+    def worker(index):
+        rng = factory.rng(index)
+        session = requests.Session()
+        local = []
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                break
+            endpoint = rng.choices(endpoints, weights)[0]
+            method, path, body = factory.build(endpoint, rng)
+            sent = time.perf_counter()
+            try:
+                status = session.request(method, url + path, json=body, timeout=timeout).status_code
+            except requests.RequestException:
+                status = None
+            if sent >= measure_from:
+                local.append((endpoint, status, (time.perf_counter() - sent) * 1000))
+        with lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+def summarize(samples, duration):
+    """Podsumowanie próbek (przepustowość, błędy, percentyle opóźnień)"""
+    latencies = np.array([latency for _, _, latency in samples]) if samples else np.zeros(0)
+    statuses = {}
+    for _, status, _ in samples:
+        key = str(status) if status is not None else 'connection_error'
+        statuses[key] = statuses.get(key, 0) + 1
+    errors = sum(count for key, count in statuses.items() if not key.startswith('2') and key != '304')
+
+    summary = {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        'throughput_rps': round(len(samples) / duration, 2),
+        'status_codes': statuses
+    }
+    if len(latencies):
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        summary['latency_ms'] = {
+            'mean': round(float(latencies.mean()), 2),
+            'p50': round(float(p50), 2),
+            'p95': round(float(p95), 2),
+            'p99': round(float(p99), 2),
+            'max': round(float(latencies.max()), 2)
+        }
+    return summary
+
+def git_commit():
+    """Identyfikator commita repozytorium (z oznaczeniem niezatwierdzonych zmian)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def print_report(report, baseline=None):
+    """Wypisuje tabelę wyników (opcjonalnie ze zmianą względem poprzedniego pomiaru)"""
+    header = f"{'Punkt końcowy':<20}{'żądania':>9}{'żąd./s':>9}{'błędy':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    if baseline:
+        header += f"{'Δ żąd./s':>10}{'Δ p95':>9}"
+    print(header)
+
+    rows = dict(report['endpoints'], **{'RAZEM': report['overall']})
+    for name, stats in rows.items():
+        latency = stats.get('latency_ms', {})
+        line = (f"{name:<20}{stats['requests']:>9}{stats['throughput_rps']:>9.1f}{stats['error_rate']:>7.1%}"
+                f"{latency.get('p50', float('nan')):>9.1f}{latency.get('p95', float('nan')):>9.1f}"
+                f"{latency.get('p99', float('nan')):>9.1f}")
+        if baseline:
+            previous = baseline['overall'] if name == 'RAZEM' else baseline['endpoints'].get(name)
+            if previous and previous.get('throughput_rps') and previous.get('latency_ms') and latency:
+                line += (f"{stats['throughput_rps'] / previous['throughput_rps'] - 1:>+10.1%}"
+                         f"{latency['p95'] / previous['latency_ms']['p95'] - 1:>+9.1%}")
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description='Test obciążeniowy HTTP API')
+    parser.add_argument('--server', choices=sorted(SERVERS), default='flask', help='Uruchamiany serwer')
+    parser.add_argument('--url', help='Adres działającego serwera (bez uruchamiania własnego)')
+    parser.add_argument('--concurrency', type=int, default=16, help='Liczba jednoczesnych klientów')
+    parser.add_argument('--duration', type=float, default=30, help='Czas pomiaru (s)')
+    parser.add_argument('--warmup', type=float, default=5, help='Czas rozgrzewania, nieliczony (s)')
+    parser.add_argument('--mix', help='Udziały punktów końcowych, np. analyze-cv=4,career-path=3,market-trends=1')
+    parser.add_argument('--seed', type=int, default=42, help='Ziarno generatora żądań')
+    parser.add_argument('--timeout', type=float, default=30, help='Limit czasu żądania (s)')
+    parser.add_argument('--startup-timeout', type=float, default=120, help='Limit czasu uruchamiania serwera (s)')
+    parser.add_argument('--output', help='Plik JSON z wynikami (domyślnie output/load_tests/load_<commit>_<czas>.json)')
+    parser.add_argument('--compare', help='Plik JSON z poprzednimi wynikami do porównania')
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    factory = RequestFactory(seed=args.seed)
+    for endpoint in mix:
+        factory.build(endpoint, factory.rng(0))
+
+    process = None
+    url = args.url
+    if url is None:
+        process, url = start_server(args.server, free_port(), args.startup_timeout)
+        print(f"Serwer {args.server} gotowy: {url}")
+
+    try:
+        samples = run_load(url, factory, mix, args.concurrency, args.duration, args.warmup, args.timeout)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+
+    commit = git_commit()
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': commit,
+            'server': 'external' if args.url else args.server,
+            'url': url,
+            'concurrency': args.concurrency,
+            'duration': args.duration,
+            'warmup': args.warmup,
+            'mix': mix,
+            'seed': args.seed,
+            'python': platform.python_version(),
+            'cpu_count': os.cpu_count()
+        },
+        'overall': summarize(samples, args.duration),
+        'endpoints': {
+            endpoint: summarize([sample for sample in samples if sample[0] == endpoint], args.duration)
+            for endpoint in mix
+        }
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"Porównanie z {baseline['meta']['commit']} ({baseline['meta']['timestamp']})")
+    print_report(report, baseline)
+
+    output = args.output or os.path.join(
+        ROOT_DIR, 'output', 'load_tests', f"load_{commit}_{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+    print(f"Wyniki zapisano w {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Test scrapera (MarketTrends.scrape_job_listings) na lokalnym serwerze HTTP z zapisanymi stronami
+
+Serwer http.server udostępnia strony z benchmarks/fixtures, a adaptery pracuj.pl i
+nofluffjobs.com są rejestrowane z adresem lokalnym (register_source). Scraper przechodzi
+całą ścieżkę: pula wątków, sesje per host, parsowanie i usuwanie duplikatów (ta sama
+strona dla każdego słowa kluczowego). Sprawdza liczbę ofert z każdego źródła i liczbę
+żądań do serwera, następnie raportuje czas zbierania.
+
+Użycie:
+    python benchmarks/scrape_stub.py [--keywords python,java] [--repeat 5] [--output wyniki.json]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.market_trends import ListingFetcher, MarketTrends
+from modules.scraper_adapters import NoFluffJobsAdapter, PracujPlAdapter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Źródło -> (plik strony, klasa adaptera)
+FIXTURES = {
+    'pracuj.pl': ('pracuj_pl.html', PracujPlAdapter),
+    'nofluffjobs.com': ('nofluffjobs.html', NoFluffJobsAdapter)
+}
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Udostępnia zapisane strony (parametry zapytania są pomijane) i zlicza żądania"""
+
+    requests_seen = Counter()
+
+    def do_GET(self):
+        FixtureHandler.requests_seen[self.path.split('?')[0]] += 1
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+def start_server():
+    """Uruchamia serwer na wolnym porcie w wątku w tle i zwraca go"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(FixtureHandler, directory=FIXTURES_DIR))
+    threading.Thread(target=server.serve_forever, name='scrape-stub', daemon=True).start()
+    return server
+
+def expected_counts():
+    """Liczba unikalnych ofert na każdej zapisanej stronie (parsowanie adapterem bez serwera)"""
+    counts = {}
+    for source, (filename, adapter_cls) in FIXTURES.items():
+        with open(os.path.join(FIXTURES_DIR, filename), 'rb') as f:
+            listings = adapter_cls().parse(f.read(), limit=10 ** 6)
+        counts[source] = len({MarketTrends.listing_fingerprint(listing) for listing in listings})
+    return counts
+
+def make_market_trends(base_url):
+    """MarketTrends z adapterami kierującymi na lokalny serwer (bez odstępów między żądaniami)"""
+    market_trends = MarketTrends(fetcher=ListingFetcher(min_request_interval=0))
+    for filename, adapter_cls in FIXTURES.values():
+        market_trends.register_source(adapter_cls(url_template=f"{base_url}/{filename}?q={{keyword}}"))
+    return market_trends
+
+def check_scrape(listings, expected, keywords):
+    """Sprawdza liczbę ofert z każdego źródła i liczbę żądań (AssertionError przy różnicy)"""
+    actual = listings['source'].value_counts().to_dict()
+    for source, count in expected.items():
+        assert actual.get(source, 0) == count, f"{source}: {actual.get(source, 0)} ofert, oczekiwano {count}"
+    assert set(actual) <= set(expected), f"Nieoczekiwane źródła: {sorted(set(actual) - set(expected))}"
+
+    for filename, _ in FIXTURES.values():
+        seen = FixtureHandler.requests_seen[f"/{filename}"]
+        assert seen == len(keywords), f"/{filename}: {seen} żądań, oczekiwano {len(keywords)}"
+
+def main():
+    parser = argparse.ArgumentParser(description='Test scrapera na lokalnym serwerze HTTP')
+    parser.add_argument('--keywords', default='python,java', help='Słowa kluczowe oddzielone przecinkami')
+    parser.add_argument('--repeat', type=int, default=5, help='Liczba pomiarów czasu zbierania')
+    parser.add_argument('--output', help='Ścieżka do pliku JSON z wynikami')
+    args = parser.parse_args()
+
+    keywords = [keyword.strip() for keyword in args.keywords.split(',')]
+    expected = expected_counts()
+    # Limit na parę źródło-słowo kluczowe obejmuje całą stronę (razem z duplikatami na stronie)
+    limit = 10 ** 6
+
+    server = start_server()
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        timings = []
+        for run in range(args.repeat + 1):
+            market_trends = make_market_trends(base_url)
+            FixtureHandler.requests_seen.clear()
+            start = time.perf_counter()
+            listings = market_trends.scrape_job_listings(sources=list(FIXTURES), keywords=keywords, limit=limit)
+            elapsed = time.perf_counter() - start
+            check_scrape(listings, expected, keywords)
+            # Pierwszy przebieg rozgrzewa importy i parser
+            if run:
+                timings.append(elapsed)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"Poprawność: {', '.join(f'{source} {count} ofert' for source, count in expected.items())} "
+          f"({len(keywords)} słowa kluczowe, duplikaty usunięte)")
+    result = {
+        'keywords': keywords,
+        'listings': expected,
+        'median_s': round(sorted(timings)[len(timings) // 2], 4) if timings else None
+    }
+    if timings:
+        print(f"Zbieranie z lokalnego serwera: mediana {result['median_s'] * 1000:.1f} ms ({args.repeat} pomiarów)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=4)
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,26 @@ API_CONFIG = {
     'host': os.getenv('API_HOST', '0.0.0.0'),
     'port': int(os.getenv('API_PORT', 5000)),
     'debug': os.getenv('API_DEBUG', 'False').lower() == 'true',
-    'secret_key': os.getenv('SECRET_KEY', 'tajny-klucz-domyslny-zmienic-w-produkcji')
+    'secret_key': os.getenv('SECRET_KEY', 'tajny-klucz-domyslny-zmienic-w-produkcji'),
+    # Serwer produkcyjny (api/gunicorn.conf.py): 0 procesów roboczych - liczba rdzeni
+    'workers': int(os.getenv('API_WORKERS', 0)),
+    'threads': int(os.getenv('API_THREADS', 4)),
+    'timeout': int(os.getenv('API_TIMEOUT', 120)),
+    # Asynchroniczne API (api/async_api.py): pula procesów i limit oczekujących zadań
+    'process_workers': int(os.getenv('API_PROCESS_WORKERS', 0)),
+    'max_pending': int(os.getenv('API_MAX_PENDING', 64)),
+    # Pamięć podręczna odpowiedzi: czas życia (s), liczba wpisów, katalog współdzielony przez procesy ('' - brak)
+    'cache_ttl': int(os.getenv('API_CACHE_TTL', 300)),
+    'cache_entries': int(os.getenv('API_CACHE_ENTRIES', 512)),
+    'cache_dir': os.getenv('API_CACHE_DIR', ''),
+    # Kolejka zadań w tle (/api/jobs): baza SQLite, liczba równoległych zadań, czas przechowywania wyników (s)
+    'jobs_db': os.getenv('API_JOBS_DB', 'output/jobs.db'),
+    'jobs_workers': int(os.getenv('API_JOBS_WORKERS', 2)),
+    'jobs_result_ttl': int(os.getenv('API_JOBS_RESULT_TTL', 3600)),
+    # Łączenie współbieżnych żądań /api/analyze-cv w partie: maksymalny rozmiar (1 - wyłączone),
+    # maksymalny czas zbierania (ms) - tylko gdy wykonuje się inna partia
+    'batch_max_size': int(os.getenv('API_BATCH_MAX_SIZE', 32)),
+    'batch_max_wait_ms': float(os.getenv('API_BATCH_MAX_WAIT_MS', 5))
 }
 
 # Ścieżki do modeli
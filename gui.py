@@ -1414,94 +1414,14 @@ INSTRUCTIONS FOR CAREER PATH GENERATOR:
             # Pobierz obecną rolę z profilu użytkownika lub ustaw domyślną
             current_role = self.user_profile.get('current_role', 'Junior Developer')
             
-            # Określ częstotliwość zmiany pracy na podstawie strategii
-            if "częsta" in job_change_strategy.lower():
-                job_change_rate = 1.5  # co 1.5 roku
-            elif "umiarkowana" in job_change_strategy.lower():
-                job_change_rate = 2.5  # co 2.5 roku
-            else:  # długoterminowa
-                job_change_rate = 4.0  # co 4 lata
-            
-            # Zainicjuj parametry symulacji
-            events = []
-            current_time = 0.0
-            current_salary = self._get_salary_for_role(current_role)
-            current_skills = self.user_profile.get('skills', [])
-            if not current_skills:
-                current_skills = ["Programming", "Basic IT"]  # domyślne umiejętności
-            
-            # Dodaj wydarzenie początkowe
-            events.append({
-                'time': 0,
-                'role': current_role,
-                'salary': current_salary,
-                'skills': current_skills.copy(),
-                'event': 'Start of simulation'
-            })
-            
-            # Symuluj ścieżkę kariery
-            while current_time < time_frame:
-                # Postęp nauki zależy od intensywności
-                learning_progress = learning_intensity / 10.0  # Od 0.1 do 1.0
-                
-                # Upływ czasu do następnego wydarzenia
-                next_time_increment = min(0.5, time_frame - current_time)  # Maksymalnie pół roku
-                current_time += next_time_increment
-                
-                # Dodaj nowe umiejętności z określonym prawdopodobieństwem
-                if random.random() < learning_progress * next_time_increment:
-                    new_skill = self._get_random_skill_for_career(target_role)
-                    if new_skill and new_skill not in current_skills:
-                        current_skills.append(new_skill)
-                        events.append({
-                            'time': round(current_time, 1),
-                            'role': current_role,
-                            'salary': current_salary,
-                            'skills': current_skills.copy(),
-                            'event': f'Acquired skill: {new_skill}'
-                        })
-                
-                # Sprawdź możliwość zmiany pracy
-                if len(events) > 1 and (current_time - events[0]['time']) >= job_change_rate and random.random() < 0.3:
-                    old_role = current_role
-                    current_role = self._get_next_career_step(current_role, target_role, current_time / time_frame)
-                    new_salary = self._get_salary_for_role(current_role)
-                    
-                    # Dodaj wydarzenie zmiany pracy
-                    current_salary = new_salary
-                    events.append({
-                        'time': round(current_time, 1),
-                        'role': current_role,
-                        'salary': current_salary,
-                        'skills': current_skills.copy(),
-                        'event': f'Job change: {old_role} → {current_role}'
-                    })
-            
-            # Dodaj wydarzenie końcowe, jeśli ostatnie wydarzenie nie jest blisko końca symulacji
-            if abs(events[-1]['time'] - time_frame) > 0.1:
-                events.append({
-                    'time': time_frame,
-                    'role': current_role,
-                    'salary': current_salary,
-                    'skills': current_skills,
-                    'event': 'End of simulation'
-                })
-            
-            # Oblicz wzrost wynagrodzenia
-            initial_salary = events[0]['salary']
-            final_salary = events[-1]['salary']
-            salary_growth = ((final_salary / initial_salary) - 1) * 100 if initial_salary > 0 else 0
-            
-            # Przygotuj wyniki
-            results = {
-                'events': events,
-                'initial_role': events[0]['role'],
-                'final_role': events[-1]['role'],
-                'initial_salary': initial_salary,
-                'final_salary': final_salary,
-                'salary_growth': round(salary_growth, 1),
-                'skills_acquired': len(events[-1]['skills']) - len(events[0]['skills'])
-            }
+            # Wspólny silnik symulacji z modules/career_simulator.py
+            results = self.navigator.career_simulator.simulate_career_timelines(
+                current_role, target_role,
+                time_frame=time_frame,
+                learning_intensity=learning_intensity,
+                job_change_strategy=job_change_strategy,
+                current_skills=self.user_profile.get('skills', [])
+            )[0]
             
             # Aktualizuj UI w głównym wątku
             self.root.after(0, lambda: self.display_simulation_results(results))
@@ -1511,71 +1431,6 @@ INSTRUCTIONS FOR CAREER PATH GENERATOR:
             error_msg = f"Error during simulation: {str(e)}"
             self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
 
-    def _get_salary_for_role(self, role):
-        """Returns an approximate salary for a given role"""
-        # Podstawowe wynagrodzenia dla różnych poziomów
-        base_salaries = {
-            'Junior': 7000,
-            'Mid': 12000,
-            'Senior': 18000,
-            'Lead': 22000,
-            'Manager': 25000,
-            'Architect': 28000,
-            'Director': 35000,
-            'CTO': 45000
-        }
-        
-        # Sprawdź, czy rola zawiera któryś z kluczy
-        role_lower = role.lower()
-        for level, salary in base_salaries.items():
-            if level.lower() in role_lower:
-                # Dodaj losową wariację +/- 10%
-                variation = random.uniform(0.9, 1.1)
-                return int(salary * variation)
-        
-        # Domyślne wynagrodzenie, jeśli nie znaleziono dopasowania
-        return 10000
-
-    def _get_random_skill_for_career(self, target_role):
-        """Returns a random skill useful for a given career path"""
-        # Typowe umiejętności dla różnych ścieżek kariery
-        skills_by_path = {
-            'java': ["Java", "Spring", "Hibernate", "Maven", "JUnit", "SQL", "Design Patterns", "Microservices"],
-            'python': ["Python", "Django", "Flask", "Pandas", "NumPy", "SQL", "REST API", "Git"],
-            'frontend': ["HTML", "CSS", "JavaScript", "React", "Angular", "TypeScript", "Webpack", "UI/UX"],
-            'backend': ["Design Patterns", "REST API", "Databases", "Caching", "Security", "Containerization", "Microservices"],
-            'devops': ["Docker", "Kubernetes", "Jenkins", "AWS", "Terraform", "Ansible", "Linux", "Monitoring"],
-            'data': ["SQL", "Python", "Data Analysis", "Data Visualization", "Statistics", "ETL", "Big Data"],
-            'ai': ["Machine Learning", "TensorFlow", "PyTorch", "NLP", "Computer Vision", "Statistics", "Deep Learning"],
-            'architect': ["System Design", "Scalability", "Performance Optimization", "Security", "Cloud Architecture"],
-            'manager': ["Team Leadership", "Project Management", "Agile", "Communication", "Budget Planning", "Risk Management"]
-        }
-        
-        # Znajdź odpowiednią kategorię umiejętności na podstawie roli docelowej
-        target_lower = target_role.lower()
-        relevant_skills = []
-        
-        for path, skills in skills_by_path.items():
-            if path in target_lower:
-                relevant_skills.extend(skills)
-        
-        # Jeśli nie znaleziono specyficznych umiejętności, użyj wspólnych
-        if not relevant_skills:
-            relevant_skills = [
-                "Communication", "Problem Solving", "Teamwork", "Git", 
-                "HTTP", "REST API", "Documentation", "Testing", "Debugging"
-            ]
-        
-        # Dodaj umiejętności miękkie
-        soft_skills = [
-            "Communication", "Teamwork", "Time Management", "Critical Thinking",
-            "Presentation", "Negotiation", "Conflict Management", "Mentoring"
-        ]
-        
-        # Połącz wszystkie umiejętności i wybierz losową
-        all_skills = list(set(relevant_skills + soft_skills))
-        return random.choice(all_skills) if all_skills else None
-
     def clear_simulation_form(self):
         """Clears the career simulation form"""
         self.sim_target_role_var.set("")
@@ -1599,14 +1454,14 @@ INSTRUCTIONS FOR CAREER PATH GENERATOR:
         for widget in self.sim_chart_frame.winfo_children():
             widget.destroy()
         
-        # Wypełnij tabelę szczegółów
-        for event in results['events']:
+        # Wypełnij tabelę szczegółów (wydarzenia przechowują tylko przyrosty umiejętności)
+        for event, skills in self.navigator.career_simulator.iter_event_skills(results['events']):
             salary_eur = round(event['salary'] / 4.5, 2)  # Convert PLN to EUR
             self.sim_tree.insert('', 'end', values=(
                 event['time'],
                 event['role'],
                 f"{salary_eur:.2f} EUR",
-                ", ".join(event['skills'][:3]) + ("..." if len(event['skills']) > 3 else ""),
+                ", ".join(skills[:3]) + ("..." if len(skills) > 3 else ""),
                 event['event']
             ))
         
@@ -2008,14 +1863,14 @@ INSTRUCTIONS FOR MARKET TRENDS ANALYSIS:
         for widget in self.sim_chart_frame.winfo_children():
             widget.destroy()
         
-        # Wypełnij tabelę szczegółów
-        for event in results['events']:
+        # Wypełnij tabelę szczegółów (wydarzenia przechowują tylko przyrosty umiejętności)
+        for event, skills in self.navigator.career_simulator.iter_event_skills(results['events']):
             salary_eur = round(event['salary'] / 4.5, 2)  # Convert PLN to EUR
             self.sim_tree.insert('', 'end', values=(
                 event['time'],
                 event['role'],
                 f"{salary_eur:.2f} EUR",
-                ", ".join(event['skills'][:3]) + ("..." if len(event['skills']) > 3 else ""),
+                ", ".join(skills[:3]) + ("..." if len(skills) > 3 else ""),
                 event['event']
             ))
         
@@ -2115,283 +1970,6 @@ INSTRUCTIONS FOR MARKET TRENDS ANALYSIS:
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
-    def simulate_career_progress(self, target_role, time_frame, learning_intensity, job_change_strategy):
-        """Simulates career progress based on given parameters"""
-        import random
-        
-        # Określenie strategii zmiany pracy w miesiącach
-        if "częsta" in job_change_strategy.lower():
-            job_change_interval = random.randint(12, 24)  # co 1-2 lata
-        elif "umiarkowana" in job_change_strategy.lower():
-            job_change_interval = random.randint(24, 36)  # co 2-3 lata
-        else:  # długoterminowa
-            job_change_interval = random.randint(36, 60)  # co 3-5 lat
-        
-        # Pobierz dane użytkownika, jeśli są dostępne
-        current_role = "Junior Developer"  # domyślnie
-        current_salary = 6000  # domyślnie
-        current_skills = ["Programming", "Problem Solving"]  # domyślnie
-        
-        if hasattr(self, 'user_profile') and self.user_profile:
-            current_role = self.user_profile.get('current_role', current_role)
-            current_salary = self.user_profile.get('salary_expectation', current_salary)
-            current_skills = self.user_profile.get('skills', current_skills)
-        
-        # Dostosuj współczynnik nauki na podstawie intensywności
-        learning_factor = learning_intensity / 10.0  # 0.1 - 1.0
-        
-        # Rezultaty symulacji
-        events = []
-        current_time = 0.0  # w latach
-        
-        # Dodaj początkowe wydarzenie
-        events.append({
-            'time': current_time,
-            'role': current_role,
-            'salary': current_salary,
-            'skills': current_skills.copy(),
-            'event': "Start of simulation"
-        })
-        
-        # Symuluj w czasie
-        while current_time < time_frame:
-            # Czas do następnego wydarzenia (w latach)
-            next_event_time = random.uniform(0.25, 0.5)  # co 3-6 miesięcy
-            current_time += next_event_time
-            current_time = round(current_time, 2)  # zaokrąglenie do 2 miejsc po przecinku
-            
-            if current_time > time_frame:
-                current_time = time_frame
-            
-            # Czy to czas na zmianę pracy?
-            months_passed = int(current_time * 12)
-            job_change = (months_passed % job_change_interval) < 3  # Jeśli jesteśmy blisko interwału zmiany pracy
-            
-            # Nauka nowych umiejętności
-            if random.random() < learning_factor:
-                new_skill = self.generate_random_skill(current_skills)
-                current_skills.append(new_skill)
-                
-                events.append({
-                    'time': current_time,
-                    'role': current_role,
-                    'salary': current_salary,
-                    'skills': current_skills.copy(),
-                    'event': f"Acquired skill: {new_skill}"
-                })
-            
-            # Zmiana pracy
-            elif job_change and current_time > 1.0:  # Nie zmieniaj pracy w pierwszym roku
-                # Nowa rola i płaca
-                new_role = self.generate_next_role(current_role, target_role, current_time / time_frame)
-                salary_increase = random.uniform(0.10, 0.25)  # 10-25% podwyżki
-                new_salary = int(current_salary * (1 + salary_increase))
-                
-                # Aktualizuj stan
-                current_role = new_role
-                current_salary = new_salary
-                
-                events.append({
-                    'time': current_time,
-                    'role': current_role,
-                    'salary': current_salary,
-                    'skills': current_skills.copy(),
-                    'event': "Job change"
-                })
-            
-            # Podwyżka w obecnej pracy
-            elif random.random() < 0.3 and (current_time - events[-1]['time']) > 0.8:  # 30% szans na podwyżkę po 10 miesiącach
-                salary_increase = random.uniform(0.03, 0.08)  # 3-8% podwyżki
-                current_salary = int(current_salary * (1 + salary_increase))
-                
-                events.append({
-                    'time': current_time,
-                    'role': current_role,
-                    'salary': current_salary,
-                    'skills': current_skills.copy(),
-                    'event': "Salary increase"
-                })
-            
-            # Awans
-            elif random.random() < 0.2 and (current_time - events[-1]['time']) > 1.5:  # 20% szans na awans po 1.5 roku
-                if "Senior" not in current_role and "Lead" not in current_role:
-                    if "Junior" in current_role:
-                        current_role = current_role.replace("Junior", "Mid")
-                    elif "Mid" in current_role:
-                        current_role = current_role.replace("Mid", "Senior")
-                    else:
-                        current_role = "Senior " + current_role
-                    
-                    salary_increase = random.uniform(0.15, 0.20)  # 15-20% podwyżki
-                    current_salary = int(current_salary * (1 + salary_increase))
-                    
-                    events.append({
-                        'time': current_time,
-                        'role': current_role,
-                        'salary': current_salary,
-                        'skills': current_skills.copy(),
-                        'event': "Promotion"
-                    })
-            
-            # Jeśli osiągnięto cel przed końcem symulacji
-            if current_role == target_role and current_time < time_frame:
-                events.append({
-                    'time': current_time,
-                    'role': current_role,
-                    'salary': current_salary,
-                    'skills': current_skills.copy(),
-                    'event': "Achieved target role"
-                })
-                break
-        
-        # Dodaj końcowe wydarzenie, jeśli potrzeba
-        if events[-1]['time'] < time_frame:
-            events.append({
-                'time': time_frame,
-                'role': current_role,
-                'salary': current_salary,
-                'skills': current_skills.copy(),
-                'event': "End of simulation"
-            })
-        
-        # Oblicz wzrost wynagrodzenia
-        initial_salary = events[0]['salary']
-        final_salary = events[-1]['salary']
-        salary_growth = round(((final_salary / initial_salary) - 1) * 100)
-        
-        return {
-            'events': events,
-            'salary_growth': salary_growth
-        }
-
-    def generate_random_skill(self, current_skills):
-        """Generates a random skill not yet on the list"""
-        # Comprehensive list of programming skills
-        all_skills = {
-            "Programming Languages": [
-                "Python", "Java", "JavaScript", "C++", "C#", "Ruby", "PHP", "Swift", 
-                "Kotlin", "Go", "Rust", "TypeScript", "Scala", "R", "MATLAB", "Perl",
-                "Haskell", "Lua", "Dart", "Groovy", "Assembly", "COBOL", "Fortran",
-                "Visual Basic", "ObjectiveC", "Delphi"
-            ],
-            "Web Technologies": [
-                "HTML5", "CSS3", "SASS/SCSS", "JavaScript", "TypeScript", "WebGL",
-                "WebAssembly", "PWA", "Web Components", "Web Sockets", "Web Workers",
-                "Service Workers"
-            ],
-            "Frontend Frameworks": [
-                "React", "Angular", "Vue.js", "Svelte", "Next.js", "Nuxt.js", 
-                "Gatsby", "jQuery", "Bootstrap", "Tailwind CSS", "Material-UI",
-                "Chakra UI", "Redux", "MobX", "Ember.js"
-            ],
-            "Backend Frameworks": [
-                "Node.js", "Express.js", "Django", "Flask", "FastAPI", "Spring Boot",
-                "Laravel", "Ruby on Rails", "ASP.NET Core", "Phoenix", "NestJS",
-                "Strapi", "Symfony", "CodeIgniter"
-            ],
-            "Databases": [
-                "MySQL", "PostgreSQL", "MongoDB", "Redis", "SQLite", "Oracle",
-                "Microsoft SQL Server", "Cassandra", "DynamoDB", "Neo4j", "CouchDB",
-                "Elasticsearch", "MariaDB", "Firebase"
-            ],
-            "Cloud & DevOps": [
-                "AWS", "Azure", "Google Cloud", "Docker", "Kubernetes", "Jenkins",
-                "GitLab CI/CD", "Travis CI", "CircleCI", "Terraform", "Ansible",
-                "Puppet", "Chef", "Vagrant", "ECS", "EKS", "OpenShift"
-            ],
-            "AI & Machine Learning": [
-                "TensorFlow", "PyTorch", "Keras", "Scikit-learn", "OpenCV",
-                "NLTK", "Pandas", "NumPy", "SciPy", "Matplotlib", "Seaborn",
-                "XGBoost", "LightGBM", "Hugging Face", "Fast.ai", "MLflow"
-            ],
-            "Mobile Development": [
-                "React Native", "Flutter", "Xamarin", "Ionic", "Android SDK",
-                "iOS SDK", "SwiftUI", "Kotlin Multiplatform", "Capacitor",
-                "PhoneGap", "Unity Mobile"
-            ],
-            "Tools & Version Control": [
-                "Git", "GitHub", "GitLab", "Bitbucket", "SVN", "Mercurial",
-                "JIRA", "Confluence", "Trello", "Notion", "VS Code", "IntelliJ IDEA",
-                "Eclipse", "PyCharm", "WebStorm"
-            ],
-            "Testing & QA": [
-                "Jest", "Mocha", "Cypress", "Selenium", "JUnit", "PyTest",
-                "TestNG", "Karma", "Jasmine", "Robot Framework", "Postman",
-                "SoapUI", "LoadRunner", "JMeter"
-            ],
-            "Architecture & Patterns": [
-                "Microservices", "REST API", "GraphQL", "SOAP", "MVC", "MVVM",
-                "Clean Architecture", "Domain-Driven Design", "Event-Driven Architecture",
-                "Serverless", "SOA", "Design Patterns"
-            ],
-            "Methodologies & Practices": [
-                "Agile", "Scrum", "Kanban", "XP", "TDD", "BDD", "DevOps",
-                "CI/CD", "Code Review", "Pair Programming", "Clean Code",
-                "SOLID Principles"
-            ]
-        }
-        
-        # Flatten the skills dictionary into a single list
-        all_skills_list = [skill for category in all_skills.values() for skill in category]
-        
-        # Remove skills user already has
-        available_skills = [skill for skill in all_skills_list if skill not in current_skills]
-        
-        # If all skills are taken, return advanced message
-        if not available_skills:
-            return "Advanced professional skills"
-        
-        return random.choice(available_skills)
-
-    def generate_next_role(self, current_role, target_role, progress_factor):
-        """Generates the next role on the career path"""
-        # Ścieżki kariery dla różnych specjalizacji
-        career_paths = {
-            "Developer": ["Junior Developer", "Mid Developer", "Senior Developer", "Lead Developer", "Software Architect"],
-            "Frontend": ["Junior Frontend Dev", "Frontend Developer", "Senior Frontend Dev", "Frontend Lead", "UI/UX Architect"],
-            "Backend": ["Junior Backend Dev", "Backend Developer", "Senior Backend Dev", "Backend Lead", "System Architect"],
-            "Data": ["Data Analyst", "Data Engineer", "Senior Data Engineer", "Data Scientist", "Head of Data"],
-            "DevOps": ["DevOps Engineer", "Senior DevOps", "DevOps Lead", "Cloud Architect", "Head of Infrastructure"]
-        }
-        
-        # Określ ścieżkę kariery na podstawie obecnej roli
-        path_key = None
-        for key in career_paths:
-            if key.lower() in current_role.lower() or key.lower() in target_role.lower():
-                path_key = key
-                break
-        
-        if not path_key:
-            path_key = "Developer"  # domyślna ścieżka
-        
-        path = career_paths[path_key]
-        
-        # Znajdź obecną pozycję na ścieżce
-        current_index = -1
-        for i, role in enumerate(path):
-            if role.lower() in current_role.lower():
-                current_index = i
-                break
-        
-        if current_index == -1:
-            current_index = 0  # jeśli nie znaleziono, zacznij od początku
-        
-        # Znajdź docelową pozycję
-        target_index = len(path) - 1  # domyślnie koniec ścieżki
-        for i, role in enumerate(path):
-            if role.lower() in target_role.lower():
-                target_index = i
-                break
-        
-        # Oblicz następny indeks na podstawie postępu
-        next_index = min(current_index + 1, target_index)
-        
-        # Jeśli jesteśmy blisko końca symulacji, daj szansę na osiągnięcie celu
-        if progress_factor > 0.8 and random.random() > 0.5:
-            next_index = target_index
-        
-        return path[next_index]
-
     def on_closing(self):
         """Handle window closing event"""
         try:
@@ -2940,56 +2518,6 @@ INSTRUCTIONS FOR CAREER SIMULATION:
             logger.error(f"Error applying translations: {str(e)}")
             messagebox.showerror("Error", "Failed to apply translations")
 
-    def _get_next_career_step(self, current_role, target_role, progress):
-        """Determines the next career step based on current role and target role"""
-        # Career progression paths
-        career_paths = {
-            'developer': ['Junior Developer', 'Mid Developer', 'Senior Developer', 'Lead Developer', 'Solution Architect'],
-            'frontend': ['Junior Frontend', 'Frontend Developer', 'Senior Frontend', 'Frontend Lead', 'UI/UX Architect'],
-            'backend': ['Junior Backend', 'Backend Developer', 'Senior Backend', 'Backend Lead', 'System Architect'],
-            'data': ['Junior Data Analyst', 'Data Analyst', 'Data Engineer', 'Senior Data Engineer', 'Data Architect'],
-            'devops': ['Junior DevOps', 'DevOps Engineer', 'Senior DevOps', 'DevOps Lead', 'Cloud Architect'],
-            'manager': ['Team Lead', 'Project Manager', 'Senior PM', 'Program Manager', 'Director'],
-        }
-
-        # Determine the relevant career path
-        path_key = None
-        for key in career_paths:
-            if key in current_role.lower() or key in target_role.lower():
-                path_key = key
-                break
-
-        if not path_key:
-            # Use default developer path if no specific path is found
-            path_key = 'developer'
-
-        career_path = career_paths[path_key]
-
-        # Find current position in the path
-        current_index = -1
-        for i, role in enumerate(career_path):
-            if role.lower() in current_role.lower():
-                current_index = i
-                break
-
-        if current_index == -1:
-            current_index = 0  # Start from beginning if current role not found
-
-        # Find target position
-        target_index = len(career_path) - 1  # Default to end of path
-        for i, role in enumerate(career_path):
-            if role.lower() in target_role.lower():
-                target_index = i
-                break
-
-        # Calculate next step based on progress
-        if progress > 0.8 and random.random() > 0.7:  # Chance for bigger jump near end
-            next_index = min(current_index + 2, target_index)
-        else:
-            next_index = min(current_index + 1, target_index)
-
-        return career_path[next_index]
-
     def load_icons(self):
         """Load icons from local files or URLs"""
         # Create simple text-based icons as fallback
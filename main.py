@@ -2,12 +2,11 @@ import os
 import logging
 import argparse
 import json
+import threading
 from datetime import datetime
 
-from modules.skills_analyzer import SkillsAnalyzer
-from modules.market_trends import MarketTrends
-from modules.career_path import CareerPathGenerator
-from modules.career_simulator import CareerSimulator
+# Moduły analityczne (pandas, spaCy, scikit-learn, networkx) są importowane przy tworzeniu
+# komponentów, aby uruchomienie CLI ładowało tylko to, czego używa dana ścieżka
 from config.config import MODEL_PATHS, API_CONFIG
 
 # Konfiguracja logowania
@@ -23,26 +22,63 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class AICareerNavigator:
-    """Główna klasa systemu AI Career Navigator"""
+    """
+    Główna klasa systemu AI Career Navigator
+    
+    Komponenty są tworzone przy pierwszym użyciu (właściwości), więc np. analiza samego
+    profilu nie ładuje modelu spaCy, a import modułu nie ładuje bibliotek analitycznych.
+    """
     
     def __init__(self):
         """Inicjalizacja systemu"""
         logger.info("Inicjalizacja AI Career Navigator")
         
-        # Inicjalizacja komponentów
-        self.skills_analyzer = self._init_skills_analyzer()
-        self.market_trends = self._init_market_trends()
-        self.career_path_generator = self._init_career_path_generator()
-        self.career_simulator = self._init_career_simulator()
-        self.market_trends_analyzer = MarketTrends()
+        # Komponenty tworzone przy pierwszym użyciu (GUI korzysta z nich z wątków roboczych)
+        self._components = {}
+        self._components_lock = threading.RLock()
         
         # Załaduj dane
         self.load_data()
         
         logger.info("Inicjalizacja systemu zakończona")
     
+    def _component(self, name, factory):
+        """Zwraca komponent, tworząc go przy pierwszym użyciu"""
+        with self._components_lock:
+            if name not in self._components:
+                self._components[name] = factory()
+            return self._components[name]
+    
+    @property
+    def skills_analyzer(self):
+        """Analizator umiejętności (model spaCy)"""
+        return self._component('skills_analyzer', self._init_skills_analyzer)
+    
+    @property
+    def market_trends(self):
+        """Analizator trendów rynkowych"""
+        return self._component('market_trends', self._init_market_trends)
+    
+    @property
+    def career_path_generator(self):
+        """Generator ścieżek kariery (graf ról)"""
+        return self._component('career_path_generator', self._init_career_path_generator)
+    
+    @property
+    def career_simulator(self):
+        """Symulator kariery"""
+        return self._component('career_simulator', self._init_career_simulator)
+    
+    @property
+    def market_trends_analyzer(self):
+        """Analizator trendów rynkowych bez danych początkowych"""
+        from modules.market_trends import MarketTrends
+        return self._component('market_trends_analyzer', MarketTrends)
+    
     def _init_skills_analyzer(self):
         """Inicjalizuje analizator umiejętności"""
+        from modules.skills_analyzer import SkillsAnalyzer
+        
         logger.info("Inicjalizacja analizatora umiejętności")
         try:
             # Initialize with just the database path
@@ -56,6 +92,8 @@ class AICareerNavigator:
     
     def _init_market_trends(self):
         """Inicjalizuje analizator trendów rynkowych"""
+        from modules.market_trends import MarketTrends
+        
         logger.info("Inicjalizacja analizatora trendów rynkowych")
         try:
             market_model_path = MODEL_PATHS.get('market_trends_model')
@@ -66,6 +104,8 @@ class AICareerNavigator:
     
     def _init_career_path_generator(self):
         """Inicjalizuje generator ścieżek kariery"""
+        from modules.career_path import CareerPathGenerator
+        
         logger.info("Inicjalizacja generatora ścieżek kariery")
         try:
             return CareerPathGenerator(
@@ -78,10 +118,13 @@ class AICareerNavigator:
     
     def _init_career_simulator(self):
         """Inicjalizuje symulator kariery"""
+        from modules.career_simulator import CareerSimulator
+        
         logger.info("Inicjalizacja symulatora kariery")
         try:
+            # Symulator nie korzysta z analizatora umiejętności - przekaż go tylko, jeśli już istnieje
             return CareerSimulator(
-                skills_analyzer=self.skills_analyzer,
+                skills_analyzer=self._components.get('skills_analyzer'),
                 market_trends=self.market_trends,
                 career_path_generator=self.career_path_generator
             )
@@ -127,14 +170,16 @@ class AICareerNavigator:
         
         # Rozszerz profil o analizę rynkową
         if self.market_trends and 'detected_skills' in profile:
-            # Pobierz trendy dla umiejętności
+            # Pobierz trendy dla wszystkich umiejętności jednym wywołaniem
             skills_trends = {}
-            for skill_data in profile['detected_skills']:
-                skill_name = skill_data['name']
-                trend = self.market_trends.predict_future_trends(skill_name)
+            skill_names = [skill_data['name'] for skill_data in profile['detected_skills']]
+            trends = self.market_trends.predict_future_trends_batch(skill_names)
+            for skill_name in skill_names:
+                trend = trends.get(skill_name)
+                has_trend = trend is not None and not trend.empty
                 skills_trends[skill_name] = {
-                    'current_demand': trend.iloc[-1]['value'] if not trend.empty else 0,
-                    'trend': 'rising' if not trend.empty and trend.iloc[-1]['value'] > trend.iloc[0]['value'] else 'falling'
+                    'current_demand': trend.iloc[-1]['value'] if has_trend else 0,
+                    'trend': 'rising' if has_trend and trend.iloc[-1]['value'] > trend.iloc[0]['value'] else 'falling'
                 }
             
             profile['skills_market_analysis'] = skills_trends
@@ -291,6 +336,50 @@ class AICareerNavigator:
             # Wczytaj minimalne dane aby program mógł działać
             logger.info("Używanie danych domyślnych")
 
+def print_batch_progress(stats):
+    """Wypisuje postęp trybu wsadowego"""
+    done = stats['processed'] + stats['errors']
+    eta = f", pozostało ok. {stats['eta_seconds']:.0f} s" if stats['eta_seconds'] is not None else ''
+    print(f"Przetworzono {done}/{stats['total'] - stats['skipped']} rekordów "
+          f"({stats['records_per_second']:.1f} rek./s, błędy: {stats['errors']}{eta})", flush=True)
+
+def run_batch(args):
+    """
+    Tryb wsadowy: rekomendacje dla wielu profili/CV w puli procesów
+    
+    Args:
+        args: Argumenty wiersza poleceń (batch, output, format, workers, chunk_size, resume, target_role)
+    """
+    from modules.batch_processor import BatchProcessor
+    
+    # Komunikaty dla każdego rekordu zasypałyby konsolę - ostrzeżenia i błędy trafiają tylko
+    # do pliku dziennika, a postęp raportuje tryb wsadowy
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.WARNING)
+    for handler in root_logger.handlers:
+        if type(handler) is logging.StreamHandler:
+            handler.setLevel(logging.CRITICAL)
+    
+    output_path = args.output or ('career_recommendations.parquet' if args.format == 'parquet' else 'career_recommendations.ndjson')
+    processor = BatchProcessor(AICareerNavigator, max_workers=args.workers, chunk_size=args.chunk_size)
+    try:
+        summary = processor.run(
+            args.batch, output_path, output_format=args.format, resume=args.resume,
+            default_target_role=args.target_role, progress=print_batch_progress
+        )
+    except Exception as e:
+        logger.error(f"Błąd trybu wsadowego: {e}")
+        print(f"Błąd trybu wsadowego: {e}")
+        return 1
+    
+    print(f"Przetworzono {summary['processed']} z {summary['total']} rekordów "
+          f"(pominięte z poprzedniego uruchomienia: {summary['skipped']}, błędy: {summary['errors']})")
+    print(f"Czas: {summary['elapsed_seconds']:.1f} s, przepustowość: {summary['records_per_second']:.2f} rek./s")
+    print(f"Wyniki zapisane do: {summary['output']} ({summary['format']})")
+    if summary['errors_file']:
+        print(f"Błędy zapisane do: {summary['errors_file']} (ponowione przy --resume)")
+    return 0 if not summary['errors'] else 2
+
 def main():
     """Główna funkcja aplikacji"""
     parser = argparse.ArgumentParser(description='AI Career Navigator')
@@ -298,8 +387,17 @@ def main():
     parser.add_argument('--profile', help='Ścieżka do pliku z profilem użytkownika (JSON)')
     parser.add_argument('--target-role', help='Docelowa rola zawodowa')
     parser.add_argument('--output', help='Ścieżka do pliku wyjściowego')
+    parser.add_argument('--batch', help='Tryb wsadowy: katalog, wzorzec glob lub plik NDJSON z profilami/CV')
+    parser.add_argument('--format', choices=('ndjson', 'parquet'),
+                        help='Format wyniku trybu wsadowego (domyślnie według rozszerzenia --output)')
+    parser.add_argument('--workers', type=int, help='Liczba procesów roboczych trybu wsadowego (domyślnie liczba procesorów)')
+    parser.add_argument('--chunk-size', type=int, default=16, help='Liczba rekordów przekazywanych do procesu naraz')
+    parser.add_argument('--resume', action='store_true', help='Wznów tryb wsadowy, pomijając zapisane rekordy')
     args = parser.parse_args()
     
+    if args.batch:
+        return run_batch(args)
+    
     # Inicjalizacja systemu
     navigator = AICareerNavigator()
     
@@ -346,4 +444,4 @@ def main():
         print(f"Błąd podczas zapisu rekomendacji: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(main())
\ No newline at end of file
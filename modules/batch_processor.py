@@ -0,0 +1,501 @@
+import glob
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# pyarrow jest opcjonalny - bez niego dostępne jest tylko wyjście NDJSON
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Rozszerzenia plików wejściowych: CV (tekst), profil (JSON), wiele rekordów (NDJSON)
+CV_EXTENSIONS = ('.txt',)
+PROFILE_EXTENSIONS = ('.json',)
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+# Komponenty nawigatora ładowane przed przetwarzaniem (współdzielone przez procesy robocze)
+COMPONENTS = ('skills_analyzer', 'market_trends', 'career_path_generator', 'career_simulator')
+
+# Stan procesu roboczego (nawigator dziedziczony po rozwidleniu lub tworzony przez initializer)
+_batch_worker_state = {}
+
+def resolve_batch_inputs(source):
+    """
+    Zwraca pliki wejściowe trybu wsadowego
+
+    Args:
+        source: Katalog (przeszukiwany rekurencyjnie), wzorzec glob lub pojedynczy plik
+
+    Returns:
+        Krotka (posortowana lista plików, katalog bazowy identyfikatorów rekordów)
+    """
+    if os.path.isdir(source):
+        paths = [os.path.join(root, name) for root, _, names in os.walk(source) for name in names]
+        base = source
+    elif os.path.isfile(source):
+        paths = [source]
+        base = os.path.dirname(source)
+    else:
+        paths = glob.glob(source, recursive=True)
+        # Katalog bazowy: początek wzorca bez znaków wieloznacznych (identyfikatory nie zależą od cwd)
+        parts = []
+        for part in source.replace('\\', '/').split('/'):
+            if glob.has_magic(part):
+                break
+            parts.append(part)
+        base = '/'.join(parts)
+
+    extensions = CV_EXTENSIONS + PROFILE_EXTENSIONS + NDJSON_EXTENSIONS
+    paths = sorted(path for path in paths if os.path.isfile(path) and path.lower().endswith(extensions))
+    return paths, base or '.'
+
+def count_batch_records(paths):
+    """Zlicza rekordy wejściowe (niepuste wiersze plików NDJSON, pozostałe pliki - po jednym)"""
+    total = 0
+    for path in paths:
+        if not path.lower().endswith(NDJSON_EXTENSIONS):
+            total += 1
+            continue
+        try:
+            with open(path, 'rb') as f:
+                total += sum(1 for line in f if line.strip())
+        except OSError:
+            total += 1
+    return total
+
+def normalize_profile(profile):
+    """
+    Ujednolica profil do postaci oczekiwanej przez nawigator
+
+    Profile zapisywane przez GUI zawierają rolę i umiejętności jako tekst - zamieniane są
+    na słowniki {'name': ...}.
+
+    Args:
+        profile: Słownik profilu lub None
+
+    Returns:
+        Kopia profilu lub None
+    """
+    if not profile:
+        return None
+    if not isinstance(profile, dict):
+        raise ValueError("Profil musi być obiektem JSON")
+
+    profile = dict(profile)
+    if isinstance(profile.get('current_role'), str):
+        profile['current_role'] = {'name': profile['current_role']}
+    if isinstance(profile.get('skills'), list):
+        profile['skills'] = [{'name': skill} if isinstance(skill, str) else skill for skill in profile['skills']]
+    return profile
+
+def _record_from_json(data, default_id):
+    """
+    Tworzy rekord wejściowy z obiektu JSON
+
+    Obiekt może mieć postać {"id", "profile", "cv_text", "target_role"} lub być samym
+    profilem (wtedy identyfikatorem jest jego pole id, jeśli istnieje).
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Rekord musi być obiektem JSON")
+
+    if 'profile' in data or 'cv_text' in data:
+        profile, cv_text, target_role = data.get('profile'), data.get('cv_text'), data.get('target_role')
+    else:
+        profile, cv_text, target_role = data, None, None
+    return {
+        'id': str(data.get('id', default_id)),
+        'profile': normalize_profile(profile),
+        'cv_text': cv_text,
+        'target_role': target_role
+    }
+
+def iter_batch_records(paths, base):
+    """
+    Wczytuje rekordy wejściowe kolejno z plików (bez wczytywania całego wejścia do pamięci)
+
+    Identyfikatorem rekordu jest ścieżka pliku względem katalogu bazowego (dla NDJSON
+    z numerem wiersza), o ile rekord nie ma własnego pola id. Rekordy, których nie
+    udało się wczytać, mają pole error.
+
+    Args:
+        paths: Lista plików (z resolve_batch_inputs)
+        base: Katalog bazowy identyfikatorów
+
+    Yields:
+        Słowniki rekordów (id, profile, cv_text, target_role lub id, error)
+    """
+    for path in paths:
+        record_id = os.path.relpath(path, base).replace(os.sep, '/')
+        lower = path.lower()
+        try:
+            if lower.endswith(NDJSON_EXTENSIONS):
+                with open(path, encoding='utf-8') as f:
+                    for line_number, line in enumerate(f, 1):
+                        if not line.strip():
+                            continue
+                        line_id = f"{record_id}:{line_number}"
+                        try:
+                            yield _record_from_json(json.loads(line), line_id)
+                        except ValueError as e:
+                            yield {'id': line_id, 'error': f"Nieprawidłowy rekord: {e}"}
+            elif lower.endswith(PROFILE_EXTENSIONS):
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                yield _record_from_json(data, record_id)
+            else:
+                with open(path, encoding='utf-8') as f:
+                    yield {'id': record_id, 'profile': None, 'cv_text': f.read(), 'target_role': None}
+        except (OSError, ValueError) as e:
+            yield {'id': record_id, 'error': f"Nie można wczytać danych wejściowych: {e}"}
+
+def process_record(navigator, record, default_target_role=None):
+    """
+    Analizuje profil/CV i generuje rekomendacje (jak tryb pojedynczy CLI)
+
+    Args:
+        navigator: Obiekt AICareerNavigator
+        record: Rekord wejściowy (z iter_batch_records)
+        default_target_role: Docelowa rola dla rekordów bez własnej
+
+    Returns:
+        Wiersz wyniku: id, kolumny podsumowania i result (JSON) lub id i error
+    """
+    try:
+        profile = navigator.analyze_user_profile(record.get('cv_text'), record.get('profile'))
+        target_role = record.get('target_role') or default_target_role
+        if isinstance(target_role, str):
+            target_role = {'name': target_role}
+        recommendations = navigator.generate_career_recommendations(profile, target_role)
+    except Exception as e:
+        return {'id': record['id'], 'error': f"{type(e).__name__}: {e}"}
+
+    result = {
+        'id': record['id'],
+        'target_role': target_role.get('name') if target_role else None,
+        'detected_skills': profile.get('detected_skills', []),
+        **recommendations
+    }
+    salary_projection = recommendations.get('career_simulation', {}).get('salary_projection') or [{}]
+    projected_salary = salary_projection[-1].get('salary')
+    return {
+        'id': record['id'],
+        'timestamp': recommendations.get('timestamp'),
+        'target_role': result['target_role'],
+        'detected_skills': len(result['detected_skills']),
+        'career_path_steps': len(recommendations.get('career_paths', [])),
+        'skill_recommendations': len(recommendations.get('skill_recommendations', [])),
+        'projected_salary': None if projected_salary is None else float(projected_salary),
+        'result': json.dumps(result, ensure_ascii=False, default=str)
+    }
+
+def preload_navigator(navigator_factory):
+    """Tworzy nawigator z załadowanymi komponentami i rozgrzanym potokiem NLP"""
+    navigator = navigator_factory()
+    for name in COMPONENTS:
+        getattr(navigator, name)
+    navigator.skills_analyzer.extract_skills_from_cv("Python SQL")
+    return navigator
+
+def _init_batch_worker(navigator_factory):
+    """Inicjalizacja procesu roboczego (nawigator odziedziczony po rozwidleniu nie jest tworzony ponownie)"""
+    if _batch_worker_state.get('navigator') is None:
+        _batch_worker_state['navigator'] = preload_navigator(navigator_factory)
+
+def _process_batch_chunk(records, default_target_role):
+    """Przetwarza porcję rekordów w procesie roboczym"""
+    navigator = _batch_worker_state['navigator']
+    return [process_record(navigator, record, default_target_role) for record in records]
+
+class NdjsonResultWriter:
+    """
+    Zapis wyników do pliku NDJSON (rekord na wiersz)
+
+    Plik wyjściowy jest jednocześnie punktem kontrolnym: przy wznowieniu identyfikatory
+    zapisanych rekordów są odczytywane z pliku, a niepełny ostatni wiersz (przerwany
+    zapis) jest obcinany.
+    """
+
+    def __init__(self, path, resume=False):
+        """
+        Args:
+            path: Ścieżka pliku wyjściowego
+            resume: Czy dopisywać do istniejącego pliku (pomijając zapisane rekordy)
+        """
+        self.path = path
+        self.completed = set()
+        if resume and os.path.exists(path):
+            self.completed = self._recover()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+    def _recover(self):
+        """Odczytuje identyfikatory zapisanych rekordów i obcina niepełny ostatni wiersz"""
+        completed = set()
+        valid_size = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    completed.add(json.loads(line)['id'])
+                except (ValueError, KeyError, TypeError):
+                    break
+                valid_size += len(line)
+        with open(self.path, 'r+b') as f:
+            f.truncate(valid_size)
+        return completed
+
+    def write(self, rows):
+        """Dopisuje wiersze wyników (bufor pliku - trwałe po checkpoint)"""
+        self._file.write(''.join(row['result'] + '\n' for row in rows))
+        self.completed.update(row['id'] for row in rows)
+
+    def checkpoint(self):
+        """Utrwala zapisane wiersze na dysku"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """Utrwala i zamyka plik"""
+        self.checkpoint()
+        self._file.close()
+
+class ParquetResultWriter:
+    """
+    Zapis wyników do katalogu plików Parquet (part-*.parquet)
+
+    Każdy punkt kontrolny zapisuje nowy plik (najpierw pod nazwą tymczasową, potem
+    zamiana nazwy), więc przerwany zapis nie zostawia uszkodzonych plików. Kolumny
+    podsumowania pozwalają na analizę bez rozpakowywania pełnego wyniku (kolumna result, JSON).
+    """
+
+    SCHEMA = pa.schema([
+        ('id', pa.string()),
+        ('timestamp', pa.string()),
+        ('target_role', pa.string()),
+        ('detected_skills', pa.int64()),
+        ('career_path_steps', pa.int64()),
+        ('skill_recommendations', pa.int64()),
+        ('projected_salary', pa.float64()),
+        ('result', pa.string())
+    ]) if pa is not None else None
+
+    def __init__(self, path, resume=False):
+        """
+        Args:
+            path: Katalog wyjściowy
+            resume: Czy zachować istniejące pliki (pomijając zapisane rekordy)
+        """
+        if pa is None:
+            raise ImportError("Wyjście Parquet wymaga pakietu pyarrow (pip install pyarrow)")
+
+        self.path = path
+        self.completed = set()
+        self._rows = []
+        os.makedirs(path, exist_ok=True)
+        for part in sorted(glob.glob(os.path.join(path, 'part-*.parquet'))):
+            if resume:
+                self.completed.update(pq.read_table(part, columns=['id']).column('id').to_pylist())
+            else:
+                os.remove(part)
+
+    def write(self, rows):
+        """Dodaje wiersze wyników do bufora bieżącego pliku"""
+        self._rows.extend(rows)
+        self.completed.update(row['id'] for row in rows)
+
+    def checkpoint(self):
+        """Zapisuje buforowane wiersze jako nowy plik part-*.parquet"""
+        if not self._rows:
+            return
+        table = pa.Table.from_pylist(self._rows, schema=self.SCHEMA)
+        name = f"part-{time.strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+        temp_path = os.path.join(self.path, f".{name}.tmp")
+        pq.write_table(table, temp_path)
+        os.replace(temp_path, os.path.join(self.path, name))
+        self._rows = []
+
+    def close(self):
+        """Zapisuje pozostałe wiersze"""
+        self.checkpoint()
+
+# Formaty wyjściowe: nazwa -> klasa zapisu
+RESULT_WRITERS = {
+    'ndjson': NdjsonResultWriter,
+    'parquet': ParquetResultWriter
+}
+
+class BatchProcessor:
+    """
+    Wsadowe generowanie rekomendacji dla wielu profili/CV w puli procesów
+
+    Komponenty (model NLP, bazy ról i umiejętności, dane rynkowe) są ładowane raz
+    w procesie głównym i dziedziczone przez procesy robocze po rozwidleniu (kopiowanie
+    przy zapisie); bez fork ładuje je każdy proces roboczy (initializer). Wyniki są
+    zapisywane w miarę przetwarzania porcji, a zapisane rekordy są pomijane przy
+    wznowieniu (resume=True).
+    """
+
+    def __init__(self, navigator_factory, max_workers=None, chunk_size=16, checkpoint_every=500,
+                 progress_interval=10.0):
+        """
+        Inicjalizacja procesora
+
+        Args:
+            navigator_factory: Funkcja/klasa tworząca AICareerNavigator (dostępna przez pickle)
+            max_workers: Liczba procesów roboczych (domyślnie liczba procesorów; 1 - bez puli)
+            chunk_size: Liczba rekordów przekazywanych do procesu roboczego naraz
+            checkpoint_every: Liczba rekordów między punktami kontrolnymi (utrwalenie wyników)
+            progress_interval: Minimalny odstęp między raportami postępu (s)
+        """
+        self.navigator_factory = navigator_factory
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.progress_interval = progress_interval
+        self.logger = logging.getLogger(__name__)
+
+    def run(self, source, output, output_format=None, resume=False, default_target_role=None, progress=None):
+        """
+        Przetwarza wszystkie rekordy wejściowe
+
+        Args:
+            source: Katalog, wzorzec glob lub plik (NDJSON, JSON, TXT) z profilami/CV
+            output: Plik NDJSON lub katalog Parquet
+            output_format: 'ndjson' lub 'parquet' (domyślnie na podstawie rozszerzenia output)
+            resume: Czy pominąć rekordy zapisane w poprzednim uruchomieniu
+            default_target_role: Docelowa rola dla rekordów bez własnej
+            progress: Funkcja wywoływana ze słownikiem statystyk co progress_interval sekund
+
+        Returns:
+            Słownik z podsumowaniem (liczby rekordów, czas, przepustowość)
+        """
+        output_format = output_format or ('parquet' if output.rstrip('/\\').endswith('.parquet') else 'ndjson')
+        if output_format not in RESULT_WRITERS:
+            raise ValueError(f"Nieobsługiwany format wyjściowy: {output_format}")
+
+        paths, base = resolve_batch_inputs(source)
+        writer = RESULT_WRITERS[output_format](output, resume=resume)
+        errors_path = output.rstrip('/\\') + '.errors.ndjson'
+        stats = {
+            'total': count_batch_records(paths),
+            'processed': 0,
+            'errors': 0,
+            'skipped': 0,
+            'started': time.perf_counter()
+        }
+        self.logger.info(f"Tryb wsadowy: {stats['total']} rekordów z {len(paths)} plików, wynik: {output}")
+
+        def pending_records():
+            for record in iter_batch_records(paths, base):
+                if record['id'] in writer.completed:
+                    stats['skipped'] += 1
+                    continue
+                yield record
+
+        with open(errors_path, 'w', encoding='utf-8') as errors_file:
+            since_checkpoint = 0
+            last_progress = time.perf_counter()
+
+            def collect(rows):
+                nonlocal since_checkpoint, last_progress
+                results = [row for row in rows if 'error' not in row]
+                failed = [row for row in rows if 'error' in row]
+                writer.write(results)
+                errors_file.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in failed))
+                stats['processed'] += len(results)
+                stats['errors'] += len(failed)
+
+                since_checkpoint += len(rows)
+                if since_checkpoint >= self.checkpoint_every:
+                    writer.checkpoint()
+                    errors_file.flush()
+                    since_checkpoint = 0
+                if progress and time.perf_counter() - last_progress >= self.progress_interval:
+                    progress(self._summary(stats))
+                    last_progress = time.perf_counter()
+
+            try:
+                self._process(pending_records(), default_target_role, collect, stats)
+            finally:
+                writer.close()
+
+        if not stats['errors']:
+            os.remove(errors_path)
+        summary = self._summary(stats)
+        summary.update({'output': output, 'format': output_format, 'errors_file': errors_path if stats['errors'] else None})
+        self.logger.info(f"Tryb wsadowy zakończony: {summary}")
+        return summary
+
+    def _process(self, records, default_target_role, collect, stats):
+        """Rozdziela porcje rekordów między procesy robocze i przekazuje wyniki do collect"""
+        chunks = iter(lambda: list(itertools.islice(records, self.chunk_size)), [])
+
+        def split_invalid(chunk):
+            # Rekordy, których nie udało się wczytać, trafiają od razu do błędów
+            invalid = [record for record in chunk if 'error' in record]
+            if invalid:
+                collect(invalid)
+            return [record for record in chunk if 'error' not in record]
+
+        if self.max_workers <= 1:
+            navigator = preload_navigator(self.navigator_factory)
+            stats['started'] = time.perf_counter()
+            for chunk in chunks:
+                collect([process_record(navigator, record, default_target_role) for record in split_invalid(chunk)])
+            return
+
+        # Komponenty ładowane w procesie głównym przed rozwidleniem są współdzielone przez procesy robocze
+        methods = multiprocessing.get_all_start_methods()
+        if 'fork' in methods:
+            _batch_worker_state['navigator'] = preload_navigator(self.navigator_factory)
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=_init_batch_worker,
+            initargs=(self.navigator_factory,)
+        ) as executor:
+            # Czas przetwarzania liczony od uruchomienia procesów roboczych (bez ładowania komponentów)
+            executor.submit(os.getpid).result()
+            stats['started'] = time.perf_counter()
+
+            # Ograniczona liczba porcji w toku - wejście jest wczytywane w miarę przetwarzania
+            pending = set()
+            for chunk in chunks:
+                chunk = split_invalid(chunk)
+                if chunk:
+                    pending.add(executor.submit(_process_batch_chunk, chunk, default_target_role))
+                if len(pending) >= self.max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future.result())
+            for future in pending:
+                collect(future.result())
+
+    @staticmethod
+    def _summary(stats):
+        """Podsumowanie postępu: liczby rekordów, czas, przepustowość i szacowany czas do końca"""
+        elapsed = time.perf_counter() - stats['started']
+        done = stats['processed'] + stats['errors']
+        rate = done / elapsed if elapsed > 0 else 0.0
+        remaining = max(0, stats['total'] - stats['skipped'] - done)
+        return {
+            'total': stats['total'],
+            'processed': stats['processed'],
+            'errors': stats['errors'],
+            'skipped': stats['skipped'],
+            'elapsed_seconds': round(elapsed, 1),
+            'records_per_second': round(rate, 2),
+            'eta_seconds': round(remaining / rate, 1) if rate else None
+        }
@@ -1,12 +1,11 @@
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
 import networkx as nx
-import matplotlib.pyplot as plt
 import logging
 from datetime import datetime, timedelta
 
+from .metrics import stage_timer
+
 class CareerPathGenerator:
     def __init__(self, skills_database_path=None, roles_database_path=None):
         """
@@ -418,13 +417,14 @@ class CareerPathGenerator:
             
         # Znajdź najkrótszą ścieżkę
         try:
-            path = nx.shortest_path(self.career_graph, current_role_id, target_role_id, weight='weight')
-            
-            # Ogranicz do max_steps kroków
-            if len(path) - 1 > max_steps:
-                self.logger.warning(f"Znaleziona ścieżka ma {len(path)-1} kroków, ograniczenie do {max_steps}")
-                # Znajdź najlepsze pośrednie kroki
-                path = self._find_limited_path(current_role_id, target_role_id, max_steps)
+            with stage_timer('graph_search'):
+                path = nx.shortest_path(self.career_graph, current_role_id, target_role_id, weight='weight')
+                
+                # Ogranicz do max_steps kroków
+                if len(path) - 1 > max_steps:
+                    self.logger.warning(f"Znaleziona ścieżka ma {len(path)-1} kroków, ograniczenie do {max_steps}")
+                    # Znajdź najlepsze pośrednie kroki
+                    path = self._find_limited_path(current_role_id, target_role_id, max_steps)
                 
             # Konwertuj IDs na pełne informacje o rolach
             career_path = []
@@ -579,9 +579,22 @@ class CareerPathGenerator:
         Returns:
             Słownik z rekomendowanymi umiejętnościami i priorytetami
         """
+        return dict(self.iter_skill_recommendations(current_skills, target_role_id))
+    
+    def iter_skill_recommendations(self, current_skills, target_role_id):
+        """
+        Generuje rekomendacje umiejętności kolejno, w miarę ich obliczania
+        
+        Args:
+            current_skills: Lista obecnych umiejętności (ID)
+            target_role_id: ID docelowej roli
+            
+        Yields:
+            Krotki (ID umiejętności, słownik z nazwą, kategorią, priorytetem, trudnością i czasem nauki)
+        """
         if target_role_id not in self.roles_db['role_id'].values:
             self.logger.error(f"Rola docelowa {target_role_id} nie istnieje")
-            return {}
+            return
             
         # Pobierz wymagane umiejętności dla docelowej roli
         target_role = self.roles_db[self.roles_db['role_id'] == target_role_id].iloc[0]
@@ -595,19 +608,16 @@ class CareerPathGenerator:
         missing_skills = required_skills - current_skills_set
         
         # Przygotuj rekomendacje
-        recommendations = {}
         for skill_id in missing_skills:
             skill_data = self.skills_db[self.skills_db['skill_id'] == skill_id].iloc[0]
             
-            recommendations[skill_id] = {
+            yield skill_id, {
                 'skill_name': skill_data['skill_name'],
                 'category': skill_data['category'],
                 'priority': self._calculate_skill_priority(skill_id, target_role),
                 'difficulty': skill_data['learning_difficulty'],
                 'estimated_time': self._estimate_learning_time(skill_id)
             }
-        
-        return recommendations
     
     def _calculate_skill_priority(self, skill_id, target_role):
         """
@@ -692,26 +702,30 @@ class CareerPathGenerator:
         # Ustaw pozycje węzłów
         pos = nx.spring_layout(path_graph)
         
-        # Rysuj graf
-        plt.figure(figsize=(12, 8))
+        # Rysuj graf (obiektowe API matplotlib - bez globalnego stanu pyplot; import przy pierwszym wykresie)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=(12, 8))
+        ax = fig.subplots()
         
         # Rysuj węzły
-        nx.draw_networkx_nodes(path_graph, pos, node_size=3000, node_color='lightblue', alpha=0.8)
+        nx.draw_networkx_nodes(path_graph, pos, node_size=3000, node_color='lightblue', alpha=0.8, ax=ax)
         
         # Rysuj krawędzie z wagami
         edge_labels = {(u, v): f"{d['weight']:.1f}" for u, v, d in path_graph.edges(data=True)}
-        nx.draw_networkx_edges(path_graph, pos, width=2, edge_color='gray', arrows=True, arrowsize=20)
-        nx.draw_networkx_edge_labels(path_graph, pos, edge_labels=edge_labels, font_size=10)
+        nx.draw_networkx_edges(path_graph, pos, width=2, edge_color='gray', arrows=True, arrowsize=20, ax=ax)
+        nx.draw_networkx_edge_labels(path_graph, pos, edge_labels=edge_labels, font_size=10, ax=ax)
         
         # Rysuj etykiety węzłów
-        nx.draw_networkx_labels(path_graph, pos, labels=labels, font_size=10, font_weight='bold')
+        nx.draw_networkx_labels(path_graph, pos, labels=labels, font_size=10, font_weight='bold', ax=ax)
         
         # Dodaj tytuł
-        plt.title('Twoja ścieżka kariery', fontsize=16)
-        plt.axis('off')
+        ax.set_title('Twoja ścieżka kariery', fontsize=16)
+        ax.axis('off')
         
         # Zapisz lub zwróć figure
         if output_file:
-            plt.savefig(output_file, bbox_inches='tight')
-            
-        return plt.gcf() 
\ No newline at end of file
+            FigureCanvasAgg(fig).print_figure(output_file, bbox_inches='tight')
+        
+        return fig
\ No newline at end of file
@@ -1,12 +1,39 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import itertools
+import json
 import logging
 import random
 
+from .metrics import stage_timer
+
+# Stan procesu roboczego analizy scenariuszy (ustawiany raz na proces przez initializer)
+_sweep_worker_state = {}
+
+def _init_sweep_worker(simulator, user_profile, target_role):
+    """
+    Inicjalizuje proces roboczy kopią symulatora procesu głównego i danymi wejściowymi
+    
+    Kopia zachowuje konfigurację symulatora (wagi czynników, poziomy edukacji, intensywność
+    nauki, scenariusz rynkowy), więc wyniki nie zależą od liczby procesów roboczych.
+    """
+    _sweep_worker_state['simulator'] = simulator
+    _sweep_worker_state['user_profile'] = user_profile
+    _sweep_worker_state['target_role'] = target_role
+
+def _run_sweep_scenario(scenario, n_runs, seed):
+    """Uruchamia pojedynczy scenariusz analizy wrażliwości w procesie roboczym"""
+    return _sweep_worker_state['simulator']._run_scenario(
+        _sweep_worker_state['user_profile'], _sweep_worker_state['target_role'], scenario, n_runs, seed
+    )
+
 class CareerSimulator:
-    def __init__(self, skills_analyzer=None, market_trends=None, career_path_generator=None):
+    def __init__(self, skills_analyzer=None, market_trends=None, career_path_generator=None,
+                 progression_factors=None, education_levels=None):
         """
         Inicjalizacja symulatora kariery
         
@@ -14,6 +41,8 @@ class CareerSimulator:
             skills_analyzer: Obiekt analizatora umiejętności
             market_trends: Obiekt analizy trendów rynkowych
             career_path_generator: Obiekt generatora ścieżek kariery
+            progression_factors: Nadpisanie wag czynników progresu kariery
+            education_levels: Nadpisanie wartości poziomów edukacji
         """
         self.skills_analyzer = skills_analyzer
         self.market_trends = market_trends
@@ -36,8 +65,34 @@ class CareerSimulator:
             'Magister': 3,
             'Doktor': 4
         }
+        
+        if progression_factors:
+            self.progression_factors.update(progression_factors)
+        if education_levels:
+            self.education_levels.update(education_levels)
+        
+        # Średnia liczba umiejętności zdobywanych w kwartale (intensywność nauki)
+        self.learning_intensity = 0.5
+        
+        # Scenariusze rynkowe i ich mnożniki popytu
+        self.market_scenarios = {
+            'baseline': 1.0,
+            'boom': 1.15,
+            'slowdown': 0.9,
+            'recession': 0.75
+        }
+        self.market_scenario = 'baseline'
+        
+        # Zakres mnożnika wynagrodzenia przy awansie heurystycznym (bez generatora ścieżek)
+        self.promotion_raise = (1.2, 1.3)
+        
+        # Pamięć podręczna wyników scenariuszy analizy wrażliwości (LRU, klucz zawiera cały profil)
+        self.scenario_cache_size = 256
+        self._scenario_cache = OrderedDict()
     
-    def simulate_career_progression(self, user_profile, target_role, years=5, simulate_market_changes=True):
+    @stage_timer('simulation')
+    def simulate_career_progression(self, user_profile, target_role, years=5, simulate_market_changes=True,
+                                    seed=None):
         """
         Symuluje progresję kariery użytkownika do docelowej roli
         
@@ -46,12 +101,30 @@ class CareerSimulator:
             target_role: Docelowa rola zawodowa
             years: Liczba lat do zasymulowania
             simulate_market_changes: Czy symulować zmiany rynkowe
+            seed: Ziarno lokalnego generatora liczb losowych (None - globalne generatory
+                random/numpy); stan globalnych generatorów nie jest zmieniany
             
         Returns:
             DataFrame z symulacją kariery w czasie
         """
-        # Przygotuj strukturę wyniku
-        simulation_data = []
+        # Konwersja do DataFrame
+        return pd.DataFrame(list(self.iter_career_progression(
+            user_profile, target_role, years=years, simulate_market_changes=simulate_market_changes, seed=seed
+        )))
+    
+    def iter_career_progression(self, user_profile, target_role, years=5, simulate_market_changes=True, seed=None):
+        """
+        Generuje kolejne punkty symulacji kariery w miarę ich obliczania
+        
+        Pozwala przetwarzać (np. wysyłać strumieniowo) punkty symulacji bez budowania
+        całego wyniku w pamięci. Argumenty jak w simulate_career_progression.
+        
+        Yields:
+            Słowniki z punktami symulacji (date, role, salary, skills_count,
+            promotion_chance, skill_match, market_demand, opcjonalnie event)
+        """
+        # Z ziarnem - własny generator symulacji (powtarzalny wynik bez zmiany stanu globalnego)
+        rng = None if seed is None else np.random.default_rng(seed)
         current_date = datetime.now()
         
         # Utwórz kopię profilu użytkownika, aby go modyfikować
@@ -63,7 +136,7 @@ class CareerSimulator:
         current_salary = current_role.get('salary', 0)
         
         # Dodaj pierwszy punkt symulacji
-        simulation_data.append({
+        yield {
             'date': current_date,
             'role': current_role.get('name', 'Brak roli'),
             'salary': current_salary,
@@ -71,7 +144,7 @@ class CareerSimulator:
             'promotion_chance': 0,
             'skill_match': self._calculate_skill_match(current_skills, target_role),
             'market_demand': 1.0  # Początkowa wartość
-        })
+        }
         
         # Główna pętla symulacji (co kwartał)
         quarters = years * 4
@@ -80,7 +153,7 @@ class CareerSimulator:
             current_date = current_date + timedelta(days=90)
             
             # Symuluj zdobywanie nowych umiejętności
-            new_skills = self._simulate_skill_acquisition(profile, target_role, i)
+            new_skills = self._simulate_skill_acquisition(profile, target_role, i, rng)
             profile['skills'].extend(new_skills)
             
             # Aktualizuj doświadczenie
@@ -89,20 +162,20 @@ class CareerSimulator:
             # Aktualizuj popyt rynkowy jeśli potrzeba
             market_demand = 1.0
             if simulate_market_changes and self.market_trends:
-                market_demand = self._simulate_market_demand(profile, i)
+                market_demand = self._simulate_market_demand(profile, i, rng)
             
             # Oblicz szansę na awans
             promotion_chance = self._calculate_promotion_chance(profile, target_role, market_demand)
             
             # Sprawdź, czy nastąpił awans
-            if self._check_promotion(promotion_chance, i):
+            if self._check_promotion(promotion_chance, i, rng):
                 # Aktualizuj rolę i wynagrodzenie
-                new_role = self._get_next_role(profile, target_role)
+                new_role = self._get_next_role(profile, target_role, rng=rng)
                 profile['current_role'] = new_role
                 current_salary = new_role.get('salary', current_salary)
                 
                 # Dodaj dodatkową notatkę o awansie w symulacji
-                simulation_data.append({
+                yield {
                     'date': current_date,
                     'role': new_role.get('name', 'Nowa rola'),
                     'salary': current_salary,
@@ -111,14 +184,14 @@ class CareerSimulator:
                     'skill_match': self._calculate_skill_match(profile['skills'], target_role),
                     'market_demand': market_demand,
                     'event': 'Awans zawodowy'
-                })
+                }
             else:
                 # Aktualizuj wynagrodzenie (niewielki wzrost co roku)
                 if i % 4 == 0:  # co roku
                     current_salary *= 1.03  # 3% wzrost roczny
             
             # Dodaj punkt symulacji
-            simulation_data.append({
+            yield {
                 'date': current_date,
                 'role': profile['current_role'].get('name', 'Brak roli'),
                 'salary': current_salary,
@@ -126,12 +199,358 @@ class CareerSimulator:
                 'promotion_chance': promotion_chance,
                 'skill_match': self._calculate_skill_match(profile['skills'], target_role),
                 'market_demand': market_demand
+            }
+    
+    def expected_career_progression(self, user_profile, target_role, years=5, simulate_market_changes=True,
+                                    quadrature_nodes=15):
+        """
+        Deterministyczny (łańcuch Markowa) odpowiednik simulate_career_progression
+        
+        Zamiast losować pojedynczy przebieg, propaguje rozkład prawdopodobieństwa po stanach
+        (liczba awansów -> rola, liczba zdobytych brakujących umiejętności) kwartał po kwartale.
+        Szum popytu rynkowego jest całkowany kwadraturą Gaussa-Hermite'a, więc wynik jest
+        stabilny i nie wymaga próbkowania. Losowa podwyżka przy heurystycznym awansie (bez
+        generatora ścieżek) wchodzi do wartości oczekiwanej średnią, a do salary_std wariancją
+        rozkładu jednostajnego.
+        
+        Args:
+            user_profile: Profil użytkownika (umiejętności, doświadczenie, edukacja)
+            target_role: Docelowa rola zawodowa
+            years: Liczba lat do zasymulowania
+            simulate_market_changes: Czy uwzględniać zmiany rynkowe
+            quadrature_nodes: Liczba węzłów kwadratury dla szumu popytu rynkowego
+            
+        Returns:
+            Słownik z kluczami:
+                'timeline': DataFrame z wartościami oczekiwanymi w każdym kwartale
+                'first_promotion': DataFrame z rozkładem czasu do pierwszego awansu
+                'promotions_count': Series z rozkładem liczby awansów na koniec symulacji
+        """
+        quarters = years * 4
+        current_role = user_profile.get('current_role', {})
+        current_skills = user_profile.get('skills', [])
+        current_skill_names = [s.get('name', '') for s in current_skills]
+        
+        # Stan umiejętności: liczba zdobytych brakujących umiejętności (0..n_missing)
+        required_skills = target_role.get('required_skills', [])
+        n_missing = len([s for s in required_skills if s.get('name', '') not in current_skill_names])
+        acquired = np.arange(n_missing + 1)
+        skills_count = len(current_skills) + acquired
+        base_match = self._calculate_skill_match(current_skills, target_role)
+        skill_match = base_match + acquired / len(required_skills) if required_skills else np.zeros(n_missing + 1)
+        skill_transition = self._skill_transition_matrix(n_missing)
+        
+        # Stan roli: liczba awansów (co najwyżej jeden na kwartał) -> kolejna rola w łańcuchu
+        chain, chain_salary_m2 = self._expected_role_chain(user_profile, target_role, quarters)
+        role_idx = np.minimum(np.arange(quarters + 1), len(chain) - 1)
+        has_salary = np.array(['salary' in chain[k] for k in role_idx])
+        role_salary = np.array([chain[k].get('salary', 0) for k in role_idx], dtype=float)
+        role_salary_m2 = np.array([chain_salary_m2[k] for k in role_idx], dtype=float)
+        
+        # Szum popytu rynkowego ~ N(0, 0.05^2), całkowany kwadraturą
+        market_active = simulate_market_changes and self.market_trends
+        if market_active:
+            nodes, weights = np.polynomial.hermite_e.hermegauss(quadrature_nodes)
+            weights = weights / weights.sum()
+            industry_trends = {'IT': 1.2, 'Finance': 1.1, 'Healthcare': 1.15, 'Manufacturing': 0.9, 'Retail': 0.85}
+            industry_factor = np.array([
+                industry_trends.get(chain[k].get('industry', ''), 1.0) for k in role_idx
+            ]) * self.market_scenarios.get(self.market_scenario, 1.0)
+        else:
+            nodes, weights = np.zeros(1), np.ones(1)
+            industry_factor = np.ones(quarters + 1)
+        
+        # Stałe składniki szansy na awans
+        required_exp = target_role.get('experience_years', 1) or 1
+        education_value = self.education_levels.get(user_profile.get('education', 'Szkoła średnia'), 1)
+        edu_term = self.progression_factors['education'] * min(1.0, education_value / 3.0)
+        match_term = self.progression_factors['skill_match'] * skill_match
+        
+        # Rozkład prawdopodobieństwa oraz E[wynagrodzenie * 1{stan}] i E[wynagrodzenie^2 * 1{stan}]
+        prob = np.zeros((quarters + 1, n_missing + 1))
+        prob[0, 0] = 1.0
+        salary_m1 = prob * current_role.get('salary', 0)
+        salary_m2 = prob * current_role.get('salary', 0) ** 2
+        promotions = np.arange(quarters + 1)
+        
+        current_date = datetime.now()
+        timeline = [{
+            'date': current_date,
+            'expected_salary': float(salary_m1.sum()),
+            'salary_std': 0.0,
+            'expected_skills_count': float(len(current_skills)),
+            'expected_skill_match': float(base_match),
+            'promotion_probability': 0.0,
+            'expected_promotions': 0.0
+        }]
+        first_promotion = []
+        
+        for i in range(1, quarters + 1):
+            current_date = current_date + timedelta(days=90)
+            
+            # Zdobywanie umiejętności (macierz przejść Poissona)
+            prob = prob @ skill_transition
+            salary_m1 = salary_m1 @ skill_transition
+            salary_m2 = salary_m2 @ skill_transition
+            
+            # Szansa na awans dla każdego stanu (role x umiejętności x węzły kwadratury)
+            exp_term = self.progression_factors['experience'] * min(1.0, (user_profile.get('experience', 0) + 0.25 * i) / required_exp)
+            if market_active:
+                demand = (1.0 + 0.1 * np.sin(i / 8.0) + 0.05 * nodes)[None, :] * industry_factor[:, None]
+                demand = np.clip(demand, 0.5, 1.5)
+            else:
+                demand = np.ones((quarters + 1, 1))
+            chance = (match_term[None, :, None] + exp_term + edu_term
+                      + self.progression_factors['market_demand'] * demand[:, None, :])
+            chance = np.clip(chance, 0.0, 1.0) @ weights
+            effective = chance * min(1.0, i / 8.0)
+            
+            moved = prob * effective
+            first_promotion.append({'quarter': i, 'date': current_date, 'probability': float(moved[0].sum())})
+            
+            # Brak awansu: coroczna podwyżka 3%
+            growth = 1.03 if i % 4 == 0 else 1.0
+            stay = 1.0 - effective
+            new_prob = prob * stay
+            new_m1 = salary_m1 * stay * growth
+            new_m2 = salary_m2 * stay * growth ** 2
+            
+            # Awans: przejście do kolejnej roli i jej wynagrodzenia
+            new_prob[1:] += moved[:-1]
+            promoted_salary = np.where(has_salary[1:, None], moved[:-1] * role_salary[1:, None], (salary_m1 * effective)[:-1])
+            promoted_salary_sq = np.where(has_salary[1:, None], moved[:-1] * role_salary_m2[1:, None], (salary_m2 * effective)[:-1])
+            new_m1[1:] += promoted_salary
+            new_m2[1:] += promoted_salary_sq
+            
+            prob, salary_m1, salary_m2 = new_prob, new_m1, new_m2
+            expected_salary = salary_m1.sum()
+            
+            timeline.append({
+                'date': current_date,
+                'expected_salary': float(expected_salary),
+                'salary_std': float(np.sqrt(max(0.0, salary_m2.sum() - expected_salary ** 2))),
+                'expected_skills_count': float(prob.sum(axis=0) @ skills_count),
+                'expected_skill_match': float(prob.sum(axis=0) @ skill_match),
+                'promotion_probability': float(moved.sum()),
+                'expected_promotions': float(prob.sum(axis=1) @ promotions)
             })
         
-        # Konwersja do DataFrame
-        return pd.DataFrame(simulation_data)
+        first_promotion = pd.DataFrame(first_promotion, columns=['quarter', 'date', 'probability'])
+        first_promotion['cumulative'] = first_promotion['probability'].cumsum()
+        
+        return {
+            'timeline': pd.DataFrame(timeline),
+            'first_promotion': first_promotion,
+            'promotions_count': pd.Series(prob.sum(axis=1), index=pd.Index(promotions, name='promotions'))
+        }
+    
+    def _skill_transition_matrix(self, n_missing):
+        """
+        Macierz przejść liczby zdobytych umiejętności w jednym kwartale
+        
+        Liczba nowych umiejętności ma rozkład Poissona(learning_intensity), obcięty do
+        liczby pozostałych brakujących umiejętności.
+        """
+        size = n_missing + 1
+        pmf = np.array([np.exp(-self.learning_intensity) * self.learning_intensity ** j / np.prod(np.arange(1, j + 1))
+                        for j in range(size)])
+        
+        matrix = np.zeros((size, size))
+        for a in range(size):
+            remaining = size - 1 - a
+            matrix[a, a:size - 1] = pmf[:remaining]
+            matrix[a, size - 1] = 1.0 - pmf[:remaining].sum()
+        
+        return matrix
+    
+    def _expected_role_chain(self, user_profile, target_role, max_promotions):
+        """
+        Zwraca kolejne role po awansach (z oczekiwanym wzrostem wynagrodzenia)
+        
+        Podwyżki heurystyczne R ~ U(a, b) są niezależne, więc drugi moment wynagrodzenia
+        roli po takim awansie to E[S_k^2] = E[S_{k-1}^2] * E[R^2], gdzie
+        E[R^2] = ((a + b) / 2)^2 + (b - a)^2 / 12. Role z generatora ścieżek mają stałe wynagrodzenie.
+        
+        Returns:
+            Krotka (lista ról, lista E[wynagrodzenie^2] dla każdej roli)
+        """
+        low, high = self.promotion_raise
+        raise_m2 = ((low + high) / 2) ** 2 + (high - low) ** 2 / 12
+        current_role = copy.deepcopy(user_profile.get('current_role', {}))
+        chain = [current_role]
+        salary_m2 = [current_role.get('salary', 0) ** 2]
+        
+        for _ in range(max_promotions):
+            current_role = chain[-1]
+            if not current_role:
+                next_role = self._get_next_role({'current_role': current_role}, target_role, expected=True)
+                next_m2 = next_role['salary'] ** 2
+            elif current_role.get('name', '') == target_role.get('name', ''):
+                # Rola docelowa - kolejne awanse nie zmieniają roli
+                break
+            else:
+                next_role = self._path_next_role(current_role, target_role)
+                if next_role is not None:
+                    next_m2 = next_role['salary'] ** 2
+                else:
+                    next_role = self._heuristic_next_role(current_role, (low + high) / 2)
+                    next_m2 = salary_m2[-1] * raise_m2
+            chain.append(next_role)
+            salary_m2.append(next_m2)
+        
+        return chain, salary_m2
+    
+    def sweep_scenarios(self, user_profile, target_role, param_grid, n_runs=20, max_workers=None, seed=42):
+        """
+        Analiza wrażliwości - symuluje iloczyn kartezjański parametrów scenariuszy
+        
+        Args:
+            user_profile: Profil użytkownika
+            target_role: Docelowa rola zawodowa
+            param_grid: Słownik {parametr: lista wartości}. Obsługiwane parametry:
+                'years', 'learning_intensity', 'market_scenario', 'simulate_market_changes'
+                oraz wagi czynników progresu (klucze progression_factors, np. 'skill_match')
+            n_runs: Liczba przebiegów Monte Carlo na scenariusz
+            max_workers: Liczba procesów roboczych (1 - obliczenia w bieżącym procesie)
+            seed: Ziarno losowości (te same liczby losowe dla każdego scenariusza)
+            
+        Returns:
+            DataFrame z jednym wierszem na scenariusz (parametry + metryki), gotowy do
+            pivot_table / heatmapy
+        """
+        allowed = {'years', 'learning_intensity', 'market_scenario', 'simulate_market_changes'}
+        allowed.update(self.progression_factors)
+        unknown = set(param_grid) - allowed
+        if unknown:
+            raise ValueError(f"Nieznane parametry scenariusza: {sorted(unknown)}")
+        
+        names = list(param_grid)
+        scenarios = [dict(zip(names, values)) for values in itertools.product(*(param_grid[n] for n in names))]
+        if not scenarios:
+            return pd.DataFrame()
+        
+        # Klucz wejścia - wyniki z pamięci podręcznej są ważne tylko dla tego samego profilu i roli
+        input_key = json.dumps([user_profile, target_role, n_runs, seed], sort_keys=True, default=str)
+        keys = [(input_key, self._scenario_key(scenario)) for scenario in scenarios]
+        
+        # Policz tylko unikalne scenariusze, których nie ma jeszcze w pamięci podręcznej
+        pending = {}
+        computed = {}
+        for key, scenario in zip(keys, scenarios):
+            if key in self._scenario_cache:
+                self._scenario_cache.move_to_end(key)
+                computed[key] = self._scenario_cache[key]
+            elif key not in pending:
+                pending[key] = scenario
+        
+        if pending:
+            self.logger.info(f"Analiza scenariuszy: {len(pending)} do obliczenia, {len(scenarios) - len(pending)} z pamięci podręcznej")
+            if max_workers == 1 or len(pending) == 1:
+                results = [self._run_scenario(user_profile, target_role, scenario, n_runs, seed)
+                           for scenario in pending.values()]
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_sweep_worker,
+                    initargs=(self._sweep_template(), user_profile, target_role)
+                ) as executor:
+                    results = list(executor.map(
+                        _run_sweep_scenario, pending.values(),
+                        itertools.repeat(n_runs), itertools.repeat(seed)
+                    ))
+            computed.update(zip(pending, results))
+            self._scenario_cache.update(zip(pending, results))
+            while len(self._scenario_cache) > self.scenario_cache_size:
+                self._scenario_cache.popitem(last=False)
+        
+        rows = [{**scenario, **computed[key]} for key, scenario in zip(keys, scenarios)]
+        return pd.DataFrame(rows)
+    
+    def _sweep_template(self):
+        """Kopia symulatora przekazywana do procesów roboczych (bez pamięci podręcznej i modelu NLP)"""
+        template = copy.copy(self)
+        template._scenario_cache = OrderedDict()
+        template.skills_analyzer = None
+        return template
+    
+    def _scenario_key(self, scenario):
+        """
+        Normalizuje scenariusz do klucza pamięci podręcznej
+        
+        Scenariusze różniące się tylko parametrami bez wpływu na wynik (np. scenariusz
+        rynkowy przy wyłączonych zmianach rynku) dostają ten sam klucz.
+        """
+        normalized = {
+            'years': scenario.get('years', 5),
+            'learning_intensity': float(scenario.get('learning_intensity', self.learning_intensity)),
+            'simulate_market_changes': bool(scenario.get('simulate_market_changes', True)),
+            'factors': tuple(float(scenario.get(name, weight)) for name, weight in sorted(self.progression_factors.items()))
+        }
+        
+        market_active = normalized['simulate_market_changes'] and self.market_trends
+        normalized['market_scenario'] = scenario.get('market_scenario', self.market_scenario) if market_active else None
+        
+        return tuple(sorted(normalized.items()))
+    
+    def _run_scenario(self, user_profile, target_role, scenario, n_runs, seed):
+        """
+        Uruchamia n_runs symulacji dla jednego scenariusza i zwraca zagregowane metryki
+        
+        Args:
+            user_profile: Profil użytkownika
+            target_role: Docelowa rola zawodowa
+            scenario: Słownik parametrów scenariusza
+            n_runs: Liczba przebiegów
+            seed: Ziarno losowości
+            
+        Returns:
+            Słownik z metrykami scenariusza
+        """
+        simulator = copy.copy(self)
+        simulator.progression_factors = {
+            name: scenario.get(name, weight) for name, weight in self.progression_factors.items()
+        }
+        simulator.learning_intensity = scenario.get('learning_intensity', self.learning_intensity)
+        simulator.market_scenario = scenario.get('market_scenario', self.market_scenario)
+        years = scenario.get('years', 5)
+        simulate_market_changes = scenario.get('simulate_market_changes', True)
+        
+        simulations = []
+        for run in range(n_runs):
+            # Wspólne liczby losowe dla wszystkich scenariuszy ułatwiają porównanie; ziarno trafia
+            # do lokalnego generatora symulacji, więc stan globalnych generatorów procesu
+            # wywołującego (np. wątku API) nie jest zmieniany
+            simulations.append(simulator.simulate_career_progression(
+                copy.deepcopy(user_profile), copy.deepcopy(target_role),
+                years=years, simulate_market_changes=simulate_market_changes,
+                seed=None if seed is None else seed + run
+            ))
+        
+        final_salaries = np.array([sim['salary'].iloc[-1] for sim in simulations], dtype=float)
+        final_match = np.array([sim['skill_match'].iloc[-1] for sim in simulations], dtype=float)
+        promotions = []
+        first_promotion = []
+        for sim in simulations:
+            events = sim['event'] == 'Awans zawodowy' if 'event' in sim else pd.Series(False, index=sim.index)
+            promotions.append(int(events.sum()))
+            if events.any():
+                first_promotion.append((sim.loc[events.idxmax(), 'date'] - sim['date'].iloc[0]).days / 365)
+        
+        roi = self.calculate_roi_batch(simulations)
+        
+        return {
+            'final_salary_mean': float(final_salaries.mean()),
+            'final_salary_p10': float(np.percentile(final_salaries, 10)),
+            'final_salary_p90': float(np.percentile(final_salaries, 90)),
+            'final_skill_match_mean': float(final_match.mean()),
+            'promotions_mean': float(np.mean(promotions)),
+            'promotion_probability': float(np.mean(np.array(promotions) > 0)),
+            'first_promotion_years_mean': float(np.mean(first_promotion)) if first_promotion else float('nan'),
+            'roi_mean': roi['roi_distribution'].get('mean', float('nan')),
+            'payback_period_median': roi['payback_distribution'].get('p50', float('inf'))
+        }
     
-    def _simulate_skill_acquisition(self, profile, target_role, quarter):
+    def _simulate_skill_acquisition(self, profile, target_role, quarter, rng=None):
         """
         Symuluje zdobywanie nowych umiejętności
         
@@ -139,6 +558,7 @@ class CareerSimulator:
             profile: Profil użytkownika
             target_role: Rola docelowa
             quarter: Numer kwartału symulacji
+            rng: Generator numpy (None - globalny np.random)
             
         Returns:
             Lista nowo zdobytych umiejętności
@@ -155,10 +575,10 @@ class CareerSimulator:
         missing_skills = [s for s in target_skills if s.get('name', '') not in current_skill_names]
         
         # Ustal liczbę umiejętności do zdobycia w tym kwartale
-        skills_per_quarter = 0.5  # Średnio pół umiejętności na kwartał
+        skills_per_quarter = self.learning_intensity  # Domyślnie pół umiejętności na kwartał
         
         # Dodaj losowość
-        skills_count = np.random.poisson(skills_per_quarter)
+        skills_count = (rng or np.random).poisson(skills_per_quarter)
         
         # Ogranicz do liczby brakujących umiejętności
         skills_count = min(skills_count, len(missing_skills))
@@ -177,13 +597,14 @@ class CareerSimulator:
         
         return []
     
-    def _simulate_market_demand(self, profile, quarter):
+    def _simulate_market_demand(self, profile, quarter, rng=None):
         """
         Symuluje zmiany popytu rynkowego
         
         Args:
             profile: Profil użytkownika
             quarter: Numer kwartału symulacji
+            rng: Generator numpy (None - globalny np.random)
             
         Returns:
             Współczynnik popytu rynkowego (0.5-1.5)
@@ -192,7 +613,7 @@ class CareerSimulator:
         base_trend = 1.0 + 0.1 * np.sin(quarter / 8.0)
         
         # Dodaj losowe wahania (szum)
-        noise = 0.05 * np.random.randn()
+        noise = 0.05 * (rng or np.random).standard_normal()
         
         # Uwzględnij branżę z profilu użytkownika
         industry_factor = 1.0
@@ -212,6 +633,7 @@ class CareerSimulator:
         # Oblicz końcowy współczynnik popytu
         demand_factor = base_trend + noise
         demand_factor *= industry_factor
+        demand_factor *= self.market_scenarios.get(self.market_scenario, 1.0)
         
         # Ogranicz wartość
         return max(0.5, min(1.5, demand_factor))
@@ -282,13 +704,14 @@ class CareerSimulator:
         # Oblicz stopień dopasowania
         return matching_skills_count / len(required_skill_names)
     
-    def _check_promotion(self, promotion_chance, quarter):
+    def _check_promotion(self, promotion_chance, quarter, rng=None):
         """
         Sprawdza, czy nastąpił awans
         
         Args:
             promotion_chance: Szansa na awans (0-1)
             quarter: Numer kwartału symulacji
+            rng: Generator numpy (None - globalny moduł random)
             
         Returns:
             True jeśli awansował, False w przeciwnym przypadku
@@ -300,15 +723,17 @@ class CareerSimulator:
         effective_chance = promotion_chance * time_factor
         
         # Losuj, czy nastąpił awans
-        return random.random() < effective_chance
+        return (rng or random).random() < effective_chance
     
-    def _get_next_role(self, profile, target_role):
+    def _get_next_role(self, profile, target_role, expected=False, rng=None):
         """
         Wybiera następną rolę w karierze
         
         Args:
             profile: Profil użytkownika
             target_role: Docelowa rola
+            expected: Czy użyć oczekiwanego (zamiast losowego) wzrostu wynagrodzenia
+            rng: Generator numpy (None - globalny moduł random)
             
         Returns:
             Słownik z danymi następnej roli
@@ -328,6 +753,17 @@ class CareerSimulator:
         if current_role.get('name', '') == target_role.get('name', ''):
             return current_role
         
+        next_role = self._path_next_role(current_role, target_role)
+        if next_role is not None:
+            return next_role
+        
+        # Oblicz nowe wynagrodzenie (wzrost 20-30%)
+        low, high = self.promotion_raise
+        salary_increase = (low + high) / 2 if expected else low + (high - low) * (rng or random).random()
+        return self._heuristic_next_role(current_role, salary_increase)
+    
+    def _path_next_role(self, current_role, target_role):
+        """Następna rola według generatora ścieżek (None - brak generatora lub ścieżki)"""
         # Jeśli mamy generator ścieżek, użyj go do znalezienia następnej roli
         if self.path_generator:
             try:
@@ -349,8 +785,10 @@ class CareerSimulator:
                         }
             except Exception as e:
                 self.logger.warning(f"Błąd podczas generowania ścieżki kariery: {e}")
-        
-        # Jeśli nie udało się użyć generatora ścieżek, wygeneruj następną rolę heurystycznie
+        return None
+    
+    def _heuristic_next_role(self, current_role, salary_increase):
+        """Następna rola wyznaczona heurystycznie (kolejny poziom, wynagrodzenie * salary_increase)"""
         current_level = current_role.get('level', 'Junior')
         current_salary = current_role.get('salary', 6000)
         
@@ -364,8 +802,6 @@ class CareerSimulator:
         
         next_level = level_progression.get(current_level, current_level)
         
-        # Oblicz nowe wynagrodzenie (wzrost 20-30%)
-        salary_increase = 1.2 + 0.1 * random.random()
         new_salary = current_salary * salary_increase
         
         # Generuj nazwę następnej roli
@@ -406,10 +842,317 @@ class CareerSimulator:
         
         return None
     
+    @stage_timer('career_timelines')
+    def simulate_career_timelines(self, current_role, target_role, time_frame=5, learning_intensity=5,
+                                  job_change_strategy='', current_skills=None, n_runs=1,
+                                  include_timeline=True, seed=None):
+        """
+        Symuluje oś czasu kariery (zdobywanie umiejętności i zmiany pracy) dla wielu przebiegów
+        
+        Wspólny silnik dla GUI. Losowania dla wszystkich przebiegów wykonywane są wektorowo
+        (numpy), przejścia między rolami są wyznaczane raz i zapisywane w tablicach, a każde
+        wydarzenie przechowuje tylko przyrost umiejętności ('skills_added') zamiast pełnej kopii.
+        
+        Args:
+            current_role: Nazwa obecnej roli
+            target_role: Nazwa docelowej roli
+            time_frame: Horyzont symulacji w latach
+            learning_intensity: Intensywność nauki (1-10)
+            job_change_strategy: Opis strategii zmiany pracy (PL lub EN)
+            current_skills: Lista obecnych umiejętności (nazwy)
+            n_runs: Liczba przebiegów
+            include_timeline: Czy zwracać listę wydarzeń (False - tylko podsumowanie)
+            seed: Ziarno generatora liczb losowych
+            
+        Returns:
+            Lista słowników (po jednym na przebieg) z podsumowaniem i opcjonalnie 'events'
+        """
+        rng = np.random.default_rng(seed)
+        current_skills = list(current_skills) if current_skills else ["Programming", "Basic IT"]
+        job_change_rate = self._job_change_interval(job_change_strategy)
+        learning_progress = learning_intensity / 10.0  # Od 0.1 do 1.0
+        
+        # Tablice przejść ról: indeks roli -> następna rola (zwykły krok / przeskok o dwa)
+        roles, next_step, next_jump, base_salary, salary_varies = self._timeline_role_table(current_role, target_role)
+        skill_pool = self._timeline_skill_pool(target_role)
+        
+        role_idx = np.zeros(n_runs, dtype=np.int64)
+        salary = self._timeline_salaries(rng, role_idx, base_salary, salary_varies)
+        initial_salary = salary.copy()
+        known_skills = [set(current_skills) for _ in range(n_runs)]
+        skills_acquired = np.zeros(n_runs, dtype=np.int64)
+        job_changes = np.zeros(n_runs, dtype=np.int64)
+        last_event_time = np.zeros(n_runs)
+        
+        events = None
+        if include_timeline:
+            events = [[{
+                'time': 0,
+                'role': roles[0],
+                'salary': int(salary[run]),
+                'skills_added': list(current_skills),
+                'event': 'Start of simulation'
+            }] for run in range(n_runs)]
+        
+        current_time = 0.0
+        while current_time < time_frame:
+            # Upływ czasu do następnego wydarzenia (maksymalnie pół roku)
+            increment = min(0.5, time_frame - current_time)
+            current_time += increment
+            event_time = round(current_time, 1)
+            
+            # Zdobywanie umiejętności - losowania dla wszystkich przebiegów naraz
+            learned = rng.random(n_runs) < learning_progress * increment
+            picks = rng.integers(len(skill_pool), size=n_runs)
+            for run in np.flatnonzero(learned):
+                new_skill = skill_pool[picks[run]]
+                if new_skill in known_skills[run]:
+                    continue
+                known_skills[run].add(new_skill)
+                skills_acquired[run] += 1
+                last_event_time[run] = event_time
+                if events is not None:
+                    events[run].append({
+                        'time': event_time,
+                        'role': roles[role_idx[run]],
+                        'salary': int(salary[run]),
+                        'skills_added': [new_skill],
+                        'event': f'Acquired skill: {new_skill}'
+                    })
+            
+            # Zmiana pracy (po okresie wynikającym ze strategii, z prawdopodobieństwem 30%)
+            changing = rng.random(n_runs) < 0.3
+            jumping = (current_time / time_frame > 0.8) & (rng.random(n_runs) > 0.7)
+            if current_time < job_change_rate:
+                continue
+            # Zmiana pracy możliwa dopiero po pierwszym wydarzeniu w przebiegu
+            changing &= (skills_acquired > 0) | (job_changes > 0)
+            
+            changed = np.flatnonzero(changing)
+            if len(changed) == 0:
+                continue
+            old_idx = role_idx[changed]
+            role_idx[changed] = np.where(jumping[changed], next_jump[old_idx], next_step[old_idx])
+            salary[changed] = self._timeline_salaries(rng, role_idx[changed], base_salary, salary_varies)
+            job_changes[changed] += 1
+            last_event_time[changed] = event_time
+            
+            if events is not None:
+                for run, old in zip(changed, old_idx):
+                    events[run].append({
+                        'time': event_time,
+                        'role': roles[role_idx[run]],
+                        'salary': int(salary[run]),
+                        'skills_added': [],
+                        'event': f'Job change: {roles[old]} → {roles[role_idx[run]]}'
+                    })
+        
+        results = []
+        for run in range(n_runs):
+            if events is not None and abs(last_event_time[run] - time_frame) > 0.1:
+                events[run].append({
+                    'time': time_frame,
+                    'role': roles[role_idx[run]],
+                    'salary': int(salary[run]),
+                    'skills_added': [],
+                    'event': 'End of simulation'
+                })
+            
+            start, final = initial_salary[run], salary[run]
+            result = {
+                'initial_role': roles[0],
+                'final_role': roles[role_idx[run]],
+                'initial_salary': int(start),
+                'final_salary': int(final),
+                'salary_growth': round(float((final / start) - 1) * 100, 1) if start > 0 else 0,
+                'skills_acquired': int(skills_acquired[run]),
+                'job_changes': int(job_changes[run])
+            }
+            if events is not None:
+                result['events'] = events[run]
+            results.append(result)
+        
+        return results
+    
+    @staticmethod
+    def iter_event_skills(events):
+        """
+        Odtwarza pełną listę umiejętności dla kolejnych wydarzeń z przyrostów 'skills_added'
+        
+        Args:
+            events: Lista wydarzeń zwrócona przez simulate_career_timelines
+            
+        Yields:
+            Krotki (wydarzenie, lista umiejętności po tym wydarzeniu) - lista jest współdzielona
+            i aktualizowana w miejscu, nie należy jej modyfikować
+        """
+        skills = []
+        for event in events:
+            skills.extend(event.get('skills_added', []))
+            yield event, skills
+    
+    def _job_change_interval(self, job_change_strategy):
+        """Zwraca liczbę lat przed zmianą pracy dla danej strategii"""
+        strategy = job_change_strategy.lower()
+        if "częsta" in strategy or "frequent" in strategy:
+            return 1.5  # co 1.5 roku
+        elif "umiarkowana" in strategy or "moderate" in strategy:
+            return 2.5  # co 2.5 roku
+        else:  # długoterminowa
+            return 4.0  # co 4 lata
+    
+    def _timeline_role_table(self, current_role, target_role):
+        """
+        Wyznacza tablice przejść między rolami osiągalnymi z obecnej roli
+        
+        Returns:
+            Krotka (nazwy ról, następna rola, rola po przeskoku, bazowe wynagrodzenie,
+            czy wynagrodzenie jest losowo różnicowane) - wszystko indeksowane numerem roli
+        """
+        roles = [current_role]
+        index = {current_role: 0}
+        next_step, next_jump = [], []
+        
+        i = 0
+        while i < len(roles):
+            for jump, table in ((False, next_step), (True, next_jump)):
+                role = self._timeline_career_step(roles[i], target_role, jump)
+                if role not in index:
+                    index[role] = len(roles)
+                    roles.append(role)
+                table.append(index[role])
+            i += 1
+        
+        salaries = [self._timeline_base_salary(role) for role in roles]
+        return (
+            roles,
+            np.array(next_step),
+            np.array(next_jump),
+            np.array([s[0] for s in salaries], dtype=float),
+            np.array([s[1] for s in salaries])
+        )
+    
+    def _timeline_salaries(self, rng, role_idx, base_salary, salary_varies):
+        """Losuje wynagrodzenia dla ról (wariacja +/- 10% dla ról o rozpoznanym poziomie)"""
+        variation = np.where(salary_varies[role_idx], rng.uniform(0.9, 1.1, size=len(role_idx)), 1.0)
+        return np.floor(base_salary[role_idx] * variation)
+    
+    def _timeline_base_salary(self, role):
+        """Zwraca bazowe wynagrodzenie dla roli oraz informację, czy podlega wariacji"""
+        # Podstawowe wynagrodzenia dla różnych poziomów
+        base_salaries = {
+            'Junior': 7000,
+            'Mid': 12000,
+            'Senior': 18000,
+            'Lead': 22000,
+            'Manager': 25000,
+            'Architect': 28000,
+            'Director': 35000,
+            'CTO': 45000
+        }
+        
+        # Sprawdź, czy rola zawiera któryś z kluczy
+        role_lower = role.lower()
+        for level, salary in base_salaries.items():
+            if level.lower() in role_lower:
+                return salary, True
+        
+        # Domyślne wynagrodzenie, jeśli nie znaleziono dopasowania
+        return 10000, False
+    
+    def _timeline_skill_pool(self, target_role):
+        """Zwraca listę umiejętności przydatnych na danej ścieżce kariery"""
+        # Typowe umiejętności dla różnych ścieżek kariery
+        skills_by_path = {
+            'java': ["Java", "Spring", "Hibernate", "Maven", "JUnit", "SQL", "Design Patterns", "Microservices"],
+            'python': ["Python", "Django", "Flask", "Pandas", "NumPy", "SQL", "REST API", "Git"],
+            'frontend': ["HTML", "CSS", "JavaScript", "React", "Angular", "TypeScript", "Webpack", "UI/UX"],
+            'backend': ["Design Patterns", "REST API", "Databases", "Caching", "Security", "Containerization", "Microservices"],
+            'devops': ["Docker", "Kubernetes", "Jenkins", "AWS", "Terraform", "Ansible", "Linux", "Monitoring"],
+            'data': ["SQL", "Python", "Data Analysis", "Data Visualization", "Statistics", "ETL", "Big Data"],
+            'ai': ["Machine Learning", "TensorFlow", "PyTorch", "NLP", "Computer Vision", "Statistics", "Deep Learning"],
+            'architect': ["System Design", "Scalability", "Performance Optimization", "Security", "Cloud Architecture"],
+            'manager': ["Team Leadership", "Project Management", "Agile", "Communication", "Budget Planning", "Risk Management"]
+        }
+        
+        # Znajdź odpowiednią kategorię umiejętności na podstawie roli docelowej
+        target_lower = target_role.lower()
+        relevant_skills = []
+        
+        for path, skills in skills_by_path.items():
+            if path in target_lower:
+                relevant_skills.extend(skills)
+        
+        # Jeśli nie znaleziono specyficznych umiejętności, użyj wspólnych
+        if not relevant_skills:
+            relevant_skills = [
+                "Communication", "Problem Solving", "Teamwork", "Git",
+                "HTTP", "REST API", "Documentation", "Testing", "Debugging"
+            ]
+        
+        # Dodaj umiejętności miękkie
+        soft_skills = [
+            "Communication", "Teamwork", "Time Management", "Critical Thinking",
+            "Presentation", "Negotiation", "Conflict Management", "Mentoring"
+        ]
+        
+        return sorted(set(relevant_skills + soft_skills))
+    
+    def _timeline_career_step(self, current_role, target_role, jump=False):
+        """
+        Wyznacza następny krok kariery na podstawie obecnej i docelowej roli
+        
+        Args:
+            current_role: Nazwa obecnej roli
+            target_role: Nazwa docelowej roli
+            jump: Czy przeskoczyć o dwa szczeble (szansa pod koniec symulacji)
+            
+        Returns:
+            Nazwa następnej roli
+        """
+        # Ścieżki awansu
+        career_paths = {
+            'developer': ['Junior Developer', 'Mid Developer', 'Senior Developer', 'Lead Developer', 'Solution Architect'],
+            'frontend': ['Junior Frontend', 'Frontend Developer', 'Senior Frontend', 'Frontend Lead', 'UI/UX Architect'],
+            'backend': ['Junior Backend', 'Backend Developer', 'Senior Backend', 'Backend Lead', 'System Architect'],
+            'data': ['Junior Data Analyst', 'Data Analyst', 'Data Engineer', 'Senior Data Engineer', 'Data Architect'],
+            'devops': ['Junior DevOps', 'DevOps Engineer', 'Senior DevOps', 'DevOps Lead', 'Cloud Architect'],
+            'manager': ['Team Lead', 'Project Manager', 'Senior PM', 'Program Manager', 'Director'],
+        }
+        
+        # Wybierz ścieżkę (domyślnie ścieżka developera)
+        path_key = 'developer'
+        for key in career_paths:
+            if key in current_role.lower() or key in target_role.lower():
+                path_key = key
+                break
+        
+        career_path = career_paths[path_key]
+        
+        # Znajdź obecną pozycję na ścieżce (jeśli nie znaleziono, zacznij od początku)
+        current_index = 0
+        for i, role in enumerate(career_path):
+            if role.lower() in current_role.lower():
+                current_index = i
+                break
+        
+        # Znajdź docelową pozycję (domyślnie koniec ścieżki)
+        target_index = len(career_path) - 1
+        for i, role in enumerate(career_path):
+            if role.lower() in target_role.lower():
+                target_index = i
+                break
+        
+        next_index = min(current_index + (2 if jump else 1), target_index)
+        return career_path[next_index]
+    
     def visualize_career_simulation(self, simulation_data, output_file=None):
         """
         Wizualizuje symulację kariery
         
+        Używa obiektowego API matplotlib (bez globalnego stanu pyplot), więc może być
+        wywoływana z wątków roboczych. Do renderowania z pamięcią podręczną służy ChartRenderer.
+        
         Args:
             simulation_data: DataFrame z danymi symulacji
             output_file: Ścieżka do pliku wyjściowego
@@ -421,8 +1164,13 @@ class CareerSimulator:
             self.logger.error("Brak danych do wizualizacji")
             return None
         
+        # matplotlib jest importowany przy pierwszym wykresie (symulacje go nie potrzebują)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
         # Utwórz figurę z trzema podwykresami
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 15), sharex=True)
+        fig = Figure(figsize=(12, 15))
+        ax1, ax2, ax3 = fig.subplots(3, 1, sharex=True)
         
         # Przygotuj oś X (daty)
         x = simulation_data['date']
@@ -434,15 +1182,18 @@ class CareerSimulator:
         ax1.grid(True)
         
         # Zaznacz punkty awansów
-        promotion_points = simulation_data[simulation_data.get('event', '') == 'Awans zawodowy']
+        if 'event' in simulation_data.columns:
+            promotion_points = simulation_data[simulation_data['event'] == 'Awans zawodowy']
+        else:
+            promotion_points = simulation_data.iloc[0:0]
         if not promotion_points.empty:
             ax1.scatter(promotion_points['date'], promotion_points['salary'], color='red', s=100, marker='^')
             
             # Dodaj etykiety awansów
-            for _, point in promotion_points.iterrows():
+            for role, date, salary in zip(promotion_points['role'], promotion_points['date'], promotion_points['salary']):
                 ax1.annotate(
-                    point['role'],
-                    (point['date'], point['salary']),
+                    role,
+                    (date, salary),
                     xytext=(10, 20),
                     textcoords='offset points',
                     arrowprops=dict(arrowstyle='->', color='red')
@@ -465,12 +1216,12 @@ class CareerSimulator:
         ax3.grid(True)
         
         # Formatuj oś X
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+        ax3.tick_params(axis='x', labelrotation=45)
+        fig.tight_layout()
         
         # Zapisz lub zwróć figure
         if output_file:
-            plt.savefig(output_file, bbox_inches='tight')
+            FigureCanvasAgg(fig).print_figure(output_file, bbox_inches='tight')
             
         return fig
     
@@ -479,15 +1230,62 @@ class CareerSimulator:
         Oblicza zwrot z inwestycji w rozwój kariery
         
         Args:
-            simulation_data: DataFrame z symulacją kariery
+            simulation_data: DataFrame z symulacją kariery lub lista DataFrame'ów
+                (np. przebiegi Monte Carlo) - wtedy zwracany jest rozkład ROI
             investment_costs: Słownik z kosztami inwestycji
             
         Returns:
             Słownik ze wskaźnikami ROI
         """
+        if isinstance(simulation_data, (list, tuple)):
+            return self.calculate_roi_batch(simulation_data, investment_costs)
+        
         if simulation_data.empty:
             return {'roi': 0, 'payback_period': float('inf'), 'net_gain': 0}
+        
+        total_cost = self._total_investment_cost(investment_costs)
+        metrics = self._roi_metrics(simulation_data, np.zeros(len(simulation_data), dtype=np.int64), 1, total_cost)
+        
+        # Przygotuj wynik
+        return {key: values[0].item() for key, values in metrics.items()}
+    
+    def calculate_roi_batch(self, simulations, investment_costs=None, percentiles=(5, 25, 50, 75, 95)):
+        """
+        Oblicza rozkład ROI i okresu zwrotu dla wielu przebiegów symulacji w jednym przejściu
+        
+        Args:
+            simulations: Lista DataFrame'ów z symulacjami lub jeden DataFrame z kolumną 'run'
+            investment_costs: Słownik z kosztami inwestycji
+            percentiles: Percentyle raportowane dla rozkładów
             
+        Returns:
+            Słownik z wynikami dla każdego przebiegu ('runs') oraz rozkładami ROI i okresu zwrotu
+        """
+        if isinstance(simulations, pd.DataFrame):
+            frames = simulations
+        else:
+            frames = [sim.assign(run=i) for i, sim in enumerate(simulations) if not sim.empty]
+            frames = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        
+        if frames.empty or 'run' not in frames.columns:
+            return {'runs': pd.DataFrame(), 'roi_distribution': {}, 'payback_distribution': {}}
+        
+        # Zachowaj kolejność punktów w ramach przebiegu, kody przebiegów 0..n-1
+        frames = frames.sort_values('run', kind='stable')
+        run_ids, run_codes = np.unique(frames['run'].to_numpy(), return_inverse=True)
+        
+        total_cost = self._total_investment_cost(investment_costs)
+        metrics = self._roi_metrics(frames, run_codes, len(run_ids), total_cost)
+        runs = pd.DataFrame(metrics, index=pd.Index(run_ids, name='run'))
+        
+        return {
+            'runs': runs,
+            'roi_distribution': self._describe_distribution(runs['roi'].to_numpy(), percentiles),
+            'payback_distribution': self._describe_distribution(runs['payback_period'].to_numpy(), percentiles)
+        }
+    
+    def _total_investment_cost(self, investment_costs):
+        """Zwraca całkowity koszt inwestycji (z domyślnymi kosztami, jeśli nie podano)"""
         # Jeśli nie podano kosztów, przyjmij domyślne wartości
         if investment_costs is None:
             investment_costs = {
@@ -495,43 +1293,55 @@ class CareerSimulator:
                 'certifications': 5000,  # Koszt certyfikatów
                 'time_value': 10000     # Wartość poświęconego czasu
             }
+        
+        return sum(investment_costs.values())
+    
+    def _roi_metrics(self, simulation_data, run_codes, n_runs, total_cost):
+        """
+        Wektorowo oblicza wskaźniki ROI dla jednego lub wielu przebiegów
+        
+        Args:
+            simulation_data: DataFrame z kolumnami 'date' i 'salary' (przebiegi ułożone kolejno)
+            run_codes: Tablica kodów przebiegu (0..n_runs-1) dla każdego wiersza
+            n_runs: Liczba przebiegów
+            total_cost: Całkowity koszt inwestycji
             
-        # Oblicz całkowity koszt inwestycji
-        total_cost = sum(investment_costs.values())
+        Returns:
+            Słownik tablic numpy (po jednej wartości na przebieg)
+        """
+        salaries = simulation_data['salary'].to_numpy(dtype=float)
+        dates = pd.to_datetime(simulation_data['date']).to_numpy().astype('datetime64[s]').astype(np.int64)
         
-        # Oblicz łączny wzrost wynagrodzenia
-        initial_salary = simulation_data.iloc[0]['salary']
-        final_salary = simulation_data.iloc[-1]['salary']
-        total_salary_gain = final_salary - initial_salary
+        # Pierwszy i ostatni wiersz każdego przebiegu
+        counts = np.bincount(run_codes, minlength=n_runs)
+        last_idx = np.cumsum(counts) - 1
+        first_idx = last_idx - counts + 1
+        initial_salary = salaries[first_idx]
+        final_salary = salaries[last_idx]
         
-        # Oblicz skumulowany wzrost wynagrodzenia (uwzględniając wszystkie wypłaty)
-        cumulative_gain = 0
+        # Liczba miesięcy między kolejnymi punktami (pełne dni / 30, min. 1 miesiąc)
+        days_diff = np.diff(dates) // 86400
+        months_diff = np.maximum(1.0, days_diff / 30)
         
-        # Zakładamy, że wynagrodzenie jest wypłacane co miesiąc
-        for i in range(1, len(simulation_data)):
-            prev_salary = simulation_data.iloc[i-1]['salary']
-            curr_salary = simulation_data.iloc[i]['salary']
-            
-            # Oblicz liczbę miesięcy między punktami symulacji
-            prev_date = simulation_data.iloc[i-1]['date']
-            curr_date = simulation_data.iloc[i]['date']
-            months_diff = max(1, (curr_date - prev_date).days / 30)
-            
-            # Dodaj przyrost wynagrodzenia za ten okres
-            period_gain = (curr_salary - initial_salary) * months_diff
-            cumulative_gain += period_gain
+        # Przyrost wynagrodzenia za okres - pomijamy granice między przebiegami
+        period_gain = (salaries[1:] - initial_salary[run_codes[1:]]) * months_diff
+        same_run = run_codes[1:] == run_codes[:-1]
+        cumulative_gain = np.bincount(run_codes[1:][same_run], weights=period_gain[same_run], minlength=n_runs)
         
         # Oblicz ROI
-        roi = (cumulative_gain - total_cost) / total_cost if total_cost > 0 else float('inf')
+        if total_cost > 0:
+            roi = (cumulative_gain - total_cost) / total_cost
+        else:
+            roi = np.full(n_runs, np.inf)
         
         # Oblicz okres zwrotu (w latach)
-        monthly_gain = (final_salary - initial_salary)
-        payback_period = total_cost / monthly_gain / 12 if monthly_gain > 0 else float('inf')
+        monthly_gain = final_salary - initial_salary
+        with np.errstate(divide='ignore', invalid='ignore'):
+            payback_period = np.where(monthly_gain > 0, total_cost / monthly_gain / 12, np.inf)
         
-        # Przygotuj wynik
-        result = {
-            'total_investment': total_cost,
-            'monthly_salary_increase': final_salary - initial_salary,
+        return {
+            'total_investment': np.full(n_runs, total_cost),
+            'monthly_salary_increase': monthly_gain,
             'cumulative_gain': cumulative_gain,
             'roi': roi,
             'roi_percent': roi * 100,
@@ -539,5 +1349,21 @@ class CareerSimulator:
             'payback_period_months': payback_period * 12,
             'net_gain': cumulative_gain - total_cost
         }
+    
+    def _describe_distribution(self, values, percentiles):
+        """Zwraca statystyki opisowe rozkładu (wartości nieskończone liczone osobno)"""
+        finite = values[np.isfinite(values)]
+        summary = {
+            'count': int(len(values)),
+            'infinite_share': float(1 - len(finite) / len(values)) if len(values) else 0.0
+        }
+        
+        if len(finite) == 0:
+            return summary
+        
+        summary['mean'] = float(finite.mean())
+        summary['std'] = float(finite.std())
+        for p, value in zip(percentiles, np.percentile(finite, percentiles)):
+            summary[f'p{p}'] = float(value)
         
-        return result 
\ No newline at end of file
+        return summary
\ No newline at end of file
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+class ChartRenderer:
+    """
+    Renderowanie wykresów do bajtów PNG/SVG z pamięcią podręczną
+
+    Korzysta wyłącznie z obiektowego API matplotlib (Figure + FigureCanvasAgg), bez
+    globalnego stanu pyplot, dzięki czemu może być wywoływany z wątków roboczych API.
+    Każda figura jest jawnie zwalniana po zapisaniu do bufora.
+    """
+
+    MIME_TYPES = {
+        'png': 'image/png',
+        'svg': 'image/svg+xml'
+    }
+
+    def __init__(self, max_entries=128, dpi=100):
+        """
+        Inicjalizacja renderera wykresów
+
+        Args:
+            max_entries: Maksymalna liczba wykresów przechowywanych w pamięci podręcznej
+            dpi: Rozdzielczość wykresów rastrowych
+        """
+        self.max_entries = max_entries
+        self.dpi = dpi
+        self.logger = logging.getLogger(__name__)
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def data_key(data):
+        """
+        Oblicza skrót danych wejściowych wykresu
+
+        Args:
+            data: DataFrame, lista/słownik serializowalny do JSON lub dowolny obiekt
+
+        Returns:
+            Skrót SHA-256 (hex)
+        """
+        digest = hashlib.sha256()
+        # DataFrame może istnieć tylko, gdy pandas jest już załadowany - bez importu przy starcie
+        pd = sys.modules.get('pandas')
+        if pd is not None and isinstance(data, pd.DataFrame):
+            digest.update(json.dumps(list(map(str, data.columns))).encode())
+            digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+        else:
+            digest.update(json.dumps(data, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def render(self, figure_factory, key, fmt='png'):
+        """
+        Zwraca bajty wykresu z pamięci podręcznej lub renderuje go
+
+        Args:
+            figure_factory: Funkcja bez argumentów zwracająca obiekt matplotlib Figure
+            key: Klucz pamięci podręcznej (np. wynik data_key)
+            fmt: Format wyjściowy ('png' lub 'svg')
+
+        Returns:
+            Bajty obrazu lub None, jeśli nie udało się utworzyć wykresu
+        """
+        if fmt not in self.MIME_TYPES:
+            raise ValueError(f"Nieobsługiwany format wykresu: {fmt}")
+
+        cache_key = (key, fmt)
+        with self._lock:
+            if cache_key in self._cache:
+                self._cache.move_to_end(cache_key)
+                self.hits += 1
+                return self._cache[cache_key]
+            self.misses += 1
+
+        fig = figure_factory()
+        if fig is None:
+            return None
+
+        # Import przy pierwszym renderowaniu - matplotlib jest już załadowany przez figure_factory
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        try:
+            canvas = FigureCanvasAgg(fig)
+            buffer = BytesIO()
+            canvas.print_figure(buffer, format=fmt, dpi=self.dpi, bbox_inches='tight')
+            image = buffer.getvalue()
+        finally:
+            # Jawne zwolnienie figury - brak wycieków w długo działających procesach
+            fig.clear()
+
+        with self._lock:
+            self._cache[cache_key] = image
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+        return image
+
+    def render_career_simulation(self, simulator, simulation_data, fmt='png', key=None):
+        """
+        Renderuje wykres symulacji kariery
+
+        Args:
+            simulator: Obiekt CareerSimulator
+            simulation_data: DataFrame z danymi symulacji
+            fmt: Format wyjściowy ('png' lub 'svg')
+            key: Opcjonalny klucz (domyślnie skrót danych symulacji)
+
+        Returns:
+            Bajty obrazu lub None
+        """
+        if key is None:
+            key = self.data_key(simulation_data)
+        return self.render(lambda: simulator.visualize_career_simulation(simulation_data), f"simulation:{key}", fmt)
+
+    def render_career_path(self, path_generator, path, fmt='png', key=None):
+        """
+        Renderuje wykres ścieżki kariery
+
+        Args:
+            path_generator: Obiekt CareerPathGenerator
+            path: Lista ról tworzących ścieżkę
+            fmt: Format wyjściowy ('png' lub 'svg')
+            key: Opcjonalny klucz (domyślnie skrót ścieżki)
+
+        Returns:
+            Bajty obrazu lub None
+        """
+        if key is None:
+            key = self.data_key(path)
+        return self.render(lambda: path_generator.visualize_career_path(path), f"path:{key}", fmt)
+
+    def clear(self):
+        """Czyści pamięć podręczną wykresów"""
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,313 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+class JobCancelled(Exception):
+    """Zadanie zostało anulowane w trakcie wykonywania"""
+
+class JobContext:
+    """Kontekst wykonywanego zadania przekazywany do funkcji obsługi (postęp, anulowanie)"""
+
+    def __init__(self, queue, job_id):
+        self.queue = queue
+        self.job_id = job_id
+
+    def report(self, progress, message=None):
+        """
+        Zapisuje postęp zadania i sprawdza, czy zażądano anulowania
+
+        Args:
+            progress: Postęp (0-1)
+            message: Opcjonalny opis bieżącego etapu
+
+        Raises:
+            JobCancelled: Gdy zadanie zostało anulowane
+        """
+        cancel_requested = self.queue._update_progress(self.job_id, progress, message)
+        if cancel_requested:
+            raise JobCancelled(self.job_id)
+
+    @property
+    def cancelled(self):
+        """Czy zażądano anulowania zadania"""
+        job = self.queue.get(self.job_id)
+        return job is None or job['cancel_requested']
+
+class JobQueue:
+    """
+    Kolejka zadań w tle zapisywana w SQLite, wykonywana przez lokalną pulę wątków
+
+    Zadania przetrwają restart procesu: zadania przerwane w trakcie (proces, który je
+    pobrał, już nie działa) wracają do kolejki przy starcie. Kilka procesów (np. procesy
+    robocze serwera API) może współdzielić jedną bazę - zadanie jest pobierane atomowo
+    przez dokładnie jeden proces. Wyniki zakończonych zadań są usuwane po result_ttl.
+    """
+
+    STATUSES = ('queued', 'running', 'done', 'failed', 'cancelled')
+    FINISHED = ('done', 'failed', 'cancelled')
+
+    def __init__(self, db_path, max_workers=2, result_ttl=3600, poll_interval=1.0, executor=None):
+        """
+        Inicjalizacja kolejki
+
+        Args:
+            db_path: Ścieżka do pliku bazy SQLite
+            max_workers: Liczba zadań wykonywanych jednocześnie
+            result_ttl: Czas przechowywania wyników zakończonych zadań (s)
+            poll_interval: Odstęp sprawdzania kolejki pod kątem zadań z innych procesów (s)
+            executor: Istniejąca pula wątków (np. współdzielona z GUI); domyślnie własna
+        """
+        self.db_path = db_path
+        self.max_workers = max_workers
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger(__name__)
+        # Proces, w którym działa pula (po rozwidleniu procesu kolejkę trzeba utworzyć ponownie)
+        self.pid = os.getpid()
+
+        self.handlers = {}
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._slots = threading.Semaphore(max_workers)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._dispatcher = None
+        self._last_eviction = 0.0
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress REAL NOT NULL DEFAULT 0,
+                    message TEXT,
+                    result TEXT,
+                    error TEXT,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    worker_pid INTEGER,
+                    created REAL NOT NULL,
+                    started REAL,
+                    finished REAL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created)")
+
+    def register(self, kind, handler):
+        """
+        Rejestruje funkcję obsługi rodzaju zadania
+
+        Args:
+            kind: Nazwa rodzaju zadania
+            handler: Funkcja (params, JobContext) -> wynik serializowalny do JSON
+        """
+        self.handlers[kind] = handler
+
+    def start(self):
+        """Uruchamia wątek pobierający zadania (przywraca do kolejki zadania przerwanych procesów)"""
+        if self._dispatcher is not None and self._dispatcher.is_alive():
+            return
+
+        self._requeue_orphaned()
+        self._stopped.clear()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name='job-dispatcher', daemon=True)
+        self._dispatcher.start()
+
+    def stop(self, wait=True):
+        """Zatrzymuje pobieranie zadań (wykonywane zadania są kończone)"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._dispatcher is not None and wait:
+            self._dispatcher.join()
+        self.executor.shutdown(wait=wait)
+
+    def submit(self, kind, params=None):
+        """
+        Dodaje zadanie do kolejki
+
+        Args:
+            kind: Rodzaj zadania (zarejestrowany przez register)
+            params: Parametry zadania (serializowalne do JSON)
+
+        Returns:
+            Identyfikator zadania
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Nieznany rodzaj zadania: {kind}")
+
+        job_id = uuid.uuid4().hex
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, params, status, created) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, kind, json.dumps(params or {}), time.time())
+            )
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id):
+        """
+        Zwraca stan zadania
+
+        Args:
+            job_id: Identyfikator zadania
+
+        Returns:
+            Słownik (id, kind, status, progress, message, result, error, cancel_requested,
+            created, started, finished) lub None, gdy zadanie nie istnieje lub wygasło
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT id, kind, status, progress, message, result, error, cancel_requested, "
+                "created, started, finished FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        job = dict(row)
+        job['result'] = json.loads(job['result']) if job['result'] is not None else None
+        job['cancel_requested'] = bool(job['cancel_requested'])
+        return job
+
+    def cancel(self, job_id):
+        """
+        Anuluje zadanie (oczekujące od razu, wykonywane przy najbliższym raporcie postępu)
+
+        Args:
+            job_id: Identyfikator zadania
+
+        Returns:
+            True, jeśli zadanie istniało i nie było zakończone
+        """
+        with closing(self._connect()) as conn, conn:
+            queued = conn.execute(
+                "UPDATE jobs SET status = 'cancelled', cancel_requested = 1, finished = ? "
+                "WHERE id = ? AND status = 'queued'", (time.time(), job_id)
+            ).rowcount
+            running = conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,)
+            ).rowcount
+        return bool(queued or running)
+
+    def evict_expired(self):
+        """
+        Usuwa zakończone zadania starsze niż result_ttl
+
+        Returns:
+            Liczba usuniętych zadań
+        """
+        with closing(self._connect()) as conn, conn:
+            return conn.execute(
+                f"DELETE FROM jobs WHERE status IN {self.FINISHED} AND finished < ?",
+                (time.time() - self.result_ttl,)
+            ).rowcount
+
+    def _dispatch_loop(self):
+        """Pobiera zadania z kolejki i przekazuje je do puli, gdy są wolne miejsca"""
+        while not self._stopped.is_set():
+            try:
+                if time.time() - self._last_eviction > min(60.0, self.result_ttl):
+                    self._last_eviction = time.time()
+                    evicted = self.evict_expired()
+                    if evicted:
+                        self.logger.info(f"Usunięto {evicted} wygasłych zadań")
+
+                while not self._stopped.is_set() and self._slots.acquire(blocking=False):
+                    job = self._claim()
+                    if job is None:
+                        self._slots.release()
+                        break
+                    self.executor.submit(self._run, *job)
+            except Exception as e:
+                self.logger.error(f"Błąd kolejki zadań: {e}")
+
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def _claim(self):
+        """Atomowo pobiera najstarsze oczekujące zadanie (id, rodzaj, parametry) lub None"""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id, kind, params FROM jobs WHERE status = 'queued' ORDER BY created LIMIT 1"
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', started = ?, worker_pid = ? WHERE id = ?",
+                    (time.time(), os.getpid(), row['id'])
+                )
+            conn.commit()
+        return None if row is None else (row['id'], row['kind'], json.loads(row['params']))
+
+    def _run(self, job_id, kind, params):
+        """Wykonuje zadanie i zapisuje wynik lub błąd"""
+        try:
+            result = self.handlers[kind](params, JobContext(self, job_id))
+            self._finish(job_id, 'done', result=json.dumps(result, default=str))
+        except JobCancelled:
+            self._finish(job_id, 'cancelled')
+        except Exception as e:
+            self.logger.error(f"Błąd zadania {kind} ({job_id}): {e}")
+            self._finish(job_id, 'failed', error=str(e))
+        finally:
+            self._slots.release()
+            self._wakeup.set()
+
+    def _finish(self, job_id, status, result=None, error=None):
+        """Zapisuje stan końcowy zadania"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished = ?, "
+                "progress = CASE WHEN ? = 'done' THEN 1 ELSE progress END WHERE id = ?",
+                (status, result, error, time.time(), status, job_id)
+            )
+
+    def _update_progress(self, job_id, progress, message):
+        """Zapisuje postęp i zwraca, czy zażądano anulowania"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE jobs SET progress = ?, message = COALESCE(?, message) WHERE id = ?",
+                (float(min(max(progress, 0.0), 1.0)), message, job_id)
+            )
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row is None or bool(row['cancel_requested'])
+
+    def _requeue_orphaned(self):
+        """Przywraca do kolejki zadania pobrane przez procesy, które już nie działają"""
+        with closing(self._connect()) as conn, conn:
+            rows = conn.execute("SELECT id, worker_pid FROM jobs WHERE status = 'running'").fetchall()
+            orphaned = [row['id'] for row in rows if not self._pid_alive(row['worker_pid'])]
+            conn.executemany(
+                "UPDATE jobs SET status = 'queued', progress = 0, started = NULL, worker_pid = NULL WHERE id = ?",
+                [(job_id,) for job_id in orphaned]
+            )
+        if orphaned:
+            self.logger.info(f"Przywrócono do kolejki {len(orphaned)} przerwanych zadań")
+
+    @staticmethod
+    def _pid_alive(pid):
+        """Sprawdza, czy proces o danym PID działa"""
+        if not pid:
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def _connect(self):
+        """Otwiera połączenie z bazą (osobne dla każdej operacji i wątku)"""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
@@ -0,0 +1,293 @@
+import logging
+import os
+import uuid
+from datetime import datetime
+
+import pandas as pd
+
+# pyarrow jest opcjonalny - bez niego magazyn kolumnowy jest niedostępny;
+# importowany przy tworzeniu pierwszego magazynu przez _load_pyarrow()
+pa = pc = ds = None
+
+def _load_pyarrow():
+    """Importuje pyarrow przy pierwszym użyciu; zwraca moduł pyarrow lub None, gdy brak pakietu"""
+    global pa, pc, ds
+    if pa is None:
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.dataset as ds
+        except ImportError:
+            pa = pc = ds = None
+    return pa
+
+class ListingStore:
+    """
+    Kolumnowy magazyn ofert pracy (Parquet) z historią partycjonowaną po miesiącu i źródle
+
+    Układ katalogów (partycjonowanie w stylu Hive, np. month=2024-05/source=pracuj.pl):
+    - listings/: oferty bez listy umiejętności (jeden wiersz na ofertę),
+    - listing_skills/: umiejętności w postaci rozwiniętej (wiersz na parę oferta-umiejętność),
+      kolumna skill kodowana słownikowo,
+    - skill_monthly/: miesięczne agregaty popytu i wynagrodzeń dla umiejętności.
+
+    Odczyty przekazują listę kolumn i filtry (miesiące, źródła, umiejętności) do pyarrow,
+    więc zapytania o trendy czytają tylko potrzebne kolumny i partycje.
+    """
+
+    LISTINGS = 'listings'
+    SKILLS = 'listing_skills'
+    MONTHLY = 'skill_monthly'
+
+    def __init__(self, root):
+        """
+        Inicjalizacja magazynu
+
+        Args:
+            root: Katalog główny magazynu
+        """
+        if _load_pyarrow() is None:
+            raise ImportError("Magazyn ofert wymaga pakietu pyarrow (pip install pyarrow)")
+
+        self.root = root
+        self.logger = logging.getLogger(__name__)
+        self.partitioning = ds.partitioning(pa.schema([('month', pa.string()), ('source', pa.string())]), flavor='hive')
+        self.schemas = {
+            self.LISTINGS: pa.schema([
+                ('fingerprint', pa.string()),
+                ('title', pa.string()),
+                ('company', pa.string()),
+                ('location', pa.string()),
+                ('salary', pa.string()),
+                ('salary_value', pa.float64()),
+                ('date_posted', pa.string()),
+                ('first_seen', pa.string()),
+                ('month', pa.string()),
+                ('source', pa.string())
+            ]),
+            self.SKILLS: pa.schema([
+                ('fingerprint', pa.string()),
+                ('skill', pa.dictionary(pa.int32(), pa.string())),
+                ('salary_value', pa.float64()),
+                ('month', pa.string()),
+                ('source', pa.string())
+            ]),
+            self.MONTHLY: pa.schema([
+                ('skill', pa.dictionary(pa.int32(), pa.string())),
+                ('listings', pa.int64()),
+                ('avg_salary', pa.float64()),
+                ('median_salary', pa.float64()),
+                ('month', pa.string()),
+                ('source', pa.string())
+            ])
+        }
+        os.makedirs(root, exist_ok=True)
+
+    def append_listings(self, listings):
+        """
+        Dopisuje oferty do magazynu i przelicza agregaty miesięcy, których dotyczą
+
+        Oferty już zapisane (ten sam odcisk w tej samej partycji) są pomijane.
+
+        Args:
+            listings: DataFrame z ofertami (kolumny jak z MarketTrends.scrape_job_listings,
+                z wynagrodzeniem sparsowanym w kolumnie salary_value)
+
+        Returns:
+            Liczba dopisanych ofert
+        """
+        if listings is None or listings.empty:
+            return 0
+
+        frame = listings.copy()
+        if 'fingerprint' not in frame:
+            raise ValueError("Oferty muszą mieć kolumnę fingerprint")
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        if 'first_seen' not in frame:
+            frame['first_seen'] = today
+        for column in ('title', 'company', 'location', 'salary', 'date_posted', 'source'):
+            if column not in frame:
+                frame[column] = None
+        frame['first_seen'] = frame['first_seen'].fillna(today).astype(str)
+        frame['date_posted'] = frame['date_posted'].fillna(frame['first_seen']).astype(str)
+        frame['source'] = frame['source'].fillna('unknown').astype(str)
+        frame['month'] = frame['date_posted'].str.slice(0, 7)
+        if 'salary_value' not in frame:
+            frame['salary_value'] = None
+        # Adaptery bez listy umiejętności - oferty zapisywane bez wierszy umiejętności
+        if 'skills' not in frame:
+            frame['skills'] = [[] for _ in range(len(frame))]
+        frame['salary_value'] = pd.to_numeric(frame['salary_value'], errors='coerce')
+
+        # Pomiń oferty już obecne w magazynie (odczyt tylko kolumny fingerprint z dotkniętych partycji)
+        months, sources = sorted(frame['month'].unique()), sorted(frame['source'].unique())
+        existing = self._read(self.LISTINGS, ['fingerprint'], self._partition_filter(months, sources))
+        if not existing.empty:
+            frame = frame[~frame['fingerprint'].isin(existing['fingerprint'])]
+        frame = frame.drop_duplicates('fingerprint')
+        if frame.empty:
+            return 0
+
+        listings_table = pa.Table.from_pandas(frame[self.schemas[self.LISTINGS].names],
+                                              schema=self.schemas[self.LISTINGS], preserve_index=False)
+        self._write(self.LISTINGS, listings_table)
+
+        skills = frame[['fingerprint', 'skills', 'salary_value', 'month', 'source']].explode('skills')
+        skills = skills.rename(columns={'skills': 'skill'}).dropna(subset=['skill'])
+        skills = skills[skills['skill'] != "Brak danych"]
+        if not skills.empty:
+            skills['skill'] = skills['skill'].astype(str)
+            skills_table = pa.Table.from_pandas(skills, schema=self.schemas[self.SKILLS], preserve_index=False)
+            self._write(self.SKILLS, skills_table)
+
+        self._rebuild_monthly(sorted(frame['month'].unique()), sorted(frame['source'].unique()))
+        return len(frame)
+
+    def read_listings(self, columns=None, months=None, sources=None, include_skills=False):
+        """
+        Odczytuje oferty z przekazaniem projekcji i filtrów do pyarrow
+
+        Args:
+            columns: Lista kolumn (None - wszystkie)
+            months: Lista miesięcy 'RRRR-MM' lub krotka (od, do) włącznie
+            sources: Lista źródeł
+            include_skills: Czy dołączyć kolumnę skills (lista umiejętności oferty)
+
+        Returns:
+            DataFrame z ofertami
+        """
+        filter_expr = self._partition_filter(months, sources)
+        read_columns = None if columns is None else list(dict.fromkeys(['fingerprint'] + list(columns)))
+        frame = self._read(self.LISTINGS, read_columns, filter_expr)
+        if not include_skills or frame.empty:
+            return frame if columns is None else frame[[c for c in columns if c in frame]]
+
+        skills = self._read(self.SKILLS, ['fingerprint', 'skill'], filter_expr)
+        skill_lists = {}
+        for fingerprint, skill in zip(skills['fingerprint'], skills['skill'].astype(str)):
+            skill_lists.setdefault(fingerprint, []).append(skill)
+        frame['skills'] = [skill_lists.get(fingerprint, []) for fingerprint in frame['fingerprint']]
+        return frame if columns is None else frame[[c for c in columns if c in frame] + ['skills']]
+
+    def read_skill_monthly(self, skills=None, months=None, sources=None, columns=None):
+        """
+        Odczytuje miesięczne agregaty umiejętności
+
+        Args:
+            skills: Lista umiejętności (None - wszystkie)
+            months: Lista miesięcy 'RRRR-MM' lub krotka (od, do) włącznie
+            sources: Lista źródeł
+            columns: Lista kolumn (None - wszystkie)
+
+        Returns:
+            DataFrame z kolumnami month, source, skill, listings, avg_salary, median_salary
+        """
+        filter_expr = self._partition_filter(months, sources)
+        if skills is not None:
+            skill_expr = pc.field('skill').isin(pa.array(list(skills), pa.string()))
+            filter_expr = skill_expr if filter_expr is None else filter_expr & skill_expr
+        return self._read(self.MONTHLY, columns, filter_expr)
+
+    def skill_time_series(self, skill, value='listings', months=None, sources=None):
+        """
+        Zwraca miesięczny szereg czasowy dla umiejętności (suma po źródłach)
+
+        Args:
+            skill: Nazwa umiejętności
+            value: 'listings' (liczba ofert) lub 'avg_salary'
+            months: Lista miesięcy lub krotka (od, do)
+            sources: Lista źródeł
+
+        Returns:
+            DataFrame z kolumnami date, value
+        """
+        frame = self.read_skill_monthly([skill], months, sources, columns=['month', 'listings', 'avg_salary'])
+        if frame.empty:
+            return pd.DataFrame(columns=['date', 'value'])
+
+        if value == 'avg_salary':
+            # Średnia ważona liczbą ofert z wynagrodzeniem
+            frame['weighted'] = frame['avg_salary'] * frame['listings']
+            frame['weight'] = frame['listings'].where(frame['avg_salary'].notna(), 0)
+            grouped = frame.groupby('month')[['weighted', 'weight']].sum()
+            series = grouped['weighted'] / grouped['weight'].replace(0, float('nan'))
+        else:
+            series = frame.groupby('month')['listings'].sum()
+
+        result = series.reset_index()
+        result.columns = ['date', 'value']
+        result['date'] = pd.to_datetime(result['date'] + '-01')
+        return result.sort_values('date').reset_index(drop=True)
+
+    def months(self):
+        """Zwraca posortowaną listę miesięcy obecnych w magazynie"""
+        path = os.path.join(self.root, self.LISTINGS)
+        if not os.path.isdir(path):
+            return []
+        return sorted(name.split('=', 1)[1] for name in os.listdir(path) if name.startswith('month='))
+
+    def _rebuild_monthly(self, months, sources):
+        """Przelicza agregaty dla wskazanych partycji (miesiąc, źródło)"""
+        skills = self._read(self.SKILLS, ['skill', 'salary_value', 'month', 'source'],
+                            self._partition_filter(months, sources))
+        if skills.empty:
+            return
+
+        skills['skill'] = skills['skill'].astype(str)
+        monthly = skills.groupby(['month', 'source', 'skill'], observed=True).agg(
+            listings=('salary_value', 'size'),
+            avg_salary=('salary_value', 'mean'),
+            median_salary=('salary_value', 'median')
+        ).reset_index()
+
+        table = pa.Table.from_pandas(monthly[self.schemas[self.MONTHLY].names],
+                                     schema=self.schemas[self.MONTHLY], preserve_index=False)
+        # Agregat partycji jest zastępowany w całości
+        self._write(self.MONTHLY, table, existing_data_behavior='delete_matching')
+
+    def _partition_filter(self, months=None, sources=None):
+        """Buduje wyrażenie filtrujące partycje"""
+        expr = None
+        if months is not None:
+            if isinstance(months, tuple):
+                start, end = months
+                month_expr = None
+                if start:
+                    month_expr = pc.field('month') >= start
+                if end:
+                    end_expr = pc.field('month') <= end
+                    month_expr = end_expr if month_expr is None else month_expr & end_expr
+            else:
+                month_expr = pc.field('month').isin(pa.array(list(months), pa.string()))
+            expr = month_expr
+        if sources is not None:
+            source_expr = pc.field('source').isin(pa.array(list(sources), pa.string()))
+            expr = source_expr if expr is None else expr & source_expr
+        return expr
+
+    def _dataset(self, name):
+        """Zwraca zbiór danych pyarrow lub None, jeśli jeszcze nie istnieje"""
+        path = os.path.join(self.root, name)
+        if not os.path.isdir(path):
+            return None
+        return ds.dataset(path, format='parquet', partitioning=self.partitioning, schema=self.schemas[name])
+
+    def _read(self, name, columns=None, filter_expr=None):
+        """Odczytuje zbiór danych do DataFrame z projekcją i filtrem"""
+        dataset = self._dataset(name)
+        if dataset is None:
+            names = self.schemas[name].names
+            return pd.DataFrame(columns=names if columns is None else columns)
+        return dataset.to_table(columns=columns, filter=filter_expr).to_pandas()
+
+    def _write(self, name, table, existing_data_behavior='overwrite_or_ignore'):
+        """Zapisuje tabelę do partycji zbioru danych"""
+        ds.write_dataset(
+            table,
+            os.path.join(self.root, name),
+            format='parquet',
+            partitioning=self.partitioning,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior=existing_data_behavior
+        )
@@ -1,168 +1,770 @@
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from collections import namedtuple
+from urllib.parse import urlparse
+import hashlib
+import itertools
+import os
 import re
 import json
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
 
+# pyarrow jest opcjonalny - przyspiesza parsowanie wynagrodzeń (wyrażenia RE2 na całej kolumnie);
+# importowany przy pierwszym parsowaniu przez _load_pyarrow()
+pa = pc = None
+_pyarrow_checked = False
+
+from .listing_store import ListingStore
+from .scraper_adapters import SOURCE_ADAPTERS, register_adapter
+from .trend_stats import SkillTrendStats
+
+# Usuwane znaki literału listy zapisanego w CSV ("['Python', 'SQL']")
+_SKILL_LITERAL_CHARS = str.maketrans('', '', '[]\'"')
+
+def explode_skills(skills):
+    """
+    Rozwija kolumnę umiejętności do postaci jeden wiersz na parę oferta-umiejętność
+    
+    Listy są spłaszczane jednym przebiegiem; teksty (np. z CSV: "['Python', 'SQL']" lub
+    pojedyncza umiejętność) są parsowane zbiorczo na połączonym tekście zamiast
+    json.loads per wiersz.
+    
+    Args:
+        skills: Series z listami umiejętności lub tekstami
+        
+    Returns:
+        Series kategorii (umiejętności), indeks to pozycja oferty w kolumnie wejściowej
+    """
+    values = skills.to_numpy(dtype=object)
+    types = pd.Series(list(map(type, values)), dtype=object)
+    is_list = types.isin([list, tuple, np.ndarray]).to_numpy()
+    is_text = types.eq(str).to_numpy()
+    
+    lists = values[is_list]
+    lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    items = [np.fromiter(itertools.chain.from_iterable(lists), dtype=object, count=int(lengths.sum()))]
+    positions = [np.repeat(np.flatnonzero(is_list), lengths)]
+    
+    if is_text.any():
+        texts = values[is_text]
+        text_positions = np.flatnonzero(is_text)
+        is_literal = np.fromiter(map(str.startswith, texts, itertools.repeat('[')), dtype=bool, count=len(texts))
+        
+        # Literały list: jedno translate/split na połączonym tekście wszystkich wierszy
+        if is_literal.any():
+            literals = '\x1f'.join(texts[is_literal]).translate(_SKILL_LITERAL_CHARS).split('\x1f')
+            counts = np.fromiter(map(str.count, literals, itertools.repeat(',')), dtype=np.int64, count=len(literals)) + 1
+            items.append(np.array(list(map(str.strip, ','.join(literals).split(','))), dtype=object))
+            positions.append(np.repeat(text_positions[is_literal], counts))
+        
+        # Pojedyncze umiejętności zapisane jako tekst
+        items.append(np.array(list(map(str.strip, texts[~is_literal])), dtype=object))
+        positions.append(text_positions[~is_literal])
+    
+    items = np.concatenate(items)
+    positions = np.concatenate(positions)
+    if len(items) and len(positions) > 1 and (np.diff(positions) < 0).any():
+        order = np.argsort(positions, kind='stable')
+        items, positions = items[order], positions[order]
+    
+    # Braki (None/NaN) dostają kod -1; puste teksty są odrzucane po kodzie
+    codes, uniques = pd.factorize(items)
+    categories = pd.Index(np.asarray(uniques, dtype=object), dtype=object)
+    keep = codes >= 0
+    empty_code = categories.get_indexer([''])[0]
+    if empty_code >= 0:
+        keep &= codes != empty_code
+    return pd.Series(pd.Categorical.from_codes(codes[keep], categories), index=positions[keep])
+
+def parse_skills_column(skills, exploded=None):
+    """
+    Zamienia kolumnę umiejętności na listy (jednorazowo przy wczytywaniu danych)
+    
+    Args:
+        skills: Series z listami umiejętności lub tekstami
+        exploded: Gotowy wynik explode_skills(skills) (obliczany, jeśli brak)
+        
+    Returns:
+        Series list umiejętności z indeksem wejściowym
+    """
+    if exploded is None:
+        exploded = explode_skills(skills)
+    
+    counts = np.bincount(exploded.index.to_numpy(dtype=np.int64), minlength=len(skills))
+    names = iter(np.asarray(exploded.cat.categories, dtype=object)[exploded.cat.codes.to_numpy()].tolist())
+    return pd.Series([list(itertools.islice(names, count)) for count in counts.tolist()], index=skills.index, dtype=object)
+
+# Kursy walut względem PLN (przybliżone - do porównywania ofert, nie do rozliczeń)
+SALARY_CURRENCY_RATES = {'PLN': 1.0, 'EUR': 4.3, 'USD': 4.0, 'GBP': 5.0, 'CHF': 4.5}
+
+# Przeliczniki okresu na wynagrodzenie miesięczne
+SALARY_PERIOD_FACTORS = {'month': 1.0, 'hour': 168.0, 'day': 21.0, 'year': 1 / 12}
+
+# Przelicznik kwoty netto na brutto (umowa o pracę, przybliżenie)
+SALARY_NET_TO_GROSS = 1.4
+
+def _salary_number(name):
+    """
+    Wzorzec kwoty (separatory tysięcy, część dziesiętna, sufiks k) z nazwanymi grupami
+
+    Kropki i przecinki są pobierane razem z cyframi do końca liczby ("10.000", "10,000.50"),
+    a o ich znaczeniu (tysiące czy część dziesiętna) decyduje _salary_amount - RE2 nie
+    obsługuje asercji wyprzedzających.
+    """
+    return (rf'(?P<{name}>\d{{1,3}}(?:[ \xa0]\d{{3}})+(?:[.,]\d+)*|\d+(?:[.,]\d+)*)'
+            rf'\s*(?P<{name}_k>[kK]\b)?')
+
+# Wzorce zgodne zarówno z re, jak i z RE2 (pyarrow). Kwota nie może następować po znaku
+# słowa - inaczej cyfra z oznaczeń typu "B2B" byłaby brana za wynagrodzenie
+_SALARY_RANGE = r'(?:^|[^\w])' + _salary_number('low') + r'(?:\s*(?:-|–|—|do|to)\s*' + _salary_number('high') + r')?'
+_SALARY_CURRENCY = r'(?i)(?P<currency>pln|zł|zl\b|eur|€|usd|\$|gbp|£|chf)'
+_SALARY_CURRENCY_CODES = {'pln': 'PLN', 'zł': 'PLN', 'zl': 'PLN', 'eur': 'EUR', '€': 'EUR', 'usd': 'USD',
+                          '$': 'USD', 'gbp': 'GBP', '£': 'GBP', 'chf': 'CHF'}
+_SALARY_PERIOD = r'(?i)(?P<period>godz|/\s*hr?\b|hour|dzie|day|rok|rocz|year|annual)'
+_SALARY_PERIOD_CODES = {'godz': 'hour', 'hour': 'hour', 'dzie': 'day', 'day': 'day',
+                        'rok': 'year', 'rocz': 'year', 'year': 'year', 'annual': 'year'}
+_SALARY_NET = r'(?i)(?P<net>netto|\bnet\b)'
+
+def _load_pyarrow():
+    """Importuje pyarrow przy pierwszym użyciu; zwraca pyarrow.compute lub None, gdy brak pakietu"""
+    global pa, pc, _pyarrow_checked
+    if not _pyarrow_checked:
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError:
+            pa = pc = None
+        _pyarrow_checked = True
+    return pc
+
+def _extract_groups(text, *patterns):
+    """
+    Odpowiednik text.str.extract(pattern) dla kilku wzorców z nazwanymi grupami
+    
+    Z pyarrow wyrażenia wykonuje silnik RE2 w C++ na całej kolumnie; bez niego
+    używany jest pandas str.extract. Niedopasowane grupy dają None.
+    """
+    columns = {}
+    if pc is not None:
+        array = pa.array(text.tolist(), pa.string())
+        for pattern in patterns:
+            extracted = pc.extract_regex(array, pattern)
+            matched = extracted.is_valid().to_numpy(zero_copy_only=False)
+            for i, name in enumerate(re.compile(pattern).groupindex):
+                values = extracted.field(i).to_numpy(zero_copy_only=False).astype(object)
+                values[~matched | (values == '')] = None
+                columns[name] = values
+        return pd.DataFrame(columns, index=text.index)
+    
+    for pattern in patterns:
+        extracted = text.str.extract(pattern)
+        for name in extracted:
+            columns[name] = extracted[name].where(extracted[name].notna() & extracted[name].ne(''), None)
+    return pd.DataFrame(columns, index=text.index)
+
+# Liczba z separatorami tysięcy (kropka/przecinek przed dokładnie trzema cyframi) i opcjonalną
+# częścią dziesiętną z jedną lub dwiema cyframi: "10.000", "10,000", "1.234,56", "1,234.56"
+_SALARY_GROUPED = r'\d{1,3}(?:[.,]\d{3})+(?:[.,]\d{1,2})?'
+
+def _salary_amount(number, thousands):
+    """
+    Zamienia wyciągnięte teksty liczb na kwoty (separatory tysięcy, część dziesiętna, sufiks k)
+
+    Kropka lub przecinek przed dokładnie trzema cyframi, po których liczba się kończy albo
+    następuje kolejny separator, oddziela tysiące; część dziesiętna to tylko [.,] z jedną lub
+    dwiema cyframi na końcu liczby. Pozostałe zapisy ("3.14159") są czytane jak liczba dziesiętna.
+    """
+    digits = number.str.replace(r'[ \xa0]', '', regex=True)
+    grouped = digits.str.fullmatch(_SALARY_GROUPED).fillna(False).astype(bool)
+    digits = digits.where(~grouped, digits.str.replace(r'[.,](?=\d{3}(?:[.,]|$))', '', regex=True))
+    amount = pd.to_numeric(digits.str.replace(',', '.'), errors='coerce')
+    return amount * np.where(thousands.notna(), 1000.0, 1.0)
+
+def parse_salaries(salary_text, currency_rates=None, net_to_gross=SALARY_NET_TO_GROSS):
+    """
+    Parsuje kolumnę tekstów wynagrodzeń zbiorczo (str.extract na unikalnych tekstach)
+    
+    Widełki ("10 500 – 14 000 zł brutto / mies.", "103–137 zł netto / godz.", "12k EUR")
+    są sprowadzane do miesięcznej kwoty brutto w PLN: waluta według kursów, stawki
+    godzinowe/dzienne/roczne według SALARY_PERIOD_FACTORS, kwoty netto przez net_to_gross.
+    Powtarzające się teksty (typowe dla ofert z portali) są parsowane tylko raz.
+    
+    Args:
+        salary_text: Series z tekstami wynagrodzeń (liczby są traktowane jak kwoty w PLN)
+        currency_rates: Kursy walut względem PLN (domyślnie SALARY_CURRENCY_RATES)
+        net_to_gross: Przelicznik kwoty netto na brutto
+        
+    Returns:
+        DataFrame (indeks jak salary_text) z kolumnami salary_min, salary_max, currency,
+        period, is_net i salary_value (środek widełek po normalizacji, NaN gdy brak)
+    """
+    rates = currency_rates or SALARY_CURRENCY_RATES
+    values = salary_text.to_numpy(dtype=object)
+    is_number = pd.Series(list(map(type, values)), dtype=object).isin([int, float, np.int64, np.float64]).to_numpy()
+    values = values.copy()
+    values[is_number] = [None if pd.isna(value) else str(value) for value in values[is_number]]
+    
+    codes, uniques = pd.factorize(values)
+    text = pd.Series(np.asarray(uniques, dtype=object), dtype=object).map(str)
+    
+    parsed = pd.DataFrame(index=text.index)
+    _load_pyarrow()
+    groups = _extract_groups(text, _SALARY_RANGE, _SALARY_CURRENCY, _SALARY_PERIOD, _SALARY_NET).astype(object)
+    parsed['salary_min'] = _salary_amount(groups['low'], groups['low_k']).astype(float)
+    parsed['salary_max'] = _salary_amount(groups['high'], groups['high_k']).astype(float)
+    parsed['salary_max'] = parsed['salary_max'].fillna(parsed['salary_min'])
+    
+    parsed['currency'] = groups['currency'].str.lower().map(_SALARY_CURRENCY_CODES).fillna('PLN')
+    period = groups['period'].str.lower()
+    # "/h", "/hr" - stawka godzinowa
+    parsed['period'] = period.map(_SALARY_PERIOD_CODES).where(period.isna() | period.isin(_SALARY_PERIOD_CODES), 'hour')
+    parsed['period'] = parsed['period'].fillna('month')
+    parsed['is_net'] = groups['net'].notna()
+    
+    factor = (parsed['currency'].map(rates).fillna(1.0)
+              * parsed['period'].map(SALARY_PERIOD_FACTORS)
+              * np.where(parsed['is_net'], net_to_gross, 1.0))
+    parsed['salary_value'] = (parsed['salary_min'] + parsed['salary_max']) / 2 * factor
+    
+    # Rozwinięcie wyników z unikalnych tekstów na wszystkie wiersze (kod -1 - brak tekstu)
+    result = parsed.reindex(codes)
+    result.index = salary_text.index
+    result['currency'] = result['currency'].fillna('PLN')
+    result['period'] = result['period'].fillna('month')
+    result['is_net'] = result['is_net'].fillna(False).astype(bool)
+    return result
+
+# Pobrana strona: treść (bajty), adres oraz informacja, czy serwer odpowiedział 304 Not Modified
+FetchedPage = namedtuple('FetchedPage', ['content', 'url', 'not_modified'])
+
+class ListingFetcher:
+    """
+    Pobieranie stron z ofertami pracy z pulą połączeń HTTP per host
+    
+    Dla każdego hosta utrzymywana jest osobna sesja requests (ponowne użycie połączeń),
+    limit równoległych żądań oraz minimalny odstęp między żądaniami. Błędy przejściowe
+    (5xx, 429, zerwane połączenia) są ponawiane z wykładniczym opóźnieniem. Opcjonalna
+    pamięć podręczna na dysku wysyła żądania warunkowe (ETag / Last-Modified).
+    """
+    
+    def __init__(self, per_host_limit=2, min_request_interval=0.5, timeout=(5, 15), max_retries=3,
+                 backoff_factor=0.5, user_agent='Mozilla/5.0', cache_dir=None):
+        """
+        Inicjalizacja mechanizmu pobierania
+        
+        Args:
+            per_host_limit: Maksymalna liczba równoległych żądań do jednego hosta
+            min_request_interval: Minimalny odstęp (s) między żądaniami do jednego hosta
+            timeout: Limit czasu (połączenie, odczyt) w sekundach
+            max_retries: Maksymalna liczba ponowień żądania
+            backoff_factor: Współczynnik wykładniczego opóźnienia między ponowieniami
+            user_agent: Nagłówek User-Agent
+            cache_dir: Katalog pamięci podręcznej HTTP (None - bez pamięci podręcznej)
+        """
+        self.per_host_limit = per_host_limit
+        self.min_request_interval = min_request_interval
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.user_agent = user_agent
+        self.cache_dir = cache_dir
+        
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._semaphores = {}
+        self._next_request_at = {}
+        self.stats = {'requests': 0, 'not_modified': 0}
+    
+    def fetch(self, url):
+        """
+        Pobiera stronę z uwzględnieniem limitów hosta i pamięci podręcznej
+        
+        Args:
+            url: Adres strony
+            
+        Returns:
+            FetchedPage (treść jako bajty - kodowanie rozpoznaje parser HTML)
+        """
+        host = urlparse(url).netloc
+        session, semaphore = self._get_host_state(host)
+        cached = self._read_cache(url)
+        
+        # Żądanie warunkowe na podstawie zapisanych nagłówków walidujących
+        headers = {}
+        if cached:
+            if cached['meta'].get('etag'):
+                headers['If-None-Match'] = cached['meta']['etag']
+            if cached['meta'].get('last_modified'):
+                headers['If-Modified-Since'] = cached['meta']['last_modified']
+        
+        with semaphore:
+            self._wait_for_slot(host)
+            response = session.get(url, timeout=self.timeout, headers=headers)
+        
+        with self._lock:
+            self.stats['requests'] += 1
+            if response.status_code == 304 and cached:
+                self.stats['not_modified'] += 1
+        
+        if response.status_code == 304 and cached:
+            return FetchedPage(cached['content'], url, True)
+        
+        response.raise_for_status()
+        self._write_cache(url, response)
+        return FetchedPage(response.content, url, False)
+    
+    def close(self):
+        """Zamyka wszystkie sesje HTTP"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+    
+    def _get_host_state(self, host):
+        """Zwraca (tworząc przy pierwszym użyciu) sesję i semafor dla hosta"""
+        with self._lock:
+            if host not in self._sessions:
+                # requests jest importowany przy pierwszym pobieraniu (analiza danych go nie potrzebuje)
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                retry = Retry(
+                    total=self.max_retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET', 'HEAD'])
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.per_host_limit, max_retries=retry)
+                session = requests.Session()
+                session.headers['User-Agent'] = self.user_agent
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._sessions[host], self._semaphores[host]
+    
+    def _cache_path(self, url):
+        """Zwraca ścieżkę pliku pamięci podręcznej (bez rozszerzenia) dla adresu"""
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest())
+    
+    def _read_cache(self, url):
+        """Odczytuje zapisaną odpowiedź (treść i nagłówki walidujące) lub None"""
+        if not self.cache_dir:
+            return None
+        
+        path = self._cache_path(url)
+        try:
+            with open(path + '.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(path + '.body', 'rb') as f:
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+        
+        return {'meta': meta, 'content': content}
+    
+    def _write_cache(self, url, response):
+        """Zapisuje odpowiedź, jeśli serwer zwrócił nagłówki walidujące"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not self.cache_dir or not (etag or last_modified):
+            return
+        
+        path = self._cache_path(url)
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified, 'fetched_at': datetime.now().isoformat()}
+        try:
+            # Zapis atomowy - równoległe wątki nie odczytają połowy pliku
+            for suffix, data, mode in (('.body', response.content, 'wb'), ('.json', json.dumps(meta), 'w')):
+                tmp_path = f"{path}{suffix}.{threading.get_ident()}.tmp"
+                with open(tmp_path, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+                    f.write(data)
+                os.replace(tmp_path, path + suffix)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Nie można zapisać pamięci podręcznej HTTP: {e}")
+    
+    def _wait_for_slot(self, host):
+        """Ogranicza częstotliwość żądań do hosta (minimalny odstęp między żądaniami)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at.get(host, now))
+            self._next_request_at[host] = slot + self.min_request_interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+
 class MarketTrends:
-    def __init__(self, data_path=None):
+    # Metryki danych rynkowych (job_market_data.csv) przechowywane jako tabele przestawne
+    MARKET_METRICS = ('demand', 'avg_salary', 'num_openings')
+    
+    LISTING_COLUMNS = ['title', 'company', 'location', 'salary', 'skills', 'date_posted', 'source',
+                       'fingerprint', 'first_seen', 'salary_value']
+    
+    def __init__(self, data_path=None, max_workers=8, fetcher=None, cache_dir=None, store_path=None):
         """
         Inicjalizacja mechanizmu analizy trendów rynkowych
         
         Args:
             data_path: Ścieżka do danych historycznych
+            max_workers: Liczba wątków pobierających oferty pracy
+            fetcher: Obiekt ListingFetcher (domyślnie tworzony przy pierwszym pobieraniu)
+            cache_dir: Katalog pamięci podręcznej HTTP i indeksu znanych ofert (None - wyłączone)
+            store_path: Katalog kolumnowego magazynu ofert (Parquet, wymaga pyarrow)
         """
         self.data = None
+        # Licznik zmian danych historycznych (unieważnia modele trendów)
+        self._data_version = 0
+        # Rozwinięte umiejętności danych historycznych (ramka, kategorie) - liczone raz
+        self._data_skills = None
+        self.currency_rates = dict(SALARY_CURRENCY_RATES)
+        self.net_to_gross = SALARY_NET_TO_GROSS
         if data_path:
             try:
                 self.data = pd.read_csv(data_path)
+                # Umiejętności parsowane raz przy wczytaniu, a nie przy każdej analizie
+                if 'skills' in self.data:
+                    exploded = explode_skills(self.data['skills'])
+                    self.data['skills'] = parse_skills_column(self.data['skills'], exploded)
+                    self._data_skills = (self.data, exploded)
+                # Wynagrodzenia parsowane raz i przechowywane jako kolumna liczbowa
+                if 'salary' in self.data and 'salary_value' not in self.data:
+                    self.data['salary_value'] = self._parse_salaries(self.data['salary'])['salary_value']
             except Exception as e:
                 logging.error(f"Nie można załadować danych: {e}")
         
-        self.trend_models = {}
+        # Tabele przestawne danych rynkowych (metryka -> data × umiejętność)
+        self.market_pivots = {}
+        self._skill_columns = {}
+        # Przyrostowe statystyki trendów (sumy regresji, EWMA, szkice wynagrodzeń)
+        self.trend_stats = SkillTrendStats()
         self.logger = logging.getLogger(__name__)
+        if self.data is not None:
+            self._ingest_market_rows(self.data)
+        
+        # Modele trendów: umiejętność -> (wyraz wolny, nachylenie, ostatni okres); ważne dla danej wersji self.data
+        self.trend_models = {}
+        self._trend_models_token = None
+        # Rankingi umiejętności (nazwa -> widok z wybranymi K najlepszymi); ważne dla danej wersji self.data
+        self._ranked_views = {}
+        self._ranked_views_token = None
+        
+        # Adaptery portali (nazwa źródła -> strategia pobierania i parsowania)
+        self.adapters = dict(SOURCE_ADAPTERS)
+        self.max_workers = max_workers
+        self.fetcher = fetcher
+        self.cache_dir = cache_dir
+        
+        # Kolumnowy magazyn historii ofert (opcjonalny)
+        self.store = None
+        if store_path:
+            try:
+                self.store = ListingStore(store_path)
+            except Exception as e:
+                self.logger.error(f"Nie można otworzyć magazynu ofert: {e}")
+    
+    def __getstate__(self):
+        """Pomija sesje HTTP i blokady przy serializacji (np. do procesów roboczych)"""
+        state = self.__dict__.copy()
+        state['fetcher'] = None
+        return state
     
-    def scrape_job_listings(self, sources=None, keywords=None, limit=100):
+    def _get_fetcher(self):
+        """Zwraca mechanizm pobierania stron (tworzony przy pierwszym użyciu)"""
+        if self.fetcher is None:
+            http_cache = os.path.join(self.cache_dir, 'http') if self.cache_dir else None
+            self.fetcher = ListingFetcher(cache_dir=http_cache)
+        return self.fetcher
+    
+    @staticmethod
+    def listing_fingerprint(listing):
         """
-        Zbiera oferty pracy z różnych portali
+        Oblicza odcisk oferty niezależny od formatowania (ta sama oferta z kolejnych pobrań)
         
         Args:
-            sources: Lista źródeł do zbadania
-            keywords: Słowa kluczowe do wyszukiwania
-            limit: Maksymalna liczba ofert do zebrania
+            listing: Słownik lub wiersz z polami source, title, company, location
             
         Returns:
-            DataFrame z zebranymi ofertami pracy
+            Skrót SHA-1 (hex)
         """
-        if sources is None:
-            sources = ["pracuj.pl", "nofluffjobs.com"]
+        parts = [' '.join(str(listing.get(field) or '').lower().split())
+                 for field in ('source', 'title', 'company', 'location')]
+        return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+    
+    def _seen_index_path(self):
+        """Zwraca ścieżkę indeksu znanych ofert lub None"""
+        return os.path.join(self.cache_dir, 'seen_listings.json') if self.cache_dir else None
+    
+    def _load_seen_index(self):
+        """Wczytuje indeks znanych ofert (odcisk -> data pierwszego zauważenia)"""
+        path = self._seen_index_path()
+        if not path or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Nie można wczytać indeksu znanych ofert: {e}")
+            return {}
+    
+    def _save_seen_index(self, seen_index):
+        """Zapisuje indeks znanych ofert (zapis atomowy)"""
+        path = self._seen_index_path()
+        if not path:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(seen_index, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Nie można zapisać indeksu znanych ofert: {e}")
+    
+    def append_market_data(self, rows):
+        """
+        Dopisuje nowe wiersze danych rynkowych (date, skill, demand, avg_salary, num_openings)
         
-        if keywords is None:
-            keywords = ["python", "java", "javascript", "data science", "machine learning"]
+        Tabele przestawne i statystyki trendów są aktualizowane tylko o nowe wiersze,
+        bez ponownego wczytywania całej historii; modele trendów zostają unieważnione.
+        Wiersz dla istniejącej pary data-umiejętność zastępuje poprzednią wartość.
         
-        all_listings = []
+        Args:
+            rows: DataFrame lub lista słowników z nowymi wierszami
+            
+        Returns:
+            Liczba dopisanych wierszy
+        """
+        rows = pd.DataFrame(rows)
+        if rows.empty:
+            return 0
         
-        for source in sources:
-            for keyword in keywords:
-                try:
-                    if source == "pracuj.pl":
-                        listings = self._scrape_pracuj_pl(keyword, limit // len(keywords) // len(sources))
-                    elif source == "nofluffjobs.com":
-                        listings = self._scrape_nofluffjobs(keyword, limit // len(keywords) // len(sources))
-                    else:
-                        self.logger.warning(f"Nieznane źródło: {source}")
-                        continue
-                    
-                    all_listings.extend(listings)
-                except Exception as e:
-                    self.logger.error(f"Błąd podczas zbierania danych z {source} dla {keyword}: {e}")
-        
-        # Konwersja do DataFrame
-        if all_listings:
-            return pd.DataFrame(all_listings)
-        else:
-            return pd.DataFrame(columns=['title', 'company', 'location', 'salary', 'skills', 'date_posted', 'source'])
+        self.data = rows.copy() if self.data is None else pd.concat([self.data, rows], ignore_index=True)
+        self._ingest_market_rows(rows)
+        self._data_version += 1
+        return len(rows)
     
-    def _scrape_pracuj_pl(self, keyword, limit=20):
+    def _ingest_market_rows(self, rows):
         """
-        Zbiera oferty pracy z pracuj.pl (implementacja przykładowa)
+        Aktualizuje tabele przestawne i przyrostowe statystyki trendów o podane wiersze
         
-        W rzeczywistej implementacji należy uwzględnić aktualne struktury stron
-        i polityki robotów.txt. Ten kod jest pokazowy i powinien być dostosowany 
-        do aktualnych wymagań.
+        Args:
+            rows: DataFrame z kolumnami date, skill i metrykami rynkowymi
         """
-        self.logger.info(f"Scraping pracuj.pl for: {keyword}")
-        listings = []
+        if not {'date', 'skill'}.issubset(rows.columns):
+            return
         
-        try:
-            # Ten URL jest przykładowy - w rzeczywistości trzeba sprawdzić aktualny format
-            url = f"https://www.pracuj.pl/praca/{keyword.replace(' ', '%20')};kw"
-            response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Przykładowe selektory - wymagają aktualizacji
-            job_items = soup.select('.results__list-container-item')[:limit]
-            
-            for item in job_items:
-                try:
-                    title = item.select_one('.offer-details__title-link').text.strip()
-                    company = item.select_one('.offer-company__name').text.strip()
-                    location = item.select_one('.offer-labels__item--location').text.strip()
-                    
-                    # Opcjonalne pola
-                    salary_elem = item.select_one('.offer-labels__item--salary')
-                    salary = salary_elem.text.strip() if salary_elem else "Nie podano"
-                    
-                    # Umiejętności mogą być ukryte w szczegółach oferty
-                    skills = ["Brak danych"]  # W rzeczywistości wymagałoby to dodatkowego pobierania stron szczegółowych
-                    
-                    listings.append({
-                        'title': title,
-                        'company': company,
-                        'location': location,
-                        'salary': salary,
-                        'skills': skills,
-                        'date_posted': datetime.now().strftime("%Y-%m-%d"),
-                        'source': "pracuj.pl"
-                    })
-                except Exception as e:
-                    self.logger.warning(f"Błąd podczas przetwarzania oferty: {e}")
-            
-        except Exception as e:
-            self.logger.error(f"Błąd podczas pobierania danych z pracuj.pl: {e}")
+        metrics = [metric for metric in self.MARKET_METRICS if metric in rows]
+        rows = rows.assign(date=pd.to_datetime(rows['date']))
+        cells = rows.groupby(['date', 'skill'], as_index=False)[metrics].mean()
         
-        return listings
+        # Poprzednie wartości tych samych komórek (przed nadpisaniem w tabelach przestawnych)
+        previous = pd.DataFrame(index=cells.index)
+        for metric in metrics:
+            pivot = self.market_pivots.get(metric)
+            if pivot is None:
+                continue
+            row_pos = pivot.index.get_indexer(cells['date'])
+            col_pos = pivot.columns.get_indexer(cells['skill'])
+            found = (row_pos >= 0) & (col_pos >= 0)
+            values = np.full(len(cells), np.nan)
+            values[found] = pivot.to_numpy(dtype=float)[row_pos[found], col_pos[found]]
+            previous[metric] = values
+        
+        self._update_market_pivots(rows)
+        stale = self.trend_stats.update(cells, previous)
+        
+        # Okresy dopisane poza kolejnością - EWMA przeliczana z kolumny tabeli przestawnej
+        demand = self.market_pivots.get('demand')
+        for skill in stale:
+            self.trend_stats.reset_ewma(skill, demand[skill].dropna().to_numpy(dtype=float))
     
-    def _scrape_nofluffjobs(self, keyword, limit=20):
+    def _update_market_pivots(self, rows):
         """
-        Zbiera oferty pracy z nofluffjobs.com (implementacja przykładowa)
+        Aktualizuje tabele przestawne (data × umiejętność) o podane wiersze
+        
+        Args:
+            rows: DataFrame z kolumnami date, skill i metrykami rynkowymi
         """
-        self.logger.info(f"Scraping nofluffjobs.com for: {keyword}")
-        listings = []
+        if not {'date', 'skill'}.issubset(rows.columns):
+            return
         
-        try:
-            # Ten URL jest przykładowy - w rzeczywistości trzeba sprawdzić aktualny format
-            url = f"https://nofluffjobs.com/pl/praca/{keyword.replace(' ', '+')}"
-            response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-            soup = BeautifulSoup(response.text, 'html.parser')
+        rows = rows.assign(date=pd.to_datetime(rows['date']))
+        for metric in self.MARKET_METRICS:
+            if metric not in rows:
+                continue
             
-            # Przykładowe selektory - wymagają aktualizacji
-            job_items = soup.select('.posting-list-item')[:limit]
+            new = rows.pivot_table(index='date', columns='skill', values=metric, aggfunc='mean')
+            pivot = self.market_pivots.get(metric)
+            if pivot is None:
+                pivot = new
+            else:
+                # Nowe daty/umiejętności rozszerzają tabelę; nowe wartości nadpisują stare komórki
+                pivot = pivot.reindex(index=pivot.index.union(new.index), columns=pivot.columns.union(new.columns))
+                pivot.loc[new.index, new.columns] = new.combine_first(pivot.loc[new.index, new.columns])
+            self.market_pivots[metric] = pivot.sort_index()
+        
+        self._skill_columns = {}
+        for pivot in self.market_pivots.values():
+            self._skill_columns.update((str(skill).lower(), skill) for skill in pivot.columns)
+    
+    def register_source(self, adapter):
+        """
+        Rejestruje adapter portalu dla tej instancji (np. nowy portal lub lokalny serwer testowy)
+        
+        Args:
+            adapter: Obiekt SourceAdapter
+        """
+        register_adapter(adapter, self.adapters)
+    
+    def persist_listings(self, job_listings):
+        """
+        Zapisuje zebrane oferty w magazynie kolumnowym
+        
+        Args:
+            job_listings: DataFrame z ofertami (wynik scrape_job_listings)
             
-            for item in job_items:
-                try:
-                    title = item.select_one('.posting-title__position').text.strip()
-                    company = item.select_one('.posting-title__company').text.strip()
-                    location = item.select_one('.posting-info__location').text.strip()
-                    
-                    # Opcjonalne pola
-                    salary_elem = item.select_one('.salary-range')
-                    salary = salary_elem.text.strip() if salary_elem else "Nie podano"
-                    
-                    # Pobranie umiejętności
-                    skills_elems = item.select('.posting-info__tags .btn-main')
-                    skills = [skill.text.strip() for skill in skills_elems] if skills_elems else ["Brak danych"]
-                    
-                    listings.append({
-                        'title': title,
-                        'company': company,
-                        'location': location,
-                        'salary': salary,
-                        'skills': skills,
-                        'date_posted': datetime.now().strftime("%Y-%m-%d"),
-                        'source': "nofluffjobs.com"
-                    })
-                except Exception as e:
-                    self.logger.warning(f"Błąd podczas przetwarzania oferty: {e}")
+        Returns:
+            Liczba dopisanych ofert
+        """
+        if self.store is None:
+            self.logger.error("Magazyn ofert nie jest skonfigurowany (store_path)")
+            return 0
+        
+        try:
+            if 'salary_value' not in job_listings and 'salary' in job_listings:
+                job_listings = job_listings.assign(salary_value=self._parse_salaries(job_listings['salary'])['salary_value'])
+            return self.store.append_listings(job_listings)
+        except Exception as e:
+            self.logger.error(f"Błąd podczas zapisu ofert w magazynie: {e}")
+            return 0
+    
+    def load_history(self, columns=None, months=None, sources=None, include_skills=True):
+        """
+        Wczytuje historię ofert z magazynu (tylko wskazane kolumny i partycje)
+        
+        Args:
+            columns: Lista kolumn (None - wszystkie)
+            months: Lista miesięcy 'RRRR-MM' lub krotka (od, do) włącznie
+            sources: Lista źródeł
+            include_skills: Czy dołączyć listy umiejętności ofert
             
+        Returns:
+            DataFrame z ofertami
+        """
+        if self.store is None:
+            self.logger.error("Magazyn ofert nie jest skonfigurowany (store_path)")
+            return pd.DataFrame()
+        
+        try:
+            return self.store.read_listings(columns, months, sources, include_skills)
         except Exception as e:
-            self.logger.error(f"Błąd podczas pobierania danych z nofluffjobs.com: {e}")
+            self.logger.error(f"Błąd podczas odczytu historii ofert: {e}")
+            return pd.DataFrame()
+    
+    def scrape_job_listings(self, sources=None, keywords=None, limit=100, max_pages=1, incremental=False):
+        """
+        Zbiera oferty pracy z różnych portali
+        
+        Strony są pobierane równolegle (pula wątków, limity per host), a parsowanie
+        odbywa się w miarę napływania odpowiedzi, gdy kolejne strony wciąż się pobierają.
+        Kolejna strona wyników jest pobierana tylko wtedy, gdy poprzednia się zmieniła
+        (brak 304 Not Modified) i zawierała nowe oferty. Duplikaty (ta sama oferta dla
+        kilku słów kluczowych) są usuwane na podstawie odcisku oferty.
+        
+        Args:
+            sources: Lista źródeł do zbadania
+            keywords: Słowa kluczowe do wyszukiwania
+            limit: Maksymalna liczba ofert do zebrania
+            max_pages: Maksymalna liczba stron wyników na słowo kluczowe
+            incremental: Czy zwrócić tylko oferty niewidziane w poprzednich pobraniach
+            
+        Returns:
+            DataFrame z zebranymi ofertami pracy
+        """
+        if sources is None:
+            sources = ["pracuj.pl", "nofluffjobs.com"]
+        
+        if keywords is None:
+            keywords = ["python", "java", "javascript", "data science", "machine learning"]
+        
+        tasks = []
+        for source in sources:
+            if source not in self.adapters:
+                self.logger.warning(f"Nieznane źródło: {source}")
+                continue
+            for keyword in keywords:
+                tasks.append((self.adapters[source], keyword))
         
-        return listings
+        per_task_limit = limit // len(keywords) // len(sources) if keywords and sources else 0
+        results = [[] for _ in tasks]
+        seen_index = self._load_seen_index()
+        known = set(seen_index)
+        
+        if tasks:
+            fetcher = self._get_fetcher()
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+                pending = {}
+                for i, (adapter, keyword) in enumerate(tasks):
+                    self.logger.info(f"Scraping {adapter.name} for: {keyword}")
+                    pending[executor.submit(adapter.fetch, fetcher, keyword, 1)] = (i, 1)
+                
+                # Parsuj strony w kolejności pobrania i dokładaj kolejne strony wyników
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        i, page = pending.pop(future)
+                        adapter, keyword = tasks[i]
+                        try:
+                            fetched = future.result()
+                            listings = adapter.parse(fetched.content, per_task_limit - len(results[i]))
+                        except Exception as e:
+                            self.logger.error(f"Błąd podczas zbierania danych z {adapter.name} dla {keyword}: {e}")
+                            continue
+                        
+                        fingerprints = [self.listing_fingerprint(listing) for listing in listings]
+                        has_new = any(fp not in known for fp in fingerprints)
+                        known.update(fingerprints)
+                        results[i].extend(listings)
+                        
+                        if (page < max_pages and has_new and not fetched.not_modified
+                                and len(results[i]) < per_task_limit):
+                            pending[executor.submit(adapter.fetch, fetcher, keyword, page + 1)] = (i, page + 1)
+        
+        all_listings = [listing for listings in results for listing in listings]
+        
+        if not all_listings:
+            return pd.DataFrame(columns=self.LISTING_COLUMNS)
+        
+        # Konwersja do DataFrame i usunięcie duplikatów
+        listings_df = pd.DataFrame(all_listings)
+        listings_df['fingerprint'] = [self.listing_fingerprint(listing) for listing in all_listings]
+        listings_df = listings_df.drop_duplicates('fingerprint').reset_index(drop=True)
+        
+        # Data pierwszego zauważenia uzupełnia brakującą datę publikacji
+        today = datetime.now().strftime("%Y-%m-%d")
+        is_new = ~listings_df['fingerprint'].isin(seen_index)
+        listings_df['first_seen'] = listings_df['fingerprint'].map(seen_index).fillna(today)
+        if 'date_posted' not in listings_df:
+            listings_df['date_posted'] = None
+        listings_df['date_posted'] = listings_df['date_posted'].fillna(listings_df['first_seen'])
+        
+        if self.cache_dir:
+            seen_index.update(zip(listings_df.loc[is_new, 'fingerprint'], listings_df.loc[is_new, 'first_seen']))
+            self._save_seen_index(seen_index)
+        
+        listings_df['salary_value'] = self._parse_salaries(listings_df['salary'])['salary_value']
+        
+        if incremental:
+            listings_df = listings_df[is_new].reset_index(drop=True)
+        
+        return listings_df
     
     def analyze_skills_demand(self, job_listings=None):
         """
@@ -180,77 +782,70 @@ class MarketTrends:
             self.logger.error("Brak danych do analizy popytu na umiejętności")
             return pd.DataFrame()
         
-        # Liczenie wystąpień umiejętności
-        all_skills = []
-        
-        # Sprawdź, czy skills to lista
-        for skills in job_listings['skills']:
-            if isinstance(skills, list):
-                all_skills.extend(skills)
-            elif isinstance(skills, str):
-                # Próbuj parsować jako JSON jeśli to string
-                try:
-                    skills_list = json.loads(skills.replace("'", "\""))
-                    all_skills.extend(skills_list)
-                except:
-                    # Jeśli nie jest to JSON, potraktuj jako pojedynczą umiejętność
-                    all_skills.append(skills)
-        
-        # Liczenie częstotliwości
-        skills_count = pd.Series(all_skills).value_counts().reset_index()
-        skills_count.columns = ['skill', 'count']
-        
-        # Dodawanie dodatkowych metryk
-        skills_count['percentage'] = skills_count['count'] / len(job_listings) * 100
+        # Ta sama oferta pobrana dla kilku słów kluczowych liczy się raz
+        if 'fingerprint' in job_listings:
+            job_listings = job_listings.drop_duplicates('fingerprint')
+        
+        # Umiejętności danych historycznych są rozwinięte przy wczytaniu
+        if self._data_skills is not None and self._data_skills[0] is job_listings:
+            exploded = self._data_skills[1]
+        else:
+            exploded = explode_skills(job_listings['skills'])
+        job_listings = job_listings.reset_index(drop=True)
+        
+        # Zliczanie po kodach całkowitych kategorii (jedno bincount zamiast pętli)
+        categories = exploded.cat.categories
+        counts = np.bincount(exploded.cat.codes.to_numpy(), minlength=len(categories))
+        
+        skills_count = pd.DataFrame({'skill': categories.astype(str), 'count': counts})
+        skills_count = skills_count[skills_count['count'] > 0]
+        skills_count['percentage'] = skills_count['count'] / max(len(job_listings), 1) * 100
         
         # Dodawanie analizy wynagrodzeń
-        skills_salary = self._analyze_skills_salary(job_listings)
+        skills_salary = self._analyze_skills_salary(job_listings, exploded)
         if not skills_salary.empty:
-            skills_count = pd.merge(skills_count, skills_salary, on='skill', how='left')
+            skills_count = skills_count.merge(skills_salary, on='skill', how='left')
         
-        return skills_count.sort_values('count', ascending=False)
+        return skills_count.sort_values('count', ascending=False, kind='stable').reset_index(drop=True)
     
-    def _analyze_skills_salary(self, job_listings):
+    def _analyze_skills_salary(self, job_listings, exploded=None):
         """
         Analizuje wynagrodzenia powiązane z umiejętnościami
         
         Args:
-            job_listings: DataFrame z ofertami pracy
+            job_listings: DataFrame z ofertami pracy (indeks pozycyjny)
+            exploded: Wynik explode_skills dla job_listings (obliczany, jeśli brak)
             
         Returns:
             DataFrame z analizą wynagrodzeń dla umiejętności
         """
-        # Przygotowanie danych
-        salary_data = []
+        if 'salary' not in job_listings and 'salary_value' not in job_listings:
+            return pd.DataFrame()
+        if exploded is None:
+            job_listings = job_listings.reset_index(drop=True)
+            exploded = explode_skills(job_listings['skills'])
         
-        for _, row in job_listings.iterrows():
-            skills = row['skills']
-            salary = row['salary']
-            
-            # Przeskocz oferty bez podanego wynagrodzenia
-            if salary == "Nie podano" or not isinstance(skills, list):
-                continue
-            
-            # Ekstrakcja wartości liczbowej z wynagrodzenia
-            salary_value = self._extract_salary(salary)
-            if salary_value is None:
-                continue
-            
-            # Dodaj każdą umiejętność z odpowiadającą pensją
-            for skill in skills:
-                salary_data.append({
-                    'skill': skill,
-                    'salary': salary_value
-                })
-        
-        if not salary_data:
+        # Wynagrodzenie liczone raz na ofertę (lub wzięte z kolumny salary_value) i przypisane do umiejętności
+        if 'salary_value' in job_listings:
+            salaries = job_listings['salary_value'].to_numpy(dtype=float)
+        else:
+            salaries = self._parse_salaries(job_listings['salary'])['salary_value'].to_numpy(dtype=float)
+        
+        skill_salaries = salaries[exploded.index.to_numpy()]
+        mask = ~np.isnan(skill_salaries)
+        if not mask.any():
             return pd.DataFrame()
         
-        # Grupowanie i obliczanie statystyk
-        df = pd.DataFrame(salary_data)
-        salary_stats = df.groupby('skill')['salary'].agg(['mean', 'median', 'min', 'max', 'count']).reset_index()
+        # Grupowanie po kodach kategorii i obliczanie statystyk
+        df = pd.DataFrame({'code': exploded.cat.codes.to_numpy()[mask], 'salary': skill_salaries[mask]})
+        salary_stats = df.groupby('code')['salary'].agg(['mean', 'median', 'min', 'max', 'count'])
+        salary_stats.insert(0, 'skill', exploded.cat.categories.astype(str)[salary_stats.index])
         
-        return salary_stats
+        return salary_stats.reset_index(drop=True).rename(columns={'count': 'salary_count'})
+    
+    def _parse_salaries(self, salary_text):
+        """Parsuje kolumnę wynagrodzeń z kursami walut i przelicznikiem netto tej instancji"""
+        return parse_salaries(salary_text, self.currency_rates, self.net_to_gross)
     
     def _extract_salary(self, salary_text):
         """
@@ -260,32 +855,10 @@ class MarketTrends:
             salary_text: Tekst z wynagrodzeniem
             
         Returns:
-            Średnia wartość wynagrodzenia jako liczba lub None
+            Miesięczne wynagrodzenie brutto w PLN (środek widełek) lub None
         """
-        try:
-            # Wyszukaj wzorce liczb z tekstu
-            numbers = re.findall(r'\d+\s*\d*', salary_text)
-            if not numbers:
-                return None
-            
-            # Konwersja tekstów na liczby
-            values = []
-            for num in numbers:
-                num = num.replace(" ", "")
-                try:
-                    values.append(float(num))
-                except ValueError:
-                    pass
-            
-            if len(values) == 1:
-                return values[0]
-            elif len(values) >= 2:
-                # Jeśli są podane widełki, zwróć średnią
-                return sum(values) / len(values)
-            else:
-                return None
-        except:
-            return None
+        value = self._parse_salaries(pd.Series([salary_text], dtype=object))['salary_value'].iloc[0]
+        return None if pd.isna(value) else float(value)
     
     def predict_future_trends(self, skill, time_periods=4):
         """
@@ -298,89 +871,120 @@ class MarketTrends:
         Returns:
             DataFrame z prognozą
         """
+        return self.predict_future_trends_batch([skill], time_periods).get(skill, pd.DataFrame())
+    
+    def predict_future_trends_batch(self, skills, time_periods=4):
+        """
+        Przewiduje przyszłe trendy dla wielu umiejętności naraz
+        
+        Trendy liniowe (popyt względem numeru miesiąca) są wyznaczane z przyrostowych
+        sum dostatecznych regresji, bez ponownego przeglądania historii. Pamięć podręczna
+        modeli jest unieważniana po zmianie self.data.
+        
+        Args:
+            skills: Lista nazw umiejętności
+            time_periods: Liczba okresów do przewidzenia w przyszłość
+            
+        Returns:
+            Słownik: umiejętność -> DataFrame z danymi historycznymi i prognozą
+            (pusty DataFrame, gdy danych jest za mało)
+        """
         if self.data is None:
             self.logger.error("Brak danych historycznych do przewidywania trendów")
-            return pd.DataFrame()
-        
-        # Przygotuj dane historyczne dla umiejętności
-        skill_data = self._prepare_skill_time_series(skill)
+            return {}
         
-        if skill_data.empty or len(skill_data) < 3:  # Potrzebujemy min. 3 punktów do sensownej predykcji
-            self.logger.warning(f"Niewystarczające dane historyczne dla umiejętności: {skill}")
-            return pd.DataFrame()
+        self._validate_trend_models()
+        skills = list(dict.fromkeys(skills))
         
-        # Przygotuj model
-        if skill not in self.trend_models:
-            X = np.array(range(len(skill_data))).reshape(-1, 1)
-            y = skill_data['value'].values
-            model = LinearRegression()
-            model.fit(X, y)
-            self.trend_models[skill] = model
-        else:
-            model = self.trend_models[skill]
+        # Przygotuj dane historyczne dla umiejętności
+        columns = {skill: self._skill_columns.get(str(skill).lower()) for skill in skills}
+        forecasts = {}
+        valid = []
+        for skill in skills:
+            if self.trend_stats.count(columns[skill]) < 3:  # Potrzebujemy min. 3 punktów do sensownej predykcji
+                self.logger.warning(f"Niewystarczające dane historyczne dla umiejętności: {skill}")
+                forecasts[skill] = pd.DataFrame()
+            else:
+                valid.append(skill)
         
-        # Utwórz punkty w przyszłości
-        future_periods = np.array(range(len(skill_data), len(skill_data) + time_periods)).reshape(-1, 1)
-        predictions = model.predict(future_periods)
+        if not valid:
+            return forecasts
         
-        # Utwórz DataFrame z prognozą
-        last_date = skill_data['date'].iloc[-1]
-        future_dates = [pd.to_datetime(last_date) + pd.DateOffset(months=i+1) for i in range(time_periods)]
+        # Modele brakujące w pamięci podręcznej - wprost z sum dostatecznych
+        to_fit = [columns[skill] for skill in valid if columns[skill] not in self.trend_models]
+        if to_fit:
+            self.trend_models.update(self.trend_stats.linear_trends(to_fit))
         
-        forecast = pd.DataFrame({
-            'date': future_dates,
-            'value': predictions,
-            'type': 'forecast'
-        })
+        # Prognozy dla wszystkich umiejętności: wyraz wolny + nachylenie × numer kolejnego miesiąca
+        coefficients = np.array([self.trend_models[columns[skill]] for skill in valid])
+        periods = coefficients[:, [2]] + 1 + np.arange(time_periods)[None, :]
+        predictions = coefficients[:, [0]] + coefficients[:, [1]] * periods
         
-        # Połącz dane historyczne z prognozą
-        skill_data['type'] = 'historical'
-        result = pd.concat([skill_data, forecast], ignore_index=True)
+        for i, skill in enumerate(valid):
+            skill_data = self._prepare_skill_time_series(skill)
+            last_date = pd.to_datetime(skill_data['date'].iloc[-1])
+            forecast = pd.DataFrame({
+                'date': [last_date + pd.DateOffset(months=k + 1) for k in range(time_periods)],
+                'value': predictions[i],
+                'type': 'forecast'
+            })
+            
+            # Połącz dane historyczne z prognozą
+            skill_data['type'] = 'historical'
+            forecasts[skill] = pd.concat([skill_data, forecast], ignore_index=True)
         
-        return result
+        return {skill: forecasts[skill] for skill in skills}
+    
+    def _data_token(self):
+        """Zwraca klucz wersji self.data dla pamięci podręcznych wyników"""
+        return (id(self.data), self._data_version, None if self.data is None else len(self.data))
     
-    def _prepare_skill_time_series(self, skill):
+    def _validate_trend_models(self):
+        """Czyści pamięć podręczną modeli trendów, jeśli self.data zostało zmienione"""
+        token = self._data_token()
+        if token != self._trend_models_token:
+            self.trend_models = {}
+            self._trend_models_token = token
+    
+    def _prepare_skill_time_series(self, skill, metric='demand'):
         """
         Przygotowuje szereg czasowy dla umiejętności
         
+        Szereg jest wycinkiem kolumny tabeli przestawnej (data × umiejętność) zbudowanej
+        przy wczytaniu danych, bez przeszukiwania całej historii.
+        
         Args:
-            skill: Nazwa umiejętności
+            skill: Nazwa umiejętności (wielkość liter bez znaczenia)
+            metric: Metryka ('demand', 'avg_salary', 'num_openings')
             
         Returns:
-            DataFrame z danymi historycznymi
+            DataFrame z kolumnami date, value (pusty, gdy brak danych)
         """
-        # Ta funkcja powinna przygotować dane w postaci:
-        # date, value
-        # gdzie value to może być liczba ofert pracy, średnia pensja, itp.
-        
-        # W rzeczywistej implementacji należałoby wykorzystać dane historyczne
-        # W tym przykładzie tworzymy sztuczne dane
-        
-        # Przykładowe dane
-        dates = pd.date_range(end=datetime.now(), periods=12, freq='M')
-        
-        if skill == "Python":
-            values = [100, 110, 115, 120, 140, 160, 165, 180, 200, 220, 240, 250]
-        elif skill == "Java":
-            values = [150, 145, 140, 135, 130, 125, 120, 115, 110, 105, 100, 95]
-        elif skill == "Machine Learning":
-            values = [50, 60, 75, 85, 100, 120, 150, 180, 210, 240, 260, 270]
-        else:
-            # Losowe wartości dla innych umiejętności
-            values = np.random.randint(50, 200, size=12).tolist()
+        pivot = self.market_pivots.get(metric)
+        column = self._skill_columns.get(str(skill).lower())
+        if pivot is None or column not in pivot:
+            return pd.DataFrame(columns=['date', 'value'])
         
+        series = pivot[column].dropna()
         return pd.DataFrame({
-            'date': dates,
-            'value': values
+            'date': series.index,
+            'value': series.to_numpy()
         })
 
-    def get_top_emerging_skills(self, n=10):
+    def get_top_emerging_skills(self, n=10, periods=None):
         """
         Zwraca najszybciej rozwijające się umiejętności
         
+        Wzrost to zmiana procentowa popytu między pierwszym a ostatnim dostępnym
+        okresem. Dla całej historii wynik pochodzi z przyrostowych statystyk trendów
+        (O(liczba umiejętności)); okno ostatnich okresów jest liczone z tabeli przestawnej.
+        Ranking jest wyznaczany raz dla danej wersji danych, kolejne wywołania
+        zwracają gotowe K pierwszych pozycji.
+        
         Args:
             n: Liczba umiejętności do zwrócenia
-            
+            periods: Liczba ostatnich okresów branych pod uwagę (None - cała historia)
+        
         Returns:
             DataFrame z najszybciej rozwijającymi się umiejętnościami
         """
@@ -388,47 +992,148 @@ class MarketTrends:
             self.logger.error("Brak danych historycznych do analizy trendów")
             return pd.DataFrame()
         
-        # W rzeczywistej implementacji należałoby przeanalizować historyczne dane
-        # i obliczyć trendy dla wszystkich umiejętności
-        
-        # Przykładowe dane
-        emerging_skills = [
-            {"skill": "Transformers", "growth_rate": 123.5, "current_demand": 75},
-            {"skill": "Kubernetes", "growth_rate": 98.3, "current_demand": 120},
-            {"skill": "MLOps", "growth_rate": 87.2, "current_demand": 60},
-            {"skill": "React", "growth_rate": 76.5, "current_demand": 200},
-            {"skill": "FastAPI", "growth_rate": 70.1, "current_demand": 50},
-            {"skill": "Terraform", "growth_rate": 65.8, "current_demand": 85},
-            {"skill": "GraphQL", "growth_rate": 63.2, "current_demand": 70},
-            {"skill": "Streamlit", "growth_rate": 58.9, "current_demand": 40},
-            {"skill": "PyTorch", "growth_rate": 55.4, "current_demand": 90},
-            {"skill": "Rust", "growth_rate": 53.7, "current_demand": 45},
-            {"skill": "TypeScript", "growth_rate": 50.2, "current_demand": 150},
-            {"skill": "Flutter", "growth_rate": 48.6, "current_demand": 80},
-            {"skill": "Golang", "growth_rate": 45.1, "current_demand": 110},
-            {"skill": "Snowflake", "growth_rate": 43.8, "current_demand": 55},
-            {"skill": "Spark", "growth_rate": 40.5, "current_demand": 95}
-        ]
-        
-        # Utwórz DataFrame i wybierz top N
-        df = pd.DataFrame(emerging_skills)
-        return df.nlargest(n, 'growth_rate')
-
+        ranked = self._ranked_view(('emerging', periods or None), lambda: self._emerging_skills_frame(periods), n)
+        return pd.DataFrame() if ranked is None else ranked.reset_index(drop=True)
+    
+    def _emerging_skills_frame(self, periods=None):
+        """
+        Oblicza wzrost popytu wszystkich umiejętności
+        
+        Args:
+            periods: Liczba ostatnich okresów (None - cała historia)
+        
+        Returns:
+            Krotka (DataFrame z kolumnami skill, growth_rate, current_demand; kolumna rankingu)
+            lub None, gdy brak danych rynkowych
+        """
+        if not periods and 'demand' in self.market_pivots:
+            summary = self.trend_stats.summary(quantiles=())
+            df = pd.DataFrame({
+                'skill': summary['skill'],
+                'growth_rate': summary['growth_rate'].round(1),
+                'current_demand': summary['current_demand']
+            })
+            return df, 'growth_rate'
+        
+        metric = 'demand' if 'demand' in self.market_pivots else 'num_openings'
+        pivot = self.market_pivots.get(metric)
+        if pivot is None or pivot.empty:
+            self.logger.error("Brak danych rynkowych (date, skill, demand) do analizy trendów")
+            return None
+        
+        if periods:
+            pivot = pivot.iloc[-periods:]
+        
+        # Pierwsza i ostatnia dostępna wartość każdej kolumny
+        first = pivot.bfill().iloc[0].to_numpy(dtype=float)
+        last = pivot.ffill().iloc[-1].to_numpy(dtype=float)
+        observed = pivot.notna().sum().to_numpy()
+        growth = np.divide(last - first, first, out=np.full_like(first, np.nan), where=(first > 0) & (observed > 1)) * 100
+        
+        df = pd.DataFrame({
+            'skill': pivot.columns,
+            'growth_rate': growth.round(1),
+            'current_demand': last
+        })
+        return df, 'growth_rate'
+    
     def get_high_paying_skills(self, top_n=10):
-        """Zwraca listę najlepiej płatnych umiejętności"""
+        """
+        Zwraca listę najlepiej płatnych umiejętności
+        
+        Średnie i mediany wynagrodzeń pochodzą z przyrostowych statystyk trendów
+        (kolumna avg_salary danych rynkowych); ranking jest wyznaczany raz dla danej
+        wersji danych.
+        
+        Args:
+            top_n: Liczba umiejętności do zwrócenia
+        
+        Returns:
+            Lista słowników z kluczami skill, avg_salary, median_salary
+        """
         try:
             # Sprawdź czy mamy dane
             if self.data is None or self.data.empty:
                 return []
             
-            # Grupuj według umiejętności i znajdź średnie wynagrodzenie
-            skills_salary = self.data.groupby('skill')['salary'].mean().reset_index()
-            
-            # Sortuj malejąco według wynagrodzenia
-            skills_salary = skills_salary.sort_values('salary', ascending=False)
-            
-            # Zwróć najlepiej płatne umiejętności
-            return skills_salary.head(top_n).to_dict('records')
+            ranked = self._ranked_view(('high_paying',), self._high_paying_skills_frame, top_n)
+            return [] if ranked is None else ranked.to_dict('records')
         except Exception as e:
             self.logger.error(f"Błąd podczas pobierania najlepiej płatnych umiejętności: {e}")
-            return [] 
\ No newline at end of file
+            return []
+    
+    def _high_paying_skills_frame(self):
+        """Zwraca (DataFrame z kolumnami skill, avg_salary, median_salary; kolumna rankingu)"""
+        summary = self.trend_stats.summary(quantiles=(0.5,))
+        df = pd.DataFrame({
+            'skill': summary['skill'],
+            'avg_salary': summary['avg_salary'].round(2),
+            'median_salary': summary['salary_q50'].round(2)
+        })
+        return df, 'avg_salary'
+    
+    def _ranked_view(self, name, build, k):
+        """
+        Zwraca K najlepszych wierszy rankingu z pamięci podręcznej
+        
+        Widok (wartości wszystkich umiejętności) jest budowany raz dla danej wersji
+        self.data. Pozycje są wybierane przez np.argpartition i sortowane tylko w obrębie
+        K wybranych; kolejne wywołania z K nie większym niż poprzednio zwracają gotowy
+        wycinek w O(K).
+        
+        Args:
+            name: Klucz widoku
+            build: Funkcja zwracająca (DataFrame, nazwa kolumny rankingu) lub None
+            k: Liczba pozycji
+        
+        Returns:
+            DataFrame z K pierwszymi wierszami (malejąco, bez braków wartości) lub None
+        """
+        token = self._data_token()
+        if token != self._ranked_views_token:
+            self._ranked_views = {}
+            self._ranked_views_token = token
+        
+        view = self._ranked_views.get(name)
+        if view is None:
+            built = build()
+            if built is None:
+                return None
+            frame, column = built
+            values = frame[column].to_numpy(dtype=float)
+            view = self._ranked_views[name] = {
+                'frame': frame,
+                'values': values,
+                'valid': np.flatnonzero(~np.isnan(values)),
+                'k': 0,
+                'ranked': frame.iloc[:0]
+            }
+        
+        k = max(int(k), 0)
+        if k > view['k'] and len(view['ranked']) < len(view['valid']):
+            view['ranked'] = view['frame'].iloc[self._top_k_indices(view['values'], view['valid'], k)]
+            view['k'] = k
+        return view['ranked'].iloc[:k].copy()
+    
+    @staticmethod
+    def _top_k_indices(values, candidates, k):
+        """
+        Zwraca indeksy K największych wartości (malejąco, remisy w kolejności pozycji jak nlargest)
+        
+        Args:
+            values: Tablica wartości
+            candidates: Indeksy branych pod uwagę pozycji
+            k: Liczba pozycji
+        
+        Returns:
+            Tablica indeksów
+        """
+        if k <= 0:
+            return candidates[:0]
+        if k < len(candidates):
+            # Wartość K-tej pozycji; remisy na progu rozstrzyga kolejność pozycji
+            threshold = values[candidates][np.argpartition(-values[candidates], k - 1)[k - 1]]
+            above = candidates[values[candidates] > threshold]
+            ties = candidates[values[candidates] == threshold][:k - len(above)]
+            candidates = np.concatenate([above, ties])
+        return candidates[np.lexsort((candidates, -values[candidates]))]
\ No newline at end of file
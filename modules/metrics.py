@@ -0,0 +1,220 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import ContextDecorator, contextmanager
+
+# Domyślne przedziały histogramów czasu (sekundy) - jak w klientach Prometheus
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class MetricsRegistry:
+    """
+    Rejestr metryk procesu (liczniki, wskaźniki, histogramy) w formacie Prometheus
+
+    Metryki są przechowywane w pamięci procesu - przy kilku procesach roboczych serwera
+    każdy z nich raportuje własne wartości (etykieta pid pozwala je rozróżnić i zsumować).
+    Wartości obliczane przy odczycie (np. trafienia pamięci podręcznej) dostarczają
+    funkcje zarejestrowane przez register_collector.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        Inicjalizacja rejestru
+
+        Args:
+            buckets: Górne granice przedziałów histogramów
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._metrics = {}
+        self._collectors = []
+        self._capture = threading.local()
+
+    def describe(self, name, kind, help_text):
+        """
+        Rejestruje metrykę (opcjonalne - nieopisane metryki są tworzone przy pierwszym użyciu)
+
+        Args:
+            name: Nazwa metryki
+            kind: Typ ('counter', 'gauge', 'histogram')
+            help_text: Opis metryki
+        """
+        with self._lock:
+            metric = self._metrics.setdefault(name, {'kind': kind, 'help': help_text, 'values': {}})
+            metric['kind'], metric['help'] = kind, help_text
+
+    def inc(self, name, value=1.0, labels=None):
+        """Zwiększa licznik (lub wskaźnik - wartość może być ujemna)"""
+        key = self._label_key(labels)
+        with self._lock:
+            values = self._metric(name, 'counter')['values']
+            values[key] = values.get(key, 0.0) + value
+
+    def set(self, name, value, labels=None):
+        """Ustawia wartość wskaźnika"""
+        key = self._label_key(labels)
+        with self._lock:
+            self._metric(name, 'gauge')['values'][key] = float(value)
+
+    def observe(self, name, value, labels=None):
+        """Dodaje obserwację do histogramu"""
+        key = self._label_key(labels)
+        with self._lock:
+            values = self._metric(name, 'histogram')['values']
+            histogram = values.get(key)
+            if histogram is None:
+                histogram = values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            histogram[0][bisect.bisect_left(self.buckets, value)] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+        samples = getattr(self._capture, 'samples', None)
+        if samples is not None:
+            samples.append((name, value, labels))
+
+    @contextmanager
+    def capture(self):
+        """
+        Zbiera obserwacje histogramów wykonane w bieżącym wątku
+
+        Służy do przekazania pomiarów z procesów puli do procesu głównego (replay).
+
+        Yields:
+            Lista krotek (nazwa, wartość, etykiety)
+        """
+        previous = getattr(self._capture, 'samples', None)
+        self._capture.samples = samples = []
+        try:
+            yield samples
+        finally:
+            self._capture.samples = previous
+
+    def replay(self, samples):
+        """Dodaje obserwacje zebrane przez capture (np. w innym procesie)"""
+        for name, value, labels in samples:
+            self.observe(name, value, labels)
+
+    def register_collector(self, collector):
+        """
+        Rejestruje funkcję dostarczającą metryki przy odczycie
+
+        Args:
+            collector: Funkcja bez argumentów zwracająca iterowalny zbiór krotek
+                (nazwa, typ, opis, etykiety, wartość)
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self, labels=None):
+        """
+        Zwraca metryki w formacie tekstowym Prometheus (wersja 0.0.4)
+
+        Args:
+            labels: Etykiety dodawane do wszystkich próbek (np. pid procesu)
+
+        Returns:
+            Tekst metryk
+        """
+        common = self._label_key(labels)
+        with self._lock:
+            metrics = {
+                name: {'kind': metric['kind'], 'help': metric['help'], 'values': {
+                    key: [list(value[0]), value[1], value[2]] if metric['kind'] == 'histogram' else value
+                    for key, value in metric['values'].items()
+                }}
+                for name, metric in self._metrics.items()
+            }
+            collectors = list(self._collectors)
+
+        for collector in collectors:
+            for name, kind, help_text, sample_labels, value in collector():
+                metric = metrics.setdefault(name, {'kind': kind, 'help': help_text, 'values': {}})
+                metric['values'][self._label_key(sample_labels)] = value
+
+        lines = []
+        for name in sorted(metrics):
+            metric = metrics[name]
+            if metric['help']:
+                lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['kind']}")
+            for key, value in sorted(metric['values'].items()):
+                key = common + key
+                if metric['kind'] != 'histogram':
+                    lines.append(f"{name}{self._format_labels(key)} {self._format_value(value)}")
+                    continue
+
+                counts, total, count = value
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                    cumulative += bucket_count
+                    le = '+Inf' if bound == math.inf else repr(float(bound))
+                    lines.append(f"{name}_bucket{self._format_labels(key + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{self._format_labels(key)} {self._format_value(total)}")
+                lines.append(f"{name}_count{self._format_labels(key)} {count}")
+        return '\n'.join(lines) + '\n'
+
+    def _metric(self, name, kind):
+        """Zwraca metrykę, tworząc ją przy pierwszym użyciu (wywoływane pod blokadą)"""
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = {'kind': kind, 'help': '', 'values': {}}
+        return metric
+
+    @staticmethod
+    def _label_key(labels):
+        """Zamienia słownik etykiet na posortowaną krotkę par"""
+        return tuple(sorted((str(key), str(value)) for key, value in (labels or {}).items()))
+
+    @staticmethod
+    def _format_labels(key):
+        """Formatuje etykiety próbki ({a="1",b="2"})"""
+        if not key:
+            return ''
+        escaped = (
+            f'{name}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+            for name, value in key
+        )
+        return '{' + ','.join(escaped) + '}'
+
+    @staticmethod
+    def _format_value(value):
+        """Formatuje wartość próbki"""
+        value = float(value)
+        if math.isnan(value):
+            return 'NaN'
+        if math.isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return repr(int(value)) if value.is_integer() and abs(value) < 2 ** 53 else repr(value)
+
+# Rejestr domyślny procesu (wspólny dla modułów i API)
+REGISTRY = MetricsRegistry()
+REGISTRY.describe('stage_duration_seconds', 'histogram', 'Czas etapów przetwarzania (s)')
+
+class stage_timer(ContextDecorator):
+    """
+    Mierzy czas etapu przetwarzania (histogram stage_duration_seconds{stage=...})
+
+    Użycie jako menedżer kontekstu lub dekorator:
+        with stage_timer('graph_search'):
+            ...
+    """
+
+    def __init__(self, stage, registry=None):
+        """
+        Args:
+            stage: Nazwa etapu (etykieta stage)
+            registry: Rejestr metryk (domyślnie REGISTRY)
+        """
+        self.stage = stage
+        self.registry = registry or REGISTRY
+        self._starts = threading.local()
+
+    def __enter__(self):
+        starts = self._starts.__dict__.setdefault('stack', [])
+        starts.append(time.perf_counter())
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self._starts.stack.pop()
+        self.registry.observe('stage_duration_seconds', elapsed, {'stage': self.stage})
+        return False
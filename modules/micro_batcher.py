@@ -0,0 +1,138 @@
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .metrics import REGISTRY
+
+REGISTRY.describe('micro_batches_total', 'counter', 'Liczba wykonanych partii')
+REGISTRY.describe('micro_batch_items_total', 'counter', 'Liczba elementów przetworzonych w partiach')
+
+class MicroBatcher:
+    """
+    Łączy współbieżne wywołania w partie przetwarzane jednym wywołaniem funkcji
+
+    Partia zabiera wszystkie elementy czekające w kolejce. Gdy kolejka jest pusta i żadna
+    partia się nie wykonuje, partia jest wysyłana od razu - przy małej współbieżności
+    żądania nie czekają. Gdy wszystkie miejsca wykonania są zajęte, elementy czekają
+    w kolejce i trafiają do następnej partii, więc pod obciążeniem partie rosną same.
+    Na dołączenie kolejnych elementów (do max_wait sekund lub max_batch_size) partia
+    czeka tylko wtedy, gdy równolegle wykonuje się inna partia (max_concurrency > 1).
+    """
+
+    def __init__(self, func, max_batch_size=32, max_wait=0.005, max_concurrency=1, name='batch'):
+        """
+        Inicjalizacja i uruchomienie wątku zbierającego partie
+
+        Args:
+            func: Funkcja (lista elementów) -> lista wyników w tej samej kolejności
+            max_batch_size: Maksymalna liczba elementów w partii
+            max_wait: Maksymalny czas oczekiwania na dołączenie kolejnych elementów (s),
+                gdy wykonuje się inna partia
+            max_concurrency: Liczba partii wykonywanych jednocześnie (1 - w wątku zbierającym)
+            name: Nazwa (wątki, etykieta metryk)
+        """
+        self.func = func
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+        self.max_concurrency = max(1, max_concurrency)
+        self.name = name
+        self.logger = logging.getLogger(__name__)
+        # Proces, w którym działa wątek (po rozwidleniu procesu trzeba utworzyć nowy obiekt)
+        self.pid = os.getpid()
+
+        self._queue = queue.Queue()
+        self._slots = threading.Semaphore(self.max_concurrency)
+        # Liczba partii w trakcie wykonania
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._executor = None
+        if self.max_concurrency > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix=f'{name}-batch')
+        self._thread = threading.Thread(target=self._collect_loop, name=f'{name}-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        """
+        Dodaje element do najbliższej partii
+
+        Args:
+            item: Element przekazywany do func
+
+        Returns:
+            Future z wynikiem dla elementu (lub wyjątkiem func)
+        """
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def stop(self):
+        """Kończy wątek zbierający (elementy już dodane są przetwarzane)"""
+        self._queue.put(None)
+        self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def _collect_loop(self):
+        """Zbiera elementy w partie i przekazuje je do wykonania"""
+        stopping = False
+        while not stopping:
+            entry = self._queue.get()
+            if entry is None:
+                break
+
+            # Czekaj na wolne miejsce wykonania - w tym czasie kolejka zbiera elementy
+            self._slots.acquire()
+            batch = [entry]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    # Kolejka pusta: bez wykonywanej partii nie ma na co czekać - wyślij od razu
+                    with self._in_flight_lock:
+                        idle = self._in_flight == 0
+                    if idle:
+                        break
+                    try:
+                        entry = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            with self._in_flight_lock:
+                self._in_flight += 1
+            if self._executor is not None:
+                self._executor.submit(self._run_batch, batch)
+            else:
+                self._run_batch(batch)
+
+    def _run_batch(self, batch):
+        """Wykonuje partię i przekazuje wyniki (lub wyjątek) do Future elementów"""
+        try:
+            batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                return
+
+            results = self.func([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Funkcja partii zwróciła {len(results)} wyników dla {len(batch)} elementów")
+
+            REGISTRY.inc('micro_batches_total', 1, {'batcher': self.name})
+            REGISTRY.inc('micro_batch_items_total', len(batch), {'batcher': self.name})
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        except Exception as e:
+            self.logger.error(f"Błąd partii {self.name} ({len(batch)} elementów): {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
+            self._slots.release()
@@ -0,0 +1,196 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+# Zbuforowana odpowiedź: treść (bajty JSON), ETag (bez cudzysłowów), czas utworzenia
+CachedResponse = namedtuple('CachedResponse', ['body', 'etag', 'created'])
+
+class ResponseCache:
+    """
+    Pamięć podręczna odpowiedzi idempotentnych punktów końcowych API
+
+    Klucz to skrót nazwy punktu końcowego, znormalizowanej treści żądania i wersji
+    danych, więc zmiana danych unieważnia wpisy bez jawnego czyszczenia. Wpisy są
+    przechowywane w pamięci procesu (LRU z czasem życia) i opcjonalnie w katalogu
+    współdzielonym przez procesy robocze serwera (plik na wpis, zapis atomowy).
+    Klucze z poprzednich wersji danych nie są już odczytywane, dlatego zapis co
+    sweep_interval sekund usuwa z katalogu współdzielonego pliki starsze niż ttl.
+    """
+
+    def __init__(self, max_entries=512, ttl=300, shared_dir=None, sweep_interval=None):
+        """
+        Inicjalizacja pamięci podręcznej
+
+        Args:
+            max_entries: Maksymalna liczba wpisów w pamięci procesu
+            ttl: Czas życia wpisu w sekundach
+            shared_dir: Katalog współdzielony przez procesy (None - tylko pamięć procesu)
+            sweep_interval: Minimalny odstęp (s) między czyszczeniami katalogu współdzielonego
+                (domyślnie ttl)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.shared_dir = shared_dir
+        self.sweep_interval = ttl if sweep_interval is None else sweep_interval
+        self.logger = logging.getLogger(__name__)
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Czas następnego czyszczenia katalogu współdzielonego (pierwsze przy pierwszym zapisie)
+        self._next_sweep = 0.0
+
+        if shared_dir:
+            os.makedirs(shared_dir, exist_ok=True)
+
+    @staticmethod
+    def normalize(body):
+        """Normalizuje treść żądania (pomija pola None, słowniki z posortowanymi kluczami)"""
+        if isinstance(body, dict):
+            return {key: ResponseCache.normalize(value) for key, value in sorted(body.items()) if value is not None}
+        if isinstance(body, (list, tuple)):
+            return [ResponseCache.normalize(value) for value in body]
+        return body
+
+    def key(self, endpoint, body, version):
+        """
+        Oblicza klucz wpisu
+
+        Args:
+            endpoint: Nazwa punktu końcowego
+            body: Treść żądania (słownik z JSON lub None)
+            version: Wersja danych, z których liczona jest odpowiedź
+
+        Returns:
+            Skrót SHA-256 (hex)
+        """
+        data = json.dumps([endpoint, self.normalize(body), version], sort_keys=True, default=str)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Zwraca wpis z pamięci procesu lub katalogu współdzielonego
+
+        Args:
+            key: Klucz wpisu
+
+        Returns:
+            CachedResponse lub None (brak lub wpis wygasł)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry.created < self.ttl:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry
+            if entry is not None:
+                del self._cache[key]
+
+        entry = self._read_shared(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, entry)
+        return entry
+
+    def put(self, key, body):
+        """
+        Zapisuje odpowiedź
+
+        Args:
+            key: Klucz wpisu
+            body: Treść odpowiedzi (bajty)
+
+        Returns:
+            CachedResponse
+        """
+        entry = CachedResponse(body, hashlib.sha256(body).hexdigest()[:32], time.time())
+        with self._lock:
+            self._store(key, entry)
+        self._write_shared(key, body)
+        self._sweep_shared(entry.created)
+        return entry
+
+    def clear(self):
+        """Usuwa wszystkie wpisy z pamięci procesu"""
+        with self._lock:
+            self._cache.clear()
+
+    def _store(self, key, entry):
+        """Dodaje wpis do LRU (wywoływane pod blokadą)"""
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def _read_shared(self, key, now):
+        """Wczytuje wpis z katalogu współdzielonego (wygasłe pliki są usuwane)"""
+        if not self.shared_dir:
+            return None
+
+        path = os.path.join(self.shared_dir, key)
+        try:
+            created = os.path.getmtime(path)
+            if now - created >= self.ttl:
+                os.remove(path)
+                return None
+            with open(path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        return CachedResponse(body, hashlib.sha256(body).hexdigest()[:32], created)
+
+    def _write_shared(self, key, body):
+        """Zapisuje wpis w katalogu współdzielonym (zapis atomowy)"""
+        if not self.shared_dir:
+            return
+
+        path = os.path.join(self.shared_dir, key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Nie można zapisać odpowiedzi w pamięci współdzielonej: {e}")
+
+    def _sweep_shared(self, now):
+        """
+        Usuwa z katalogu współdzielonego pliki starsze niż ttl (nie częściej niż co sweep_interval)
+
+        Obejmuje wpisy z poprzednich wersji danych i pliki tymczasowe przerwanych zapisów.
+        Kilka procesów może czyścić katalog jednocześnie - brakujące pliki są pomijane.
+
+        Returns:
+            Liczba usuniętych plików
+        """
+        if not self.shared_dir:
+            return 0
+        with self._lock:
+            if now < self._next_sweep:
+                return 0
+            self._next_sweep = now + self.sweep_interval
+
+        removed = 0
+        try:
+            with os.scandir(self.shared_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and now - entry.stat().st_mtime >= self.ttl:
+                            os.remove(entry.path)
+                            removed += 1
+                    except OSError:
+                        continue
+        except OSError as e:
+            self.logger.warning(f"Nie można wyczyścić pamięci współdzielonej: {e}")
+        if removed:
+            self.logger.info(f"Usunięto {removed} wygasłych wpisów pamięci współdzielonej")
+        return removed
@@ -0,0 +1,202 @@
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from urllib.parse import quote, quote_plus
+
+_default_html_parser = None
+
+def default_html_parser():
+    """
+    Zwraca najszybszy dostępny parser BeautifulSoup
+
+    lxml jest opcjonalny - parser oparty na libxml2 jest szybszy od html.parser. Sprawdzane
+    przy pierwszym parsowaniu, a nie przy imporcie modułu (analiza danych go nie potrzebuje).
+    """
+    global _default_html_parser
+    if _default_html_parser is None:
+        try:
+            import lxml  # noqa: F401
+            _default_html_parser = 'lxml'
+        except ImportError:
+            _default_html_parser = 'html.parser'
+    return _default_html_parser
+
+class SourceAdapter(ABC):
+    """
+    Adapter portalu z ofertami pracy (strategia budowania adresu, pobierania i parsowania)
+
+    Nowy portal dodaje się przez podklasę z ustawionymi atrybutami 'name', 'url_template'
+    i 'item_class' oraz implementacją parse_item, a następnie register_adapter().
+    Podklasa bez parse_item nie da się utworzyć (TypeError przy tworzeniu obiektu).
+    """
+
+    name = None
+    url_template = None
+    item_class = None
+    page_param = None
+    quote_keyword = staticmethod(quote)
+
+    def __init__(self, url_template=None, parser=None, restrict_to_items=True):
+        """
+        Inicjalizacja adaptera
+
+        Args:
+            url_template: Nadpisanie szablonu adresu (np. lokalny serwer z zapisanymi stronami)
+            parser: Parser BeautifulSoup ('lxml', 'html.parser'); domyślnie najszybszy dostępny
+            restrict_to_items: Czy parsować tylko elementy ofert (SoupStrainer) zamiast całej strony
+        """
+        if url_template:
+            self.url_template = url_template
+        self.parser = parser
+        self.restrict_to_items = restrict_to_items
+        self.logger = logging.getLogger(__name__)
+
+    def build_url(self, keyword, page=1):
+        """Buduje adres wyszukiwania dla słowa kluczowego i numeru strony wyników"""
+        url = self.url_template.format(keyword=self.quote_keyword(keyword))
+        if page > 1 and self.page_param:
+            url += f"{'&' if '?' in url else '?'}{self.page_param}={page}"
+        return url
+
+    def fetch(self, fetcher, keyword, page=1):
+        """
+        Pobiera stronę wyników
+
+        Args:
+            fetcher: Obiekt ListingFetcher
+            keyword: Słowo kluczowe
+            page: Numer strony wyników
+
+        Returns:
+            FetchedPage
+        """
+        return fetcher.fetch(self.build_url(keyword, page))
+
+    def parse(self, html, limit=20):
+        """
+        Parsuje stronę wyników
+
+        Args:
+            html: Treść strony
+            limit: Maksymalna liczba ofert
+
+        Returns:
+            Lista słowników z ofertami
+        """
+        # bs4 jest importowany przy pierwszym parsowaniu (analiza danych go nie potrzebuje)
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        parse_only = SoupStrainer(class_=self._is_item_class) if self.restrict_to_items else None
+        soup = BeautifulSoup(html, self.parser or default_html_parser(), parse_only=parse_only)
+
+        listings = []
+        for item in soup.find_all(class_=self.item_class, limit=limit):
+            try:
+                listing = self.parse_item(item)
+                listing['source'] = self.name
+                listings.append(listing)
+            except Exception as e:
+                self.logger.warning(f"Błąd podczas przetwarzania oferty: {e}")
+
+        return listings
+
+    @abstractmethod
+    def parse_item(self, item):
+        """Zwraca słownik z danymi pojedynczej oferty"""
+
+    def _is_item_class(self, value):
+        """Sprawdza atrybut class podczas parsowania (wartość może zawierać kilka klas)"""
+        if not value:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return self.item_class in classes
+
+    @staticmethod
+    def _text(item, class_name, default=None):
+        """Zwraca tekst pierwszego elementu o danej klasie (lub wartość domyślną)"""
+        elem = item.find(class_=class_name)
+        if elem is None:
+            if default is None:
+                raise ValueError(f"Brak elementu .{class_name}")
+            return default
+        return elem.get_text(strip=True)
+
+    @staticmethod
+    def _date_posted(item):
+        """
+        Zwraca datę publikacji oferty (RRRR-MM-DD) z elementu <time datetime="...">
+
+        Brak daty na stronie daje None - uzupełnia ją MarketTrends datą pierwszego
+        zauważenia oferty, zamiast datą bieżącego pobrania.
+        """
+        elem = item.find('time')
+        value = elem.get('datetime') if elem is not None else None
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.strip().replace('Z', '+00:00')).strftime("%Y-%m-%d")
+        except ValueError:
+            return None
+
+class PracujPlAdapter(SourceAdapter):
+    """Adapter portalu pracuj.pl (selektory przykładowe - wymagają aktualizacji)"""
+
+    name = 'pracuj.pl'
+    url_template = "https://www.pracuj.pl/praca/{keyword};kw"
+    item_class = 'results__list-container-item'
+    page_param = 'pn'
+
+    def parse_item(self, item):
+        return {
+            'title': self._text(item, 'offer-details__title-link'),
+            'company': self._text(item, 'offer-company__name'),
+            'location': self._text(item, 'offer-labels__item--location'),
+            'salary': self._text(item, 'offer-labels__item--salary', "Nie podano"),
+            # Umiejętności są w szczegółach oferty - wymagałoby to pobierania kolejnych stron
+            'skills': ["Brak danych"],
+            'date_posted': self._date_posted(item)
+        }
+
+class NoFluffJobsAdapter(SourceAdapter):
+    """Adapter portalu nofluffjobs.com (selektory przykładowe - wymagają aktualizacji)"""
+
+    name = 'nofluffjobs.com'
+    url_template = "https://nofluffjobs.com/pl/praca/{keyword}"
+    item_class = 'posting-list-item'
+    page_param = 'page'
+    quote_keyword = staticmethod(quote_plus)
+
+    def parse_item(self, item):
+        tags = item.find(class_='posting-info__tags')
+        skills = [tag.get_text(strip=True) for tag in tags.find_all(class_='btn-main')] if tags else []
+
+        return {
+            'title': self._text(item, 'posting-title__position'),
+            'company': self._text(item, 'posting-title__company'),
+            'location': self._text(item, 'posting-info__location'),
+            'salary': self._text(item, 'salary-range', "Nie podano"),
+            'skills': skills or ["Brak danych"],
+            'date_posted': self._date_posted(item)
+        }
+
+# Rejestr adapterów: nazwa źródła -> adapter
+SOURCE_ADAPTERS = {}
+
+def register_adapter(adapter, registry=None):
+    """
+    Rejestruje adapter portalu
+
+    Args:
+        adapter: Obiekt SourceAdapter
+        registry: Rejestr docelowy (domyślnie globalny SOURCE_ADAPTERS)
+
+    Returns:
+        Zarejestrowany adapter
+    """
+    if not adapter.name:
+        raise ValueError("Adapter musi mieć nazwę źródła")
+    (SOURCE_ADAPTERS if registry is None else registry)[adapter.name] = adapter
+    return adapter
+
+register_adapter(PracujPlAdapter())
+register_adapter(NoFluffJobsAdapter())
@@ -1,9 +1,10 @@
 import pandas as pd
 import numpy as np
-import spacy
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import bisect
+import itertools
+
+from .metrics import stage_timer
 
 class SkillsAnalyzer:
     def __init__(self, skills_database_path=None):
@@ -13,6 +14,9 @@ class SkillsAnalyzer:
         Args:
             skills_database_path: Ścieżka do bazy danych umiejętności
         """
+        # spaCy jest importowany dopiero przy tworzeniu analizatora (import modułu pozostaje lekki)
+        import spacy
+        
         try:
             # Próba załadowania modelu polskiego
             self.nlp = spacy.load('pl_core_news_md')
@@ -26,7 +30,8 @@ class SkillsAnalyzer:
                 self.nlp = spacy.blank('pl')
                 print("Nie znaleziono żadnego modelu spaCy, używam prostego modelu zastępczego.")
         
-        self.vectorizer = TfidfVectorizer(stop_words='english')
+        # Wektoryzator TF-IDF (scikit-learn) - tworzony przy pierwszym wyszukiwaniu podobnych umiejętności
+        self.vectorizer = None
         
         # Załaduj bazę danych umiejętności
         if skills_database_path:
@@ -40,6 +45,9 @@ class SkillsAnalyzer:
                              'AI', 'AI', 'Data Science', 'Management'],
                 'relevance_score': [10, 9, 8, 9, 10, 9, 8, 7]
             })
+        
+        # Skompilowane wzorce umiejętności (baza, dla której je utworzono; lista par nazwa-wzorzec)
+        self._compiled_skills = (None, [])
     
     def extract_skills_from_cv(self, cv_text):
         """
@@ -51,18 +59,54 @@ class SkillsAnalyzer:
         Returns:
             Lista wykrytych umiejętności
         """
+        return self.extract_skills_batch([cv_text])[0]
+    
+    def extract_skills_batch(self, cv_texts, batch_size=32):
+        """
+        Ekstrahuje umiejętności z wielu CV jednocześnie
+        
+        Teksty przechodzą przez potok NLP partiami (nlp.pipe), a wzorzec każdej umiejętności
+        jest wyszukiwany raz w połączonych tekstach zamiast osobno w każdym CV.
+        
+        Args:
+            cv_texts: Lista tekstów CV
+            batch_size: Rozmiar partii potoku NLP
+            
+        Returns:
+            Lista list wykrytych umiejętności (w kolejności cv_texts)
+        """
         # Przetwarzanie tekstu
-        doc = self.nlp(cv_text)
+        with stage_timer('nlp'):
+            docs = list(self.nlp.pipe(cv_texts, batch_size=batch_size))
         
         # Wykrywanie słów kluczowych z bazy umiejętności
-        skills_found = []
-        for skill in self.skills_db['skill_name']:
-            # Prosta detekcja - można rozszerzyć o bardziej zaawansowane techniki
-            if re.search(r'\b' + re.escape(skill.lower()) + r'\b', cv_text.lower()):
-                skills_found.append(skill)
+        skills_found = [[] for _ in cv_texts]
+        with stage_timer('skill_matching'):
+            # Separator \0 nie jest znakiem słowa, więc granice \b są takie same jak w osobnych tekstach
+            lowered = [cv_text.lower() for cv_text in cv_texts]
+            joined = '\0'.join(lowered)
+            starts = list(itertools.accumulate(len(text) + 1 for text in lowered[:-1]))
+            for skill, pattern in self._skill_patterns():
+                matched = set()
+                for match in pattern.finditer(joined):
+                    matched.add(bisect.bisect_right(starts, match.start()))
+                for index in sorted(matched):
+                    skills_found[index].append(skill)
         
         return skills_found
     
+    def _skill_patterns(self):
+        """Skompilowane wzorce umiejętności z bazy (tworzone raz, kolejność jak w bazie)"""
+        source, patterns = self._compiled_skills
+        if source is not self.skills_db:
+            # Prosta detekcja - można rozszerzyć o bardziej zaawansowane techniki
+            patterns = [
+                (skill, re.compile(r'\b' + re.escape(skill.lower()) + r'\b'))
+                for skill in self.skills_db['skill_name']
+            ]
+            self._compiled_skills = (self.skills_db, patterns)
+        return patterns
+    
     def analyze_skill_level(self, cv_text, skill):
         """
         Analizuje poziom zaawansowania dla danej umiejętności
@@ -149,6 +193,12 @@ class SkillsAnalyzer:
         if not user_skills:
             return []
             
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+        
+        if self.vectorizer is None:
+            self.vectorizer = TfidfVectorizer(stop_words='english')
+        
         # Wektoryzuj wszystkie umiejętności
         all_skills = [skill] + list(user_skills)
         tfidf_matrix = self.vectorizer.fit_transform(all_skills)
@@ -0,0 +1,258 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+# Okres odniesienia (numer miesiąca) - indeksy okresów są liczone od stycznia 2000
+_PERIOD_ORIGIN = 2000 * 12
+
+def period_index(dates):
+    """
+    Zamienia daty na numery miesięcy (0 = styczeń 2000)
+
+    Args:
+        dates: Series lub tablica dat
+
+    Returns:
+        Tablica numerów okresów (int64)
+    """
+    dates = pd.DatetimeIndex(pd.to_datetime(dates))
+    return (dates.year * 12 + dates.month - 1 - _PERIOD_ORIGIN).to_numpy(dtype=np.int64)
+
+class QuantileSketch:
+    """
+    Szkic kwantyli o względnej dokładności (koszyki logarytmiczne, jak DDSketch)
+
+    Pamięć zależy od rozpiętości wartości, a nie od ich liczby. Wartości można
+    dodawać i usuwać (np. przy korekcie wcześniej dopisanego okresu).
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        """
+        Inicjalizacja szkicu
+
+        Args:
+            relative_accuracy: Względny błąd zwracanych kwantyli
+        """
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def add(self, value, weight=1):
+        """Dodaje wartość (ujemna waga usuwa wcześniej dodaną wartość)"""
+        if value <= 0:
+            self.zero_count += weight
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + weight
+            if self.bins[key] <= 0:
+                del self.bins[key]
+        self.count += weight
+
+    def quantile(self, q):
+        """
+        Zwraca przybliżony kwantyl
+
+        Args:
+            q: Rząd kwantyla (0-1)
+
+        Returns:
+            Wartość kwantyla lub NaN dla pustego szkicu
+        """
+        if self.count <= 0:
+            return float('nan')
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if rank < seen:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+class SkillTrendStats:
+    """
+    Przyrostowe statystyki trendów umiejętności
+
+    Dla każdej umiejętności utrzymywane są liczniki i sumy (popyt, oferty, wynagrodzenia),
+    EWMA popytu, statystyki dostateczne regresji liniowej popytu względem numeru
+    okresu (Σx, Σy, Σxy, Σx²) oraz szkic kwantyli wynagrodzeń. Nowe okresy aktualizują
+    statystyki w czasie proporcjonalnym do liczby nowych wierszy, a zapytania
+    (trend, wzrost, wynagrodzenia) działają w O(liczba umiejętności).
+    """
+
+    FIELDS = ('count', 'sum_x', 'sum_y', 'sum_xy', 'sum_xx', 'first_x', 'first_y', 'last_x', 'last_y',
+              'ewma', 'openings_sum', 'salary_count', 'salary_sum')
+
+    def __init__(self, ewma_alpha=0.3, sketch_accuracy=0.01):
+        """
+        Inicjalizacja statystyk
+
+        Args:
+            ewma_alpha: Waga najnowszego okresu w EWMA popytu
+            sketch_accuracy: Względna dokładność szkicu kwantyli wynagrodzeń
+        """
+        self.ewma_alpha = ewma_alpha
+        self.sketch_accuracy = sketch_accuracy
+        self.skills = {}
+        self.names = []
+        self.sketches = []
+        self.stats = {field: np.zeros(0) for field in self.FIELDS}
+
+    def update(self, cells, previous=None):
+        """
+        Aktualizuje statystyki o nowe komórki (umiejętność, okres)
+
+        Args:
+            cells: DataFrame z kolumnami skill, date oraz demand / avg_salary / num_openings
+                (jeden wiersz na parę umiejętność-data)
+            previous: DataFrame z poprzednimi wartościami tych samych komórek (NaN - brak),
+                odejmowanymi przed dodaniem nowych
+
+        Returns:
+            Lista umiejętności, dla których EWMA wymaga przeliczenia (okresy spoza kolejności)
+        """
+        if cells.empty:
+            return []
+
+        cells = cells.sort_values('date', kind='stable')
+        index = self._indices(cells['skill'])
+        x = period_index(cells['date']).astype(float)
+
+        def column(frame, name):
+            if frame is None or name not in frame:
+                return np.full(len(cells), np.nan)
+            return frame.loc[cells.index, name].to_numpy(dtype=float)
+
+        demand, old_demand = column(cells, 'demand'), column(previous, 'demand')
+        salary, old_salary = column(cells, 'avg_salary'), column(previous, 'avg_salary')
+        openings, old_openings = column(cells, 'num_openings'), column(previous, 'num_openings')
+
+        # Sumy: odejmij poprzednią wartość komórki, dodaj nową
+        new_demand, had_demand = ~np.isnan(demand), ~np.isnan(old_demand)
+        delta_y = np.where(new_demand, demand, 0.0) - np.where(had_demand & new_demand, old_demand, 0.0)
+        added = (new_demand & ~had_demand).astype(float)
+        np.add.at(self.stats['count'], index, added)
+        np.add.at(self.stats['sum_x'], index, added * x)
+        np.add.at(self.stats['sum_xx'], index, added * x * x)
+        np.add.at(self.stats['sum_y'], index, delta_y)
+        np.add.at(self.stats['sum_xy'], index, delta_y * x)
+
+        delta_openings = np.where(~np.isnan(openings), openings - np.nan_to_num(old_openings), 0.0)
+        np.add.at(self.stats['openings_sum'], index, delta_openings)
+
+        new_salary, had_salary = ~np.isnan(salary), ~np.isnan(old_salary)
+        np.add.at(self.stats['salary_count'], index, (new_salary & ~had_salary).astype(float))
+        np.add.at(self.stats['salary_sum'], index,
+                  np.where(new_salary, salary, 0.0) - np.where(had_salary & new_salary, old_salary, 0.0))
+        for i, value, old_value in zip(index[new_salary], salary[new_salary], old_salary[new_salary]):
+            if not np.isnan(old_value):
+                self.sketches[i].add(old_value, -1)
+            self.sketches[i].add(value)
+
+        # Pierwszy/ostatni okres i EWMA (w kolejności dat)
+        stale = set()
+        for i, period, value in zip(index[new_demand], x[new_demand], demand[new_demand]):
+            stats = self.stats
+            if np.isnan(stats['first_x'][i]) or period <= stats['first_x'][i]:
+                stats['first_x'][i], stats['first_y'][i] = period, value
+            if np.isnan(stats['last_x'][i]) or period > stats['last_x'][i]:
+                stats['ewma'][i] = value if np.isnan(stats['last_x'][i]) else \
+                    self.ewma_alpha * value + (1 - self.ewma_alpha) * stats['ewma'][i]
+                stats['last_x'][i], stats['last_y'][i] = period, value
+            elif period == stats['last_x'][i]:
+                stats['last_y'][i] = value
+                stale.add(self.names[i])
+            else:
+                stale.add(self.names[i])
+
+        return sorted(stale)
+
+    def reset_ewma(self, skill, values):
+        """
+        Przelicza EWMA umiejętności z pełnego szeregu (po korekcie starszych okresów)
+
+        Args:
+            skill: Nazwa umiejętności
+            values: Wartości popytu w kolejności dat
+        """
+        ewma = np.nan
+        for value in values:
+            ewma = value if np.isnan(ewma) else self.ewma_alpha * value + (1 - self.ewma_alpha) * ewma
+        self.stats['ewma'][self.skills[skill]] = ewma
+
+    def linear_trends(self, skills):
+        """
+        Zwraca współczynniki trendu liniowego popytu z sum dostatecznych
+
+        Args:
+            skills: Lista nazw umiejętności (obecnych w statystykach)
+
+        Returns:
+            Słownik: umiejętność -> (wyraz wolny, nachylenie, numer ostatniego okresu)
+        """
+        index = np.array([self.skills[skill] for skill in skills], dtype=np.int64)
+        s = {field: values[index] for field, values in self.stats.items()}
+
+        denominator = s['count'] * s['sum_xx'] - s['sum_x'] ** 2
+        slope = np.divide(s['count'] * s['sum_xy'] - s['sum_x'] * s['sum_y'], denominator,
+                          out=np.zeros_like(denominator), where=denominator != 0)
+        intercept = np.divide(s['sum_y'] - slope * s['sum_x'], s['count'],
+                              out=np.zeros_like(denominator), where=s['count'] > 0)
+        return dict(zip(skills, zip(intercept, slope, s['last_x'])))
+
+    def count(self, skill):
+        """Zwraca liczbę okresów z popytem dla umiejętności (0, gdy nieznana)"""
+        i = self.skills.get(skill)
+        return 0 if i is None else int(self.stats['count'][i])
+
+    def summary(self, quantiles=(0.5,)):
+        """
+        Zwraca statystyki wszystkich umiejętności
+
+        Args:
+            quantiles: Rzędy kwantyli wynagrodzeń do wyznaczenia ze szkiców
+
+        Returns:
+            DataFrame z kolumnami skill, periods, demand_sum, current_demand, ewma_demand,
+            growth_rate, trend_slope, openings_sum, avg_salary i salary_q<rząd>
+        """
+        s = self.stats
+        denominator = s['count'] * s['sum_xx'] - s['sum_x'] ** 2
+        slope = np.divide(s['count'] * s['sum_xy'] - s['sum_x'] * s['sum_y'], denominator,
+                          out=np.zeros_like(denominator), where=denominator != 0)
+        growth = np.divide(s['last_y'] - s['first_y'], s['first_y'], out=np.full_like(s['first_y'], np.nan),
+                           where=(s['first_y'] > 0) & (s['count'] > 1)) * 100
+
+        summary = pd.DataFrame({
+            'skill': self.names,
+            'periods': s['count'].astype(int),
+            'demand_sum': s['sum_y'],
+            'current_demand': s['last_y'],
+            'ewma_demand': s['ewma'],
+            'growth_rate': growth,
+            'trend_slope': slope,
+            'openings_sum': s['openings_sum'],
+            'avg_salary': np.divide(s['salary_sum'], s['salary_count'], out=np.full_like(s['salary_sum'], np.nan),
+                                    where=s['salary_count'] > 0)
+        })
+        for q in quantiles:
+            summary[f"salary_q{int(round(q * 100))}"] = [sketch.quantile(q) for sketch in self.sketches]
+        return summary
+
+    def _indices(self, skills):
+        """Zwraca indeksy umiejętności, rejestrując nowe (powiększa tablice statystyk)"""
+        new = [skill for skill in pd.unique(skills) if skill not in self.skills]
+        if new:
+            for skill in new:
+                self.skills[skill] = len(self.names)
+                self.names.append(skill)
+                self.sketches.append(QuantileSketch(self.sketch_accuracy))
+            for field, values in self.stats.items():
+                fill = np.nan if field in ('first_x', 'first_y', 'last_x', 'last_y', 'ewma') else 0.0
+                self.stats[field] = np.concatenate([values, np.full(len(new), fill)])
+        return skills.map(self.skills).to_numpy(dtype=np.int64)